@@ -1,6 +1,7 @@
 ﻿# game.py
 from __future__ import annotations
-import random, json
+import random, json, math, time
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Optional, List, Dict
@@ -11,13 +12,15 @@ from ops.achievements_ops import (
     list_achievements as ach_list,
     claim_achievement as ach_claim,
     mark_achievements_seen as ach_mark_seen,
+    metric_value as ach_metric_value,
+    stage_targets as ach_stage_targets,
 )
 from core.dice_models import DiceInstance, get_templates, get_sets, DiceTemplate, SetBonusTier
 # Delegated modules for separation of concerns
 from ops.progression import (
     level_multiplier as prog_level_multiplier,
-    apply_stars as prog_apply_stars,
-    apply_stars_and_level as prog_apply_stars_and_level,
+    effective_template as prog_effective_template,
+    precompute_effective_templates as prog_precompute_effective_templates,
     level_costs as prog_level_costs,
 )
 from ops.buildings_ops import get_building_cards
@@ -43,18 +46,47 @@ from ops.inventory_ops import (
 )
 from ops.casino_ops import (
     bet as casino_bet,
+    bet_many as casino_bet_many,
     spin_slots as casino_spin_slots,
 )
 from ops.persistence import (
     game_to_dict as persist_to_dict,
     game_from_dict as persist_from_dict,
+    write_game_json as persist_write_game_json,
+    read_save as persist_read_save,
+    read_json_header as persist_read_json_header,
+    read_json_streaming as persist_read_json_streaming,
+    dice_from_record,
 )
+from ops.save_codec import write_binary_atomic as persist_write_binary
+from ops.journal import SaveJournal, journal_path_for, replay as journal_replay
+from ops.save_store import SaveStore, JsonSaveStore, DEFAULT_PROFILE
 from ops.shop_ops import list_items as shop_list_items, purchase as shop_purchase, item_details as shop_item_details
-
-SAVE_VERSION = 11
+from ops.stats_engine import StatsEngine
+from ops.upgrade_registry import UpgradeRegistry
+from ops.thresholds import ThresholdWatcher, Watched
+from ops.offline import (
+    apply_offline_progress as offline_apply,
+    passive_rates as offline_rates,
+    OFFLINE_CAP_SECONDS,
+    OFFLINE_EFFICIENCY,
+)
+from ops.simulator import simulate as sim_simulate
+from ops.slots_engine import spin_slots_many as slots_spin_many
+from ops.roulette_ops import Bet as RouletteBet, spin as roulette_spin, spin_many as roulette_spin_many
+from ops.migrations import SAVE_VERSION
+from ops.snapshots import read_snapshot
+
+SLOTS_UNLOCK_GOLD = 2000
+ROULETTE_UNLOCK_GOLD = 10000
+# Longest gap between UI ticks credited at the online rate; anything beyond
+# (system suspend, a stalled event loop) is paid as offline progress
+MAX_LIVE_TICK_SECONDS = 5.0
 DATA_DIR = Path(__file__).parent / "data"
 LEGACY_SAVE = Path(__file__).with_name("savedata.json")
 SAVE_PATH = DATA_DIR / "savedata.json"
+SNAPSHOT_DIR = DATA_DIR / "snapshots"
+BINARY_SAVE_SUFFIXES = (".bin", ".sav")
 
 @dataclass
 class Upgrade:
@@ -115,7 +147,70 @@ class Upgrade:
     def cost(self) -> int:
         return int(self.definition.base_cost * (self.definition.cost_multiplier ** self.level))
 
+    def level_cap(self) -> int:
+        """Highest level reachable by buying (max_level, or the level that disables it)."""
+        cap = self.max_level
+        if self.disabled_when_reached_level is not None:
+            cap = min(cap, self.disabled_when_reached_level)
+        return cap
+
+    def cost_for(self, n: int) -> int:
+        """Total cost of the next n levels: exactly what n calls to cost() (one per level) charge."""
+        if n <= 0:
+            return 0
+        base, m = self.definition.base_cost, self.definition.cost_multiplier
+        return sum(int(base * (m ** lv)) for lv in range(self.level, self.level + n))
+
+    def max_affordable(self, gold: float, limit: Optional[int] = None) -> int:
+        """Largest n <= limit with cost_for(n) <= gold, capped by level_cap()."""
+        room = self.level_cap() - self.level
+        if limit is not None:
+            room = min(room, limit)
+        if room <= 0 or gold < self.cost():
+            return 0
+        m = self.definition.cost_multiplier
+        first = self.definition.base_cost * (m ** self.level)
+        if first <= 0:
+            return room
+        if m == 1.0:
+            n = int(gold // first)
+        else:
+            n = int(math.log1p(gold * (m - 1.0) / first) / math.log(m))
+        n = max(1, min(n, room))
+        # the geometric-series estimate ignores per-level int(); walk to the exact boundary
+        while n > 1 and self.cost_for(n) > gold:
+            n -= 1
+        while n < room and self.cost_for(n + 1) <= gold:
+            n += 1
+        return n
+
+# Watcher metrics fed on each assignment to a Watched attribute; several
+# achievement types are aliases of a bounty metric (ops/achievements_ops.metric_value)
+_WATCHED_FEEDS: Dict[str, tuple[str, ...]] = {
+    "gold": ("gold",),
+    "lifetime_gold": ("lifetime_gold",),
+    "shards": ("shards", "shards_total"),
+    "scrap": ("scrap", "scrap_total"),
+    "scrap_idle": ("scrap_idle_rate",),
+    "counter_dice_plays": ("counter_dice_plays", "dice_plays"),
+    "counter_slots_spins": ("counter_slots_spins", "slots_spins"),
+    "counter_slots_wins": ("counter_slots_wins", "slots_wins"),
+    "counter_roulette_spins": ("counter_roulette_spins", "roulette_spins"),
+    "counter_roulette_wins": ("counter_roulette_wins", "roulette_wins"),
+}
+# Metrics no single attribute holds, fed where their inputs change
+_STATS_METRICS = ("buildings_owned_total", "idle_gold_ps")
+_INVENTORY_METRICS = ("inventory_size", "have_legendary")
+_CRATE_METRICS = ("crates_basic", "crates_advanced", "crates_total")
+_ACHIEVEMENT_TYPES = frozenset(a.type for a in ACHIEVEMENTS)
+
 class Game:
+    # currencies and counters report every change to the threshold watcher
+    gold = Watched(); lifetime_gold = Watched(); shards = Watched()
+    scrap = Watched(); scrap_idle = Watched()
+    counter_dice_plays = Watched(); counter_slots_spins = Watched(); counter_slots_wins = Watched()
+    counter_roulette_spins = Watched(); counter_roulette_wins = Watched()
+
     def __init__(self):
         # currencies
         self.gold: float = 0.0
@@ -160,6 +255,7 @@ class Game:
 
         # upgrades
         self.upgrades: list[Upgrade] = [Upgrade(defn) for defn in UPGRADES]
+        self.registry = UpgradeRegistry(self.upgrades)
 
         # collection & loadout
         self.inventory: List[DiceInstance] = []
@@ -170,6 +266,16 @@ class Game:
         self._templates = get_templates()
         self._sets = get_sets()
 
+        # derived stats (see ops/stats_engine.py) and batch() state
+        self._stats = StatsEngine(self)
+        self._batch_depth: int = 0
+        self._watching: bool = False  # set once the threshold watcher is armed
+        # bumped by every mutation that should reach disk (see ops/save_service.py);
+        # state_gen skips currency-only changes, which can take the store's fast path
+        self.dirty_gen: int = 0
+        self.state_gen: int = 0
+        # optional append-only journal (see enable_journal)
+        self.journal: Optional[SaveJournal] = None
         self._recompute_stats()
 
         # --- scrap crate tracking / achievements ---
@@ -186,32 +292,48 @@ class Game:
         self.counter_roulette_wins: int = 0
         # shard bounties (v2 manager)
         self.bounties = BountyManager()
-        # legacy fields kept for backward-compatibility in load() only
-        self.bounties_daily_claimed: Dict[str, bool] = {}
-        self.bounties_weekly_claimed: Dict[str, bool] = {}
-        self.bounties_daily_reset_at: int = 0
-        self.bounties_weekly_reset_at: int = 0
         self.bounties_claimed: Dict[str, bool] = {}
+
+        # offline catch-up (credited on load from the saved wall-clock timestamp)
+        self.saved_at: float = 0.0
+        self.offline_cap_seconds: float = OFFLINE_CAP_SECONDS
+        self.offline_efficiency: float = OFFLINE_EFFICIENCY
+        self.last_offline: Dict[str, float] = {}
+        # sub-unit passive gold carried between advance() calls
+        self._gold_frac: float = 0.0
+        self.playtime: float = 0.0  # seconds advanced while playing
+
+        # threshold watchers for unlocks / achievements / bounties
+        self._arm_thresholds()
 
     # ---------- collection ----------
     def _grant_starter_if_empty(self):
         inv_grant_starter_if_empty(self)
 
     def add_dice(self, template_key: str) -> DiceInstance:
-        return inv_add_dice(self, template_key)
+        self.mark_dirty()
+        inst = inv_add_dice(self, template_key)
+        if self.journal is not None:
+            self.journal.note_dice(inst)
+        self._feed_metrics(*_INVENTORY_METRICS)
+        return inst
 
     def find_dice(self, uid: int) -> Optional[DiceInstance]:
         return inv_find_dice(self, uid)
 
     def equip_first_empty(self, uid: int) -> bool:
+        self.mark_dirty()
         return inv_equip_first_empty(self, uid)
 
     def compact_loadout(self):
+        self.mark_dirty()
         inv_compact_loadout(self)
 
     # Public hook for UI to call after any loadout edits
     def on_loadout_changed(self):
-        self._recompute_stats()
+        self.mark_dirty()
+        self._stats.mark_loadout()
+        self._refresh_stats()
 
     # ---------- team & set bonuses ----------
     def get_loadout_templates(self) -> List[DiceTemplate]:
@@ -222,17 +344,22 @@ class Game:
             if not inst: continue
             t = self._templates.get(inst.template_key)
             if t:
-                out.append(prog_apply_stars_and_level(t, inst.stars, inst.level))
+                out.append(prog_effective_template(t, inst.stars, inst.level))
         return out
 
     def _level_multiplier(self, level: int) -> float:
         return prog_level_multiplier(level)
 
     def _template_with_stars(self, t: DiceTemplate, stars: int) -> DiceTemplate:
-        return prog_apply_stars(t, stars)
+        # level 1 carries no level scaling, so this shares the effective-template cache
+        return prog_effective_template(t, stars, 1)
 
     def _template_with_stars_and_level(self, t: DiceTemplate, stars: int, level: int) -> DiceTemplate:
-        return prog_apply_stars_and_level(t, stars, level)
+        return prog_effective_template(t, stars, level)
+
+    def precompute_effective_templates(self) -> int:
+        """Optional warm-up: build the full template x stars x level table up front."""
+        return prog_precompute_effective_templates(self._templates.values())
 
     # ---------- leveling costs and actions ----------
     def level_costs(self, inst: DiceInstance) -> tuple[int, int]:
@@ -256,18 +383,24 @@ class Game:
             self.scrap -= c
             inst.level += 1
             gained += 1
+            self.mark_dirty()
             # Milestone reward: every 10 levels grant shard burst (rarity-scaled)
             if inst.level % 10 == 0:
                 t = self._templates.get(inst.template_key)
                 rarity_bonus = {"Common": 1.0, "Uncommon": 1.5, "Rare": 2.5, "Legendary": 4.0}.get(t.rarity if t else "Common", 1.0)
                 burst = 10.0 * inst.level/10 * rarity_bonus  # 10,20,30... times rarity factor
                 self.shards += burst
-        if gained:
+        if gained and self.journal is not None:
+            self.journal.note_dice(inst)
+        # Only equipped dice feed derived stats
+        if gained and inst.uid in self.loadout:
             self.on_loadout_changed()
         return gained
 
     # --- simple conversions: scrap -> shards (crafting) ---
     def convert_scrap_to_shards(self, scrap_amount: int) -> float:
+        self._stats.refresh()
+        self.mark_dirty()
         return scrap_convert_scrap_to_shards(self, scrap_amount)
 
     def compute_set_counts(self) -> Dict[str, int]:
@@ -285,132 +418,94 @@ class Game:
 
     # ---------- casino gameplay ----------
     def _apply_income(self, gold: int):
+        self._stats.refresh()
         gold2 = int(round(gold * self.global_income_mult))
-        self.gold += gold2
-        self.lifetime_gold += gold2
-        self._check_unlocks()
+        self._credit_gold(gold2)
         return gold2
 
+    def _credit_gold(self, gold: int) -> None:
+        self.mark_currencies_dirty()
+        self.gold += gold
+        self.lifetime_gold += gold
+
     def bet(self) -> tuple[list[int], int]:
+        self._stats.refresh()
+        self.mark_dirty()
         return casino_bet(self)
+
+    def bet_many(self, n: int, faces: bool = False) -> Dict[str, Any]:
+        """n dice bets at once (vectorized with NumPy when available); see ops/casino_ops.bet_many."""
+        self._stats.refresh()
+        self.mark_dirty()
+        return casino_bet_many(self, n, faces)
 
     def spin_slots(self) -> tuple[list[str], int, int]:
+        self._stats.refresh()
+        self.mark_dirty()
         return casino_spin_slots(self)
 
+    def spin_slots_many(self, n: int, animate: int = 0) -> Dict[str, Any]:
+        """n slot spins from one class-count draw; faces only for `animate` spins (ops/slots_engine)."""
+        self._stats.refresh()
+        self.mark_dirty()
+        return slots_spin_many(self, n, animate)
+
+    def spin_roulette(self, bet: RouletteBet | List[RouletteBet]) -> Dict[str, Any]:
+        """One roulette spin (ops/roulette_ops.spin); ValueError carries the reason a bet is refused."""
+        self._stats.refresh()
+        return roulette_spin(self, bet)
+
+    def spin_roulette_many(self, bets: List[RouletteBet], n: int) -> Dict[str, Any]:
+        """Up to n spins of the same bets, settled once (ops/roulette_ops.spin_many)."""
+        self._stats.refresh()
+        return roulette_spin_many(self, bets, n)
+
+    # ---------- batching ----------
+    @contextmanager
+    def batch(self):
+        """Defer stats refresh until the outermost batch exits.
+
+        Upgrade gates stay current inside the batch, and derived stats are
+        refreshed on demand before they are consumed (income, bets, passive
+        ticks), so batched results match unbatched play.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._stats.refresh()
+                self._feed_metrics(*_STATS_METRICS)
+
+    def _refresh_stats(self):
+        if self._batch_depth:
+            self._stats.refresh_gates()
+        else:
+            self._stats.refresh()
+            self._feed_metrics(*_STATS_METRICS)
+
     # ---------- upgrades ----------
 
-    def _get_by_key(self, key: str) -> Optional[Upgrade]:
-        return next((u for u in self.upgrades if u.key == key), None)
-
-    def _apply_reveal_and_disable(self):
-        for u in self.upgrades:
-            # Reveal chain
-            locked = False
-            if u.reveal_after_key is not None:
-                req = self._get_by_key(u.reveal_after_key)
-                if not (req and req.level >= u.reveal_after_level):
-                    locked = True
-
-            # NEW: milestone gating (e.g., appears after owning N of a building)
-            if u.milestone_key and u.milestone_level:
-                base = self._get_by_key(u.milestone_key)
-                if not (base and base.level >= u.milestone_level):
-                    locked = True
-
-            u.locked = locked
-            u.disabled = (u.disabled_when_reached_level is not None and u.level >= u.disabled_when_reached_level)
+    def get_upgrade(self, key: str) -> Optional[Upgrade]:
+        return self.registry.get(key)
 
-    def _recompute_stats(self):
-        self._apply_reveal_and_disable()
-
-        # dice
-        self.dice_count = self.base_dice + sum(u.level * u.dice_gain for u in self.upgrades)
-        self.die_sides = 6 + sum(u.level * u.die_sides_increase for u in self.upgrades)
-        self.animation_speed = 1.0
-        for u in self.upgrades:
-            if u.level > 0 and u.animation_speed_mult != 1.0:
-                self.animation_speed *= (u.animation_speed_mult ** u.level)
-
-        # slots
-        self.slots_passive_income = sum(u.level * u.slots_passive for u in self.upgrades)
+    def _get_by_key(self, key: str) -> Optional[Upgrade]:
+        return self.registry.get(key)
 
-        # roulette
-        self.roulette_max_bet = self.roulette_base_max_bet + sum(u.level * u.roulette_maxbet_increase for u in self.upgrades)
-        self.roulette_payout_bonus_total = sum(u.level * u.roulette_payout_bonus for u in self.upgrades)
-        self.roulette_passive_income = sum(u.level * u.roulette_passive for u in self.upgrades)
+    def use_upgrade_columns(self, enabled: bool = True) -> bool:
+        """Aggregate upgrade effects via the optional NumPy column store (large catalogs)."""
+        ok = self._stats.use_columns(enabled)
+        self._stats.refresh()
+        return ok
 
-        # buildings
-        # New: building milestone upgrades increase per-unit output of base buildings
-        per_unit_bonus: dict[str, float] = {}
-        for u in self.upgrades:
-            m_key = getattr(u.definition, "milestone_key", None)
-            if m_key:
-                per_unit_bonus[m_key] = per_unit_bonus.get(m_key, 0.0) + (u.level * u.building_gold_ps)
-        total_building_income = 0.0
-        for u in self.upgrades:
-            if u.category != "buildings":
-                continue
-            if getattr(u.definition, "milestone_key", None):
-                continue
-            if u.building_gold_ps <= 0:
-                continue
-            unit = u.building_gold_ps + per_unit_bonus.get(u.key, 0.0)
-            total_building_income += u.level * unit
-        self.buildings_passive_income = total_building_income
-
-        # global & shards (from upgrades)
-        self.global_income_mult = 1.0
-        self.shards_passive_income = 0.0
-        self.scrap_idle = 0.0
-        self.salvage_yield_mult_total = 1.0
-        self.salvage_cost_discount_total = 0.0
-        for u in self.upgrades:
-            if u.level > 0 and u.global_gold_mult != 1.0:
-                self.global_income_mult *= (u.global_gold_mult ** u.level)
-            if u.level > 0 and u.shards_passive > 0.0:
-                self.shards_passive_income += u.level * u.shards_passive
-            if u.level > 0 and u.scrap_passive > 0.0:
-                self.scrap_idle += u.level * u.scrap_passive
-            if u.level > 0 and u.salvage_yield_mult > 0.0:
-                self.salvage_yield_mult_total *= (1.0 + u.salvage_yield_mult) ** u.level
-            if u.level > 0 and u.salvage_cost_discount > 0.0:
-                self.salvage_cost_discount_total += u.level * u.salvage_cost_discount
-        # Cap discount to avoid free salvage
-        if self.salvage_cost_discount_total > 0.95:
-            self.salvage_cost_discount_total = 0.95
-
-        # --- NEW: apply economy effects from equipped dice ---
-        self.team_gold_mult_from_dice = 1.0
-        self.dice_idle_income = 0.0
-        self.slots_yield_mult = 1.0
-        self.team_roulette_bonus_from_dice = 0.0
-        self.shards_rate_mult = 1.0
-
-        for t in self.get_loadout_templates():
-            self.team_gold_mult_from_dice *= (1.0 + (t.gold_mult_pct or 0.0) / 100.0)
-            self.dice_idle_income += (t.idle_gold_ps or 0.0)
-            self.slots_yield_mult *= (1.0 + (t.slots_mult_pct or 0.0) / 100.0)
-            self.team_roulette_bonus_from_dice += (t.roulette_mult_pct or 0.0) / 100.0
-            self.shards_rate_mult *= (1.0 + (t.shard_rate_mult_pct or 0.0) / 100.0)
-
-        self.global_income_mult *= self.team_gold_mult_from_dice
-        self.roulette_payout_bonus_total += self.team_roulette_bonus_from_dice
-        # Apply permanent shop upgrades
-        try:
-            lvl_gold = int(self.shop_levels.get('perm_gold_booster', 0))
-            if lvl_gold > 0:
-                self.global_income_mult *= (1.0 + 0.05 * lvl_gold)
-            lvl_shard = int(self.shop_levels.get('perm_shard_rate', 0))
-            if lvl_shard > 0:
-                self.shards_rate_mult *= (1.0 + 0.10 * lvl_shard)
-            lvl_salv = int(self.shop_levels.get('perm_salvage_yield', 0))
-            if lvl_salv > 0:
-                self.salvage_yield_mult_total *= (1.0 + 0.10 * lvl_salv)
-        except Exception:
-            pass
+    def _recompute_stats(self):
+        """Full recompute; use after edits that bypass the mark_* hooks (load, reset, direct level edits)."""
+        self._stats.mark_all()
+        self._refresh_stats()
 
     def visible_upgrades(self, category: str):
-        return [u for u in self.upgrades if u.category == category and not u.locked]
+        return [u for u in self.registry.in_category(category) if not u.locked]
 
     def can_buy(self, u: Upgrade) -> bool:
         return (not u.locked and not u.disabled and u.level < u.max_level and self.gold >= u.cost())
@@ -419,39 +514,197 @@ class Game:
         if not self.can_buy(u): return False
         self.gold -= u.cost()
         u.level += 1
-        self._recompute_stats()
+        self.mark_dirty()
+        self._stats.mark_upgrade(u)
+        self._refresh_stats()
         return True
 
+    def buy_n(self, u: Upgrade, n: int) -> int:
+        """Buy up to n levels of u in one step; returns the number of levels bought."""
+        if u.locked or u.disabled:
+            return 0
+        n = u.max_affordable(self.gold, n)
+        if n <= 0:
+            return 0
+        self.gold -= u.cost_for(n)
+        u.level += n
+        self.mark_dirty()
+        self._stats.mark_upgrade(u)
+        self._refresh_stats()
+        return n
+
+    def buy_max(self, u: Upgrade) -> int:
+        return self.buy_n(u, u.level_cap() - u.level)
+
     # ---------- unlocks / ticks ----------
     def check_unlocks(self) -> None:
         self._check_unlocks()
 
     def _check_unlocks(self):
-        if not self.slots_unlocked and self.lifetime_gold >= 2000:
-            self.slots_unlocked = True
-        if not self.roulette_unlocked and self.lifetime_gold >= 10000:
-            self.roulette_unlocked = True
+        self._on_crossings(self.thresholds.update("lifetime_gold", self.lifetime_gold))
+
+    # ---------- threshold watchers ----------
+    def _arm_thresholds(self) -> None:
+        """(Re)build the watcher from unlocks, achievement stages and active bounties.
+
+        After this, Watched attributes and the _feed_metrics() calls keep it
+        current; only arming reads every watched metric.
+        """
+        self._watching = False
+        w = self.thresholds = ThresholdWatcher()
+        self._achievements_done: set[str] = set()
+        self._bounties_done: set[str] = set()
+        self._armed_bounties: tuple[str, ...] = ()
+        w.add("lifetime_gold", SLOTS_UNLOCK_GOLD, ("unlock", "slots"))
+        w.add("lifetime_gold", ROULETTE_UNLOCK_GOLD, ("unlock", "roulette"))
+        for a in ACHIEVEMENTS:
+            for key, target in ach_stage_targets(a):
+                w.add(a.type, target, ("achievement", key))
+        self._watching = True
+        self._sync_bounties()
+        self._feed_metrics(*w.metrics())
+
+    def _arm_bounties(self, keys: tuple[str, ...]) -> None:
+        self.thresholds.remove(lambda ev: ev[0] == "bounty")
+        self._bounties_done.clear()
+        metrics = set()
+        for key in keys:
+            t = self.bounties.template(key)
+            if t:
+                self.thresholds.add(t.metric, t.target, ("bounty", key))
+                metrics.add(t.metric)
+        self._armed_bounties = keys
+        self._feed_metrics(*metrics)
+
+    def _sync_bounties(self) -> None:
+        """Roll any due daily/weekly reset and re-arm if the active bounties changed."""
+        self.bounties._ensure_roll()
+        keys = tuple(self.bounties.daily_keys) + tuple(self.bounties.weekly_keys)
+        if keys != self._armed_bounties:
+            self._arm_bounties(keys)
+
+    def _metric_value(self, metric: str) -> float:
+        if metric in _ACHIEVEMENT_TYPES:
+            return ach_metric_value(self, metric)
+        return self.bounties._progress(self, metric)
+
+    def _feed(self, name: str, value) -> None:
+        """Watched hook: one heap-head comparison per metric the attribute feeds."""
+        for metric in _WATCHED_FEEDS[name]:
+            crossings = self.thresholds.update(metric, value)
+            if crossings:
+                self._on_crossings(crossings)
+
+    def _feed_metrics(self, *metrics: str) -> None:
+        """Feed derived metrics; values are only computed for metrics being watched."""
+        if not self._watching:
+            return
+        w = self.thresholds
+        for metric in metrics:
+            if metric in w:
+                self._on_crossings(w.update(metric, self._metric_value(metric)))
+
+    def _on_crossings(self, crossings) -> None:
+        for reached, (kind, key) in crossings:
+            if kind == "unlock":
+                # unlocks are permanent
+                if reached and not getattr(self, f"{key}_unlocked"):
+                    setattr(self, f"{key}_unlocked", True)
+                    self.mark_dirty()
+                    self._feed_metrics(f"unlock_{key}")
+            elif kind == "achievement":
+                if reached: self._achievements_done.add(key)
+                else: self._achievements_done.discard(key)
+            elif kind == "bounty":
+                if reached: self._bounties_done.add(key)
+                else: self._bounties_done.discard(key)
+
+    def achievement_badge_counts(self) -> tuple[int, int]:
+        """(new, claimable) achievements for the hub badge, without building the full list."""
+        new = claimable = 0
+        for key in self._achievements_done:
+            if self.achievements_claimed.get(key, False):
+                continue
+            # staged achievements only surface their next unclaimed stage
+            base, _, stage = key.partition(":")
+            if stage and any(not self.achievements_claimed.get(f"{base}:{i}", False) for i in range(1, int(stage))):
+                continue
+            claimable += 1
+            if not self.achievements_seen.get(key, False):
+                new += 1
+        return new, claimable
+
+    def bounties_claimable(self) -> int:
+        self._sync_bounties()
+        claimed = {**self.bounties.daily_claimed, **self.bounties.weekly_claimed}
+        return sum(1 for key in self._bounties_done if not claimed.get(key, False))
 
     def tick_passive(self):
-        gold_ps = 0.0
-        gold_ps += self.slots_passive_income
-        gold_ps += self.roulette_passive_income
-        gold_ps += self.buildings_passive_income
-        gold_ps += self.dice_idle_income
+        self.advance(1.0)
+
+    def advance(self, seconds: float) -> int:
+        """Accrue passive income for `seconds` of play (any positive float).
+
+        Gold is credited in whole units; the fractional remainder is carried in
+        an accumulator, so slow rates and uneven tick intervals lose nothing.
+        Shards and scrap are float currencies and accrue exactly. Returns the
+        gold credited.
+        """
+        if seconds <= 0:
+            return 0
+        self.playtime += seconds
+        self._stats.refresh()
+        gold_ps, shards_ps, scrap_ps = offline_rates(self)
+        credited = 0
         if gold_ps > 0:
-            self._apply_income(int(gold_ps))
-        if self.shards_passive_income > 0:
-            self.shards += self.shards_passive_income * self.shards_rate_mult
-        # Scrap passive
-        if self.scrap_idle > 0:
-            self.scrap += self.scrap_idle
+            self._gold_frac += gold_ps * self.global_income_mult * seconds
+            credited = int(self._gold_frac)
+            if credited:
+                self._gold_frac -= credited
+                self._credit_gold(credited)
+        if shards_ps > 0:
+            self.shards += shards_ps * seconds
+            self.mark_currencies_dirty()
+        if scrap_ps > 0:
+            self.scrap += scrap_ps * seconds
+            self.mark_currencies_dirty()
+        return credited
+
+    def advance_live(self, seconds: float) -> int:
+        """advance() for wall-clock time between UI ticks.
+
+        Up to MAX_LIVE_TICK_SECONDS is credited online; the rest of a longer
+        gap goes through the offline path (offline_cap_seconds,
+        offline_efficiency) as if the game had been closed. Returns the gold
+        credited.
+        """
+        live = min(seconds, MAX_LIVE_TICK_SECONDS)
+        credited = self.advance(live)
+        away = seconds - live
+        if away > 0:
+            now = time.time()
+            self.last_offline = offline_apply(
+                self, now - away, now, self.offline_cap_seconds, self.offline_efficiency
+            )
+            credited += int(self.last_offline["gold"])
+        return credited
+
+    def simulate(self, seconds: float, policy="greedy") -> dict:
+        """Fast-forward idle play, buying upgrades per policy ("greedy", "cheapest" or a callable).
+
+        Mutates this game; load a copy via from_dict(to_dict()) to project a save.
+        """
+        return sim_simulate(self, seconds, policy)
 
     # ---------- scrap mini-game ----------
     def salvage(self, cost: int, quality_mult: float | None = None) -> tuple[float, int]:
+        self._stats.refresh()
+        self.mark_dirty()
         return scrap_salvage(self, cost, quality_mult)
 
     # ---------- scrap crates ----------
     def open_scrap_crate(self, tier: str):
+        self.mark_dirty()
         return scrap_open_scrap_crate(self, tier)
 
     # ---------- shop ----------
@@ -461,7 +714,9 @@ class Game:
     def purchase_shop_item(self, key: str):
         res = shop_purchase(self, key)
         if res is True:
-            self._recompute_stats()
+            self.mark_dirty()
+            self._stats.mark_shop()
+            self._refresh_stats()
         return res
 
     def shop_item_details(self, key: str) -> dict:
@@ -476,35 +731,74 @@ class Game:
                 self.crates_basic_no_rare = 0
             else:
                 self.crates_basic_no_rare += 1
+        self._feed_metrics(*_CRATE_METRICS)
         # No direct rewards here; Achievements are claim-based via UI
 
     def list_achievements(self) -> List[dict]:
         return ach_list(self)
 
     def claim_achievement(self, key: str) -> bool:
+        self.mark_dirty()
         return ach_claim(self, key)
 
     def mark_achievements_seen(self) -> None:
+        self.mark_dirty()
         ach_mark_seen(self)
 
     # moved to achievements_ops
 
     # ---------- persistence ----------
+    def mark_dirty(self) -> None:
+        """Record that in-memory state differs from the last save."""
+        self.dirty_gen += 1
+        self.state_gen += 1
+
+    def mark_currencies_dirty(self) -> None:
+        """Like mark_dirty, for changes to currencies and playtime only (ops/save_store.CURRENCIES)."""
+        self.dirty_gen += 1
+
     def to_dict(self) -> dict[str, Any]:
         return persist_to_dict(self)
 
-    def from_dict(self, data: dict[str, Any]):
-        persist_from_dict(self, data)
+    def from_dict(self, data: dict[str, Any], inventory: Optional[List[DiceInstance]] = None):
+        self.mark_dirty()
+        self._watching = False
+        persist_from_dict(self, data, inventory)
+        self._recompute_stats()
+        self._arm_thresholds()
+        if self.journal is not None:
+            self.journal.compact()
+
+    def enable_journal(self, path: Path = SAVE_PATH, **options) -> SaveJournal:
+        """Persist via an append-only journal next to path (see ops/journal.py).
+
+        Call journal.commit() where save() used to be called; the snapshot at
+        path is rewritten on compaction.
+        """
+        if self.journal is not None:
+            self.journal.close()
+        self.journal = SaveJournal(self, path, **options)
+        return self.journal
+
+    def disable_journal(self) -> None:
+        if self.journal is not None:
+            self.journal.close()
+            self.journal = None
 
     # ---------- shard bounties (via manager) ----------
     def bounties_reset_info(self) -> dict:
         return self.bounties.reset_info()
 
     def list_bounties(self) -> List[dict]:
-        return self.bounties.list(self)
+        out = self.bounties.list(self)
+        self._sync_bounties()
+        return out
 
     def claim_bounty(self, key: str) -> bool:
-        return self.bounties.claim(self, key)
+        self.mark_dirty()
+        ok = self.bounties.claim(self, key)
+        self._sync_bounties()
+        return ok
 
         # Merge any historical duplicate dice into stars and scrap overflow
         try:
@@ -516,29 +810,96 @@ class Game:
 
     # ---------- equip helpers for UI ----------
     def equip_replace_or_empty(self, uid: int) -> bool:
+        self.mark_dirty()
         return inv_equip_replace_or_empty(self, uid)
 
-    def save(self, path: Path = SAVE_PATH) -> bool:
+    def save(self, path: Path | SaveStore = SAVE_PATH, binary: Optional[bool] = None,
+             profile: str = DEFAULT_PROFILE) -> bool:
+        """Write the save to a file or a SaveStore profile.
+
+        For files, binary defaults to on for BINARY_SAVE_SUFFIXES (JSON otherwise).
+        """
+        if isinstance(path, SaveStore):
+            try:
+                path.save(profile, self.to_dict()); return True
+            except Exception: return False
+        if binary is None:
+            binary = Path(path).suffix.lower() in BINARY_SAVE_SUFFIXES
         try:
-            path.parent.mkdir(parents=True, exist_ok=True)
-            path.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8"); return True
+            if binary:
+                persist_write_binary(path, self.to_dict())
+            else:
+                persist_write_game_json(path, self)  # inventory streamed, not copied
+            return True
         except Exception: return False
 
-    def load(self, path: Path = SAVE_PATH) -> bool:
+    def load(self, path: Path | SaveStore = SAVE_PATH, profile: str = DEFAULT_PROFILE) -> bool:
+        if isinstance(path, JsonSaveStore):
+            path = path.path_for(profile)  # keep legacy fallback and journal replay
+        elif isinstance(path, SaveStore):
+            try:
+                data = path.load(profile)
+                if data is None:
+                    self._grant_starter_if_empty(); return False
+                self.from_dict(data)
+                self._grant_starter_if_empty(); self.apply_offline_progress(); return True
+            except Exception:
+                self._grant_starter_if_empty(); return False
         try:
             # Prefer new location; fall back to legacy file if present
             if not path.exists() and LEGACY_SAVE.exists():
-                self.from_dict(json.loads(LEGACY_SAVE.read_text(encoding="utf-8")))
+                self.from_dict(persist_read_save(LEGACY_SAVE))
                 # attempt migration on next save
-                self._grant_starter_if_empty(); return True
+                self._grant_starter_if_empty(); self.apply_offline_progress(); return True
             if not path.exists():
                 self._grant_starter_if_empty(); return False
-            self.from_dict(json.loads(path.read_text(encoding="utf-8")))
-            self._grant_starter_if_empty(); return True
+            jpath = journal_path_for(path)
+            header = persist_read_json_header(path) if not jpath.exists() else None
+            if header is not None and header.get("version") == SAVE_VERSION:
+                # current JSON save, no journal: stream dice straight into the inventory
+                inventory: List[DiceInstance] = []
+                data = persist_read_json_streaming(path, lambda rec: inventory.append(dice_from_record(rec)))
+                self.from_dict(data, inventory)
+                self._grant_starter_if_empty(); self.apply_offline_progress(); return True
+            data = persist_read_save(path)
+            replayed = journal_replay(data, jpath)
+            self.from_dict(data)
+            if replayed and self.journal is None and self.save(path):
+                jpath.unlink()  # folded into the snapshot
+            self._grant_starter_if_empty(); self.apply_offline_progress(); return True
         except Exception:
             self._grant_starter_if_empty(); return False
+
+    def restore_snapshot(self, path: Path) -> bool:
+        """Replace the current state with a snapshot-ring entry (ops/snapshots.py).
+
+        No offline progress is credited for the time since the snapshot.
+        """
+        try:
+            data = read_snapshot(path)
+        except Exception:
+            return False
+        self.from_dict(data)
+        self._grant_starter_if_empty()
+        return True
+
+    def apply_offline_progress(self, now: Optional[float] = None) -> Dict[str, float]:
+        """Credit idle income since saved_at (capped, scaled by offline_efficiency).
+
+        saved_at moves to `now`, so loading or restoring the same state again
+        credits nothing twice.
+        """
+        if now is None:
+            now = time.time()
+        self.last_offline = offline_apply(
+            self, self.saved_at, now, self.offline_cap_seconds, self.offline_efficiency
+        )
+        self.saved_at = now
+        self.mark_currencies_dirty()
+        return self.last_offline
 
     def reset(self):
+        self._watching = False
         self.gold = 0.0; self.lifetime_gold = 0.0; self.diamonds = 0; self.shards = 0.0
         self.scrap = 0.0; self.scrap_idle = 0.0
         self.base_dice = 1; self.dice_count = 1; self.die_sides = 6; self.animation_speed = 1.0
@@ -552,11 +913,23 @@ class Game:
         self.team_roulette_bonus_from_dice = 0.0
         for u in self.upgrades: u.level = 0; u.locked = False; u.disabled = False
         self.inventory.clear(); self._next_uid = 1; self.loadout = [0]*5
+        self._gold_frac = 0.0; self.playtime = 0.0
+        self.mark_dirty()
         self._grant_starter_if_empty(); self._recompute_stats()
+        self._arm_thresholds()
+        if self.journal is not None:
+            self.journal.compact()
 
     # ---------- maintenance ----------
     def merge_duplicates(self) -> None:
-        inv_merge_duplicates(self)
+        self.mark_dirty()
+        merged, removed = inv_merge_duplicates(self)
+        if self.journal is not None:
+            for uid in removed:
+                self.journal.note_dice_removed(uid)
+            for inst in merged:
+                self.journal.note_dice(inst)
+        self._feed_metrics(*_INVENTORY_METRICS)
     
 
 
@@ -1,15 +1,20 @@
 # main.py
 import sys
-from pathlib import Path
+import threading
+import time
 
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, Signal
 from PySide6.QtGui import QGuiApplication
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QLabel, QPushButton, QStackedWidget,
     QMessageBox, QDialog, QFormLayout, QCheckBox, QHBoxLayout, QTabWidget
 )
 
-from game import Game, SAVE_PATH
+from game import Game, SAVE_PATH, SNAPSHOT_DIR
+from ops.dice_dist import moments as dice_moments
+from ops.save_service import SaveService
+from ops.save_store import open_store, JsonSaveStore, SqliteSaveStore, DEFAULT_PROFILE
+from ops.snapshots import SnapshotRing
 from ui.ui_currencybar import CurrencyBar
 from ui.ui_mainmenu import MainMenu
 from ui.ui_hub import HubMenu
@@ -18,12 +23,13 @@ from ui.ui_inventory_screen import InventoryScreen
 from ui.ui_slots import SlotsTab
 from ui.ui_scrap import ScrapTab
 from ui.ui_roulette import RouletteTab
+from ui.ui_autoplay import AutoPlayBar
 from ui.ui_upgrades import UpgradesDialog
 from ui.ui_bounties import BountiesDialog
 from ui.ui_buildings_hub import BuildingsHub
 from ui.ui_achievements import AchievementsDialog
 from ui.ui_shop import ShopDialog
-from ops.modes import DiceGame, SlotsGame  # SlotsGame still used by ui_slots; passives handled in Game.tick_passive()
+from ops.modes import DiceGame, SlotsGame  # SlotsGame still used by ui_slots; passives handled in Game.advance()
 from settings import load_settings, save_settings
 
 QGuiApplication.setHighDpiScaleFactorRoundingPolicy(
@@ -77,11 +83,16 @@ class GameScreen(QWidget):
         v = QVBoxLayout(dice_tab)
         self.gold_label = QLabel(); self.gold_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.dice_label = QLabel(); self.dice_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.odds_label = QLabel(); self.odds_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.odds_label.setStyleSheet("font-size:13px; color:#a8a8d8;")
         self.message_label = QLabel("Welcome!"); self.message_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.bet_btn = QPushButton("Bet 🎲"); self.bet_btn.clicked.connect(self.on_bet_clicked)
         self.btn_back = QPushButton("← Back to Games"); self.btn_back.clicked.connect(self.mw.show_games)
-        v.addWidget(self.gold_label); v.addWidget(self.dice_label); v.addWidget(self.message_label)
-        v.addWidget(self.bet_btn); v.addWidget(self.btn_back)
+        v.addWidget(self.gold_label); v.addWidget(self.dice_label); v.addWidget(self.odds_label); v.addWidget(self.message_label)
+        self.dice_auto = AutoPlayBar(self.game, self._dice_turbo_step, on_toggle=self._dice_turbo_toggled,
+                                     on_tick=self._dice_turbo_shown, parent=dice_tab)
+        v.addWidget(self.bet_btn); v.addWidget(self.dice_auto); v.addWidget(self.btn_back)
+        self._timer = None
         self.tabs.addTab(dice_tab, "Dice")
 
         # Scrap tab (always available for now)
@@ -98,6 +109,11 @@ class GameScreen(QWidget):
         if self.game.roulette_unlocked:
             self.tabs.addTab(self.roulette_tab, "Roulette")
 
+        # turbo pacing from settings, shared by every casino tab
+        for bar in (self.dice_auto, self.slots_tab.autoplay, self.roulette_tab.autoplay):
+            bar.configure(self.mw.settings.get("autoplay_per_tick", 100),
+                          self.mw.settings.get("autoplay_interval_ms", 250))
+
         root = QVBoxLayout(self)
         root.addWidget(self.tabs)
         self.setLayout(root)
@@ -125,6 +141,10 @@ class GameScreen(QWidget):
     def refresh_all(self):
         self.gold_label.setText(f"Gold: {int(self.game.gold)} | Diamonds: {self.game.diamonds} | Shards: {int(self.game.shards)}")
         self.dice_label.setText(f"Dice: {self.game.dice_count}d{self.game.die_sides}")
+        # closed-form moments; the full distribution is only built when rolling (ops/casino_ops)
+        n, sides = self.game.dice_count, self.game.die_sides
+        mean, std = dice_moments(n, sides)
+        self.odds_label.setText(f"Expected {mean:,.1f} ± {std:,.1f} per roll  •  range {n:,}–{n * sides:,}")
 
         # Add tabs upon unlock
         if self.game.slots_unlocked and self.tabs.indexOf(self.slots_tab) == -1:
@@ -157,25 +177,57 @@ class GameScreen(QWidget):
         self._idx += 1
         if self._idx > 6:
             self._timer.stop()
-            faces, total = DiceGame(self.game).play()
+            # same engine and payout rule as turbo, one roll
+            res = self.game.bet_many(1, faces=True)
+            faces, total = [int(f) for f in res["faces"][0]], res["total"]
             self.refresh_all()
             self.message_label.setText(f"{len(faces)}d{self.game.die_sides} → {total}")
-            self.bet_btn.setEnabled(True)
+            self.bet_btn.setEnabled(not self.dice_auto.running())
+
+    # Dice turbo: one roll with faces to show, the rest of the tick as a batch
+    def _dice_turbo_step(self, n):
+        shown = self.game.bet_many(1, faces=True)
+        if n > 1:
+            self.game.bet_many(n - 1)
+        return n, f"{len(shown['faces'][0])}d{self.game.die_sides} → {shown['total']}"
+
+    def _dice_turbo_shown(self, text):
+        self.message_label.setText(text)
+        self.refresh_all()
+
+    def _dice_turbo_toggled(self, on):
+        self.bet_btn.setEnabled(not on and not (self._timer and self._timer.isActive()))
 
 # ---------------- Main Window (navigation + top bar) ----------------
 class MainWindow(QWidget):
+    _load_done = Signal()  # emitted by the loader thread, delivered on the UI thread
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle(APP_TITLE)
 
         self.settings = load_settings()
         self.game = Game()
-        self.game.load(SAVE_PATH)
+        try:
+            self.game.offline_cap_seconds = float(self.settings.get("offline_cap_hours", 24)) * 3600.0
+            self.game.offline_efficiency = float(self.settings.get("offline_efficiency", 1.0))
+        except Exception:
+            pass
+        # saves go through a SaveStore (JSON file by default, SQLite for many profiles)
+        self.store = open_store(self.settings.get("save_backend", "json"), SAVE_PATH)
+        self.profile = str(self.settings.get("profile", DEFAULT_PROFILE))
+        # the menu only needs the save header; the full load runs on a loader thread meanwhile
+        save_header = self.store.probe(self.profile)
+        self._loaded = False
+        self._load_ok = False
+        self._had_save = False
+        self.saver = None
 
         # Screens
         self.stack = QStackedWidget(self)
         self.menu = MainMenu(
-            has_save=Path(SAVE_PATH).exists(),
+            has_save=save_header is not None,
+            summary=save_header,
             on_continue=self.show_hub,
             on_new_game=self.new_game,
             on_settings=self.open_settings,
@@ -213,15 +265,66 @@ class MainWindow(QWidget):
 
         self.setStyleSheet("QWidget { background:#0f1020; color:#e8e8ff; font-family: Segoe UI, Arial; }")
 
-        # Tick & autosave
+        # Tick & autosave (income follows the monotonic clock, not the timer count)
+        self._last_tick = time.monotonic()
         self.timer = QTimer(self)
         self.timer.setInterval(1000)
         self.timer.timeout.connect(self.tick)
-        self.timer.start()
 
         self.resize(960, 640)
         self.show_menu()
         self._refresh_bar()
+        self._load_done.connect(self.finish_load)
+        self._loader = threading.Thread(target=self._load_game, name="save-loader", daemon=True)
+        self._loader.start()
+
+    def _load_game(self):
+        """Loader thread: read, decode and apply the save. Touches no widgets."""
+        try:
+            self._had_save = self.store.exists(self.profile)
+            self._load_ok = self.game.load(self.store, profile=self.profile)
+        finally:
+            self._load_done.emit()
+
+    def finish_load(self):
+        """Start play once the save is in; waits for the loader if the player acts first."""
+        if self._loaded:
+            return
+        self._loader.join()
+        self._loaded = True
+        snapshots = self._snapshot_ring()
+        if not self._load_ok and self._had_save and snapshots is not None:
+            # unreadable save: fall back to the newest snapshot rather than a fresh game
+            latest = snapshots.latest()
+            if latest is not None and self.game.restore_snapshot(latest.path):
+                QMessageBox.warning(
+                    self, "Save restored",
+                    "The save file could not be read. Progress was restored from the snapshot of "
+                    f"{time.strftime('%Y-%m-%d %H:%M', time.localtime(latest.created))}.",
+                )
+        # debounced background autosave plus periodic snapshots; flushed on close
+        self.saver = SaveService(
+            self.game, SAVE_PATH, writer=lambda _path, data: self.store.save(self.profile, data),
+            snapshots=snapshots,
+            snapshot_interval=float(self.settings.get("snapshot_minutes", 10) or 0) * 60.0,
+            # SQLite: ticks that only moved currencies update those columns, not every child row
+            currency_writer=(lambda values: self.store.update_currencies(self.profile, values))
+            if isinstance(self.store, SqliteSaveStore) else None,
+        )
+        if self.settings.get("save_journal", False) and isinstance(self.store, JsonSaveStore):
+            self.game.enable_journal(self.store.path_for(self.profile))
+        self._last_tick = time.monotonic()
+        self.timer.start()
+        self._refresh_bar()
+
+    def _snapshot_ring(self) -> SnapshotRing | None:
+        try:
+            if float(self.settings.get("snapshot_minutes", 10) or 0) <= 0:
+                return None
+            directory = SNAPSHOT_DIR if self.profile == DEFAULT_PROFILE else SNAPSHOT_DIR / self.profile
+            return SnapshotRing(directory, codec=self.settings.get("snapshot_codec", "zlib"))
+        except Exception:
+            return None
 
     # -------- Navigation helpers --------
     def show_menu(self):
@@ -229,6 +332,7 @@ class MainWindow(QWidget):
         self._refresh_bar()
 
     def show_hub(self):
+        self.finish_load()
         self.stack.setCurrentIndex(1)
         self._refresh_bar()
         # Refresh hub widgets (e.g., achievements NEW badge)
@@ -305,12 +409,13 @@ class MainWindow(QWidget):
             self, "Confirm", "Start a new game? This erases current progress.",
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
         ) == QMessageBox.StandardButton.Yes:
+            self.finish_load()
             try:
-                if Path(SAVE_PATH).exists():
-                    Path(SAVE_PATH).unlink()
+                self.store.delete(self.profile)
             except Exception:
                 pass
             self.game.reset()
+            self.saver.flush()
             self.show_hub()
             self._refresh_bar()
 
@@ -323,7 +428,9 @@ class MainWindow(QWidget):
     # -------- Tick & save --------
     def tick(self):
         # unified passive tick (slots + roulette + buildings + shards)
-        self.game.tick_passive()
+        now = time.monotonic()
+        self.game.advance_live(now - self._last_tick)
+        self._last_tick = now
         # ensure unlock flags flip as soon as thresholds are crossed
         self.game.check_unlocks()
 
@@ -340,7 +447,18 @@ class MainWindow(QWidget):
                 self.hub.refresh()
 
         self._refresh_bar()
-        self.game.save(SAVE_PATH)
+        if self.game.journal is not None:
+            self.game.journal.commit()
+            self.saver.request_snapshot()
+        else:
+            self.saver.request()
+
+    def closeEvent(self, event):
+        if self._loaded:
+            self.game.disable_journal()
+            self.saver.stop()
+        self.store.close()
+        super().closeEvent(event)
 
 # ---------------- Entrypoint ----------------
 def main():
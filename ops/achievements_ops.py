@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import List
+from typing import List, Tuple
 
 from core.achievements import ACHIEVEMENTS, AchvDef
 
@@ -86,14 +86,27 @@ def mark_achievements_seen(game) -> None:
             game.achievements_seen[a["key"]] = True
 
 
+def stage_targets(a: AchvDef) -> List[Tuple[str, float]]:
+    """(claim key, target) for every stage of an achievement; singles have one entry."""
+    stages = a.stages or []
+    rewards = a.stage_rewards or []
+    if stages and rewards and len(stages) == len(rewards):
+        return [(f"{a.key}:{i+1}", float(tgt)) for i, tgt in enumerate(stages)]
+    return [(a.key, float(a.target))]
+
+
 def _achievement_value(game, a: AchvDef) -> float:
-    t = a.type
+    return metric_value(game, a.type)
+
+
+def metric_value(game, t: str) -> float:
+    """Current value of an achievement metric type (0.0 for unknown types)."""
     if t == "lifetime_gold":
         return float(game.lifetime_gold)
     if t == "buildings_owned_total":
         total = 0
-        for u in game.upgrades:
-            if u.category == "buildings" and not getattr(u.definition, "milestone_key", None):
+        for u in game.registry.in_category("buildings"):
+            if not u.milestone_key:
                 total += u.level
         return float(total)
     if t == "scrap_total":
@@ -57,10 +57,10 @@ class BountyManager:
         return {
             "daily_reset_at": self.daily_reset_at,
             "weekly_reset_at": self.weekly_reset_at,
-            "daily_claimed": self.daily_claimed,
-            "weekly_claimed": self.weekly_claimed,
-            "daily_keys": self.daily_keys,
-            "weekly_keys": self.weekly_keys,
+            "daily_claimed": dict(self.daily_claimed),
+            "weekly_claimed": dict(self.weekly_claimed),
+            "daily_keys": list(self.daily_keys),
+            "weekly_keys": list(self.weekly_keys),
         }
 
     def from_dict(self, data: dict) -> None:
@@ -125,6 +125,9 @@ class BountyManager:
         }
 
     # ---------- public API used by Game/UI ----------
+    def template(self, key: str) -> Optional[BountyTemplate]:
+        return self._pool.get(key)
+
     def _progress(self, game, metric: str) -> float:
         # Accept counters or totals accessible on Game.
         # Special handling for some virtual metrics.
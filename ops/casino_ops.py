@@ -1,7 +1,18 @@
 from __future__ import annotations
 
 import random
-from typing import List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+
+from ops.dice_dist import distribution
+from ops.slots_engine import spin_slots_many
+
+try:  # optional dependency
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+# Faces drawn per NumPy block in bet_many (rows * dice), bounding scratch memory
+BET_BLOCK = 1 << 22
 
 
 def bet(game) -> Tuple[List[int], int]:
@@ -11,23 +22,60 @@ def bet(game) -> Tuple[List[int], int]:
     return faces, gained
 
 
-def spin_slots(game) -> Tuple[List[str], int, int]:
-    symbols = ["dY?'", "dY?<", "7�,?���", "dY'Z", "�-?"]
-    reels = [random.choice(symbols) for _ in range(3)]
-    gold_won = 0
-    diamonds_won = 0
-    if len(set(reels)) == 1:
-        if reels[0] == "dY'Z":
-            diamonds_won = 10
+def bet_many(game, n: int, faces: bool = False, rng: Optional[Any] = None) -> Dict[str, Any]:
+    """n dice bets in one call, equivalent to n bet() calls.
+
+    Each roll's sum is scaled by global_income_mult and rounded as bet()
+    does; the gold, counter and unlock check are then applied once.
+    Totals are drawn from the cached exact sum distribution (ops/dice_dist),
+    one alias-table lookup per roll whatever dice_count is. faces=True
+    draws the faces instead, as (rows, dice_count) NumPy blocks or one
+    random.choices call per roll, and returns them too (an (n, dice_count)
+    array with NumPy, else lists). rng may be a numpy Generator (or
+    random.Random without NumPy).
+    """
+    n = max(0, int(n))
+    k, sides = int(game.dice_count), int(game.die_sides)
+    mult = game.global_income_mult
+    all_faces = None
+    if np is not None:
+        rng = rng if rng is not None else np.random.default_rng()
+        if faces:
+            dtype = np.uint8 if sides < 256 else np.int32
+            rows = max(1, BET_BLOCK // max(1, k))
+            sums = np.empty(n, dtype=np.int64)
+            all_faces = np.empty((n, k), dtype=dtype)
+            for lo in range(0, n, rows):
+                hi = min(n, lo + rows)
+                block = rng.integers(1, sides + 1, size=(hi - lo, k), dtype=dtype)
+                block.sum(axis=1, dtype=np.int64, out=sums[lo:hi])
+                all_faces[lo:hi] = block
+        else:
+            sums = distribution(k, sides).sample_many(n, rng)
+        total = int(sums.sum())
+        gained = int(np.rint(sums * mult).sum())
+        best = int(sums.max()) if n else 0
+    else:
+        rng = rng if rng is not None else random
+        if faces:
+            pool = range(1, sides + 1)
+            all_faces = [rng.choices(pool, k=k) for _ in range(n)]
+            sums = [sum(f) for f in all_faces]
         else:
-            gold_won = 500
-    elif len(set(reels)) == 2:
-        gold_won = 50
+            sums = distribution(k, sides).sample_many(n, rng)
+        total = sum(sums)
+        gained = sum(int(round(s * mult)) for s in sums)
+        best = max(sums, default=0)
+    game._credit_gold(gained)
+    game.counter_dice_plays += n
+    out = {"rolls": n, "total": total, "gained": gained, "best": best}
+    if faces:
+        out["faces"] = all_faces
+    return out
 
-    if gold_won > 0:
-        gold_won = int(round(gold_won * game.slots_yield_mult))
 
-    gold_won = game._apply_income(gold_won)
-    game.diamonds += diamonds_won
-    return reels, gold_won, diamonds_won
+def spin_slots(game) -> Tuple[List[str], int, int]:
+    res = spin_slots_many(game, 1, animate=1)
+    reels, _cls = res["reels"][0]
+    return reels, res["gold"], res["diamonds"]
 
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import math
+import random
+from functools import lru_cache
+from typing import Any, List, Optional, Sequence, Tuple
+
+try:  # optional dependency
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+
+def _convolve(a: Sequence[float], b: Sequence[float]) -> List[float]:
+    out = [0.0] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        if x:
+            for j, y in enumerate(b):
+                out[i + j] += x * y
+    return out
+
+
+def sum_pmf(n: int, sides: int):
+    """Exact PMF of the sum of n fair dice with faces 1..sides.
+
+    Index i is the probability of total n + i. Built by exponentiation by
+    squaring of the single-die PMF, so O(log n) convolutions. Returns a
+    float64 array with NumPy, else a list.
+    """
+    n, sides = int(n), int(sides)
+    if n < 0 or sides < 1:
+        raise ValueError(f"invalid dice {n}d{sides}")
+    conv = np.convolve if np is not None else _convolve
+    result: Any = [1.0]
+    base: Any = [1.0 / sides] * sides
+    if np is not None:
+        result, base = np.ones(1), np.full(sides, 1.0 / sides)
+    while n:
+        if n & 1:
+            result = conv(result, base)
+        n >>= 1
+        if n:
+            base = conv(base, base)
+    if np is not None:
+        return result / result.sum()
+    total = sum(result)
+    return [p / total for p in result]
+
+
+def moments(n: int, sides: int) -> Tuple[float, float]:
+    """(mean, std) of an NdS total in closed form: n(s+1)/2 and sqrt(n(s^2-1)/12)."""
+    n, sides = int(n), int(sides)
+    return n * (sides + 1) / 2.0, math.sqrt(n * (sides * sides - 1) / 12.0)
+
+
+class SumDistribution:
+    """Distribution of an NdS total: exact PMF, moments and O(1) alias sampling."""
+
+    def __init__(self, n: int, sides: int) -> None:
+        self.n, self.sides = int(n), int(sides)
+        self.pmf = sum_pmf(self.n, self.sides)
+        self.lo = self.n                 # smallest total
+        self.hi = self.n * self.sides    # largest total
+        self.mean, self.std = moments(self.n, self.sides)
+        self.variance = self.std ** 2
+        self._build_alias()
+
+    def _build_alias(self) -> None:
+        # Vose's alias method: every slot holds its own index with probability
+        # prob[i] and an alias otherwise, so a draw is one slot plus one coin.
+        size = len(self.pmf)
+        scaled = [float(p) * size for p in self.pmf]
+        prob = [1.0] * size
+        alias = list(range(size))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            prob[s], alias[s] = scaled[s], l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+        if np is not None:
+            self._prob, self._alias = np.array(prob), np.array(alias, dtype=np.int64)
+        else:
+            self._prob, self._alias = prob, alias
+
+    def sample(self, rng: Optional[random.Random] = None) -> int:
+        """One total: one table lookup and one uniform."""
+        r = rng or random
+        i = int(r.random() * len(self._prob))
+        return self.lo + (i if r.random() < self._prob[i] else int(self._alias[i]))
+
+    def sample_many(self, count: int, rng: Optional[Any] = None):
+        """count totals; an int64 array with NumPy (rng a numpy Generator), else a list."""
+        if np is None:
+            return [self.sample(rng) for _ in range(int(count))]
+        rng = rng if rng is not None else np.random.default_rng()
+        idx = rng.integers(0, len(self._prob), size=int(count))
+        keep = rng.random(int(count)) < self._prob[idx]
+        return self.lo + np.where(keep, idx, self._alias[idx])
+
+    def probability(self, total: int) -> float:
+        return float(self.pmf[total - self.lo]) if self.lo <= total <= self.hi else 0.0
+
+
+@lru_cache(maxsize=64)
+def distribution(n: int, sides: int) -> SumDistribution:
+    """Cached SumDistribution per (n, sides)."""
+    return SumDistribution(n, sides)
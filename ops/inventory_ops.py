@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
 
 from core.dice_models import DiceInstance
 
@@ -108,7 +108,10 @@ def compact_loadout(game) -> None:
     game.loadout = filtered + [0] * (6 - len(filtered))
 
 
-def merge_duplicates(game) -> None:
+def merge_duplicates(game) -> Tuple[List[DiceInstance], List[int]]:
+    """Fold duplicate dice into stars on the lowest uid; returns (kept dice that gained stars, removed uids)."""
+    merged: List[DiceInstance] = []
+    removed: List[int] = []
     by_key: Dict[str, List[DiceInstance]] = {}
     for d in game.inventory:
         by_key.setdefault(d.template_key, []).append(d)
@@ -138,6 +141,8 @@ def merge_duplicates(game) -> None:
         if dup_uids:
             game.inventory = [d for d in game.inventory if d.uid not in dup_uids]
             changed = True
+            merged.append(keep)
+            removed.extend(dup_uids)
 
         # Update loadout: replace dup uids with keep.uid if not already present; otherwise clear slot
         already = keep.uid in game.loadout
@@ -149,3 +154,4 @@ def merge_duplicates(game) -> None:
     if changed:
         compact_loadout(game)
         game.on_loadout_changed()
+    return merged, removed
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from ops.save_codec import SAVE_SCHEMA, Scalar
+
+# Journal records are one compact JSON object per line. Every record sets an
+# absolute value (never a delta), so replaying a journal over a snapshot that
+# already contains some of its records is harmless:
+#   {"t": "s", "v": {scalar: value, ...}}             scalar fields that changed
+#   {"t": "u", "k": key, "l": level}                   upgrade level
+#   {"t": "d", "u": uid, "k": template, "l": level, "s": stars}   die upsert
+#   {"t": "x", "u": uid}                               die removed
+#   {"t": "f", "n": field, "v": value}                 small container replaced
+COMPACT_EVERY = 2000        # records
+COMPACT_SECONDS = 300.0
+
+SCALAR_FIELDS = tuple(f.name for f in SAVE_SCHEMA if isinstance(f, Scalar))
+_ATTR = {"next_uid": "_next_uid"}
+
+# Small, bounded containers: replaced wholesale when they change.
+CONTAINER_FIELDS: Dict[str, Callable[[Any], Any]] = {
+    "loadout": lambda g: list(g.loadout),
+    "crates_opened": lambda g: dict(g.crates_opened),
+    "achievements_claimed": lambda g: dict(g.achievements_claimed),
+    "achievements_seen": lambda g: dict(g.achievements_seen),
+    "shop_levels": lambda g: dict(g.shop_levels),
+    "bounties_v2": lambda g: g.bounties.to_dict(),
+}
+
+
+def journal_path_for(path: Path) -> Path:
+    return Path(path).with_suffix(".journal")
+
+
+class SaveJournal:
+    """Append-only mutation journal next to a snapshot save.
+
+    commit() appends only what changed since the previous commit: scalars
+    and upgrade levels are diffed (both bounded by the schema/catalog), dice
+    are tracked through Game's note_dice hooks, so the cost does not grow
+    with inventory size. Each commit is flushed to the OS before returning.
+    After COMPACT_EVERY records or COMPACT_SECONDS the full snapshot is
+    rewritten atomically and the journal truncated.
+    """
+
+    def __init__(
+        self,
+        game,
+        snapshot_path: Path,
+        compact_every: int = COMPACT_EVERY,
+        compact_seconds: float = COMPACT_SECONDS,
+        fsync: bool = False,
+    ) -> None:
+        self.game = game
+        self.snapshot_path = Path(snapshot_path)
+        self.path = journal_path_for(self.snapshot_path)
+        self.compact_every = int(compact_every)
+        self.compact_seconds = float(compact_seconds)
+        self.fsync = fsync
+        self.records = 0
+        self._dice: Dict[int, Any] = {}
+        self._removed: set[int] = set()
+        self._fh = None
+        self.compact()
+
+    # ---------- Game hooks ----------
+    def note_dice(self, inst) -> None:
+        self._removed.discard(inst.uid)
+        self._dice[inst.uid] = inst
+
+    def note_dice_removed(self, uid: int) -> None:
+        self._dice.pop(uid, None)
+        self._removed.add(uid)
+
+    # ---------- writing ----------
+    def _baseline(self) -> None:
+        g = self.game
+        self._scalars = {f: self._scalar(f) for f in SCALAR_FIELDS if f != "saved_at"}
+        self._levels = {u.key: u.level for u in g.upgrades}
+        self._containers = {n: fn(g) for n, fn in CONTAINER_FIELDS.items()}
+
+    def _scalar(self, name: str):
+        return getattr(self.game, _ATTR.get(name, name))
+
+    def commit(self) -> int:
+        """Append records for everything changed since the last commit; returns the count."""
+        g = self.game
+        out: List[dict] = []
+        changed = {}
+        for f, old in self._scalars.items():
+            v = self._scalar(f)
+            if v != old:
+                changed[f] = v
+                self._scalars[f] = v
+        if changed:
+            changed["saved_at"] = time.time()
+            out.append({"t": "s", "v": changed})
+        for u in g.upgrades:
+            if self._levels.get(u.key) != u.level:
+                self._levels[u.key] = u.level
+                out.append({"t": "u", "k": u.key, "l": u.level})
+        for uid in self._removed:
+            out.append({"t": "x", "u": uid})
+        for d in self._dice.values():
+            out.append({"t": "d", "u": d.uid, "k": d.template_key, "l": d.level, "s": d.stars})
+        self._dice.clear(); self._removed.clear()
+        for n, fn in CONTAINER_FIELDS.items():
+            v = fn(g)
+            if v != self._containers[n]:
+                self._containers[n] = v
+                out.append({"t": "f", "n": n, "v": v})
+        if out:
+            self._fh.write("".join(json.dumps(r, separators=(",", ":")) + "\n" for r in out))
+            self._fh.flush()
+            if self.fsync:
+                os.fsync(self._fh.fileno())
+            self.records += len(out)
+        if self.records >= self.compact_every or time.monotonic() - self._compacted_at >= self.compact_seconds:
+            self.compact()
+        return len(out)
+
+    def compact(self) -> None:
+        """Rewrite the snapshot atomically, then start an empty journal.
+
+        If the snapshot cannot be written the journal is kept and appended
+        to, and compaction is retried at the next threshold.
+        """
+        saved = self.game.save(self.snapshot_path)
+        self._compacted_at = time.monotonic()
+        if self._fh is not None:
+            if not saved:
+                return
+            self._fh.close()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fh = open(self.path, "w" if saved else "a", encoding="utf-8")
+        self.records = 0
+        self._dice.clear(); self._removed.clear()
+        self._baseline()
+
+    def close(self) -> None:
+        """Final compaction; the journal file is left empty."""
+        self.commit()
+        self.compact()
+        self._fh.close()
+        self._fh = None
+
+
+# ---------- replay ----------
+def replay(data: Dict[str, Any], path: Path) -> int:
+    """Apply journal records at path to a snapshot dict in place; returns records applied.
+
+    A torn final line (crash mid-append) is ignored.
+    """
+    path = Path(path)
+    if not path.exists():
+        return 0
+    levels = {rec.get("key"): rec for rec in data.setdefault("upgrades", [])}
+    inv = {int(rec["uid"]): rec for rec in data.get("inv", [])}
+    applied = 0
+    with open(path, "r", encoding="utf-8") as fh:
+        for line in fh:
+            try:
+                r = json.loads(line)
+            except ValueError:
+                break
+            t = r.get("t")
+            if t == "s":
+                data.update(r["v"])
+            elif t == "u":
+                rec = levels.get(r["k"])
+                if rec is None:
+                    rec = levels[r["k"]] = {"key": r["k"]}
+                    data["upgrades"].append(rec)
+                rec["level"] = r["l"]
+            elif t == "d":
+                inv[int(r["u"])] = {"uid": r["u"], "template_key": r["k"], "level": r["l"], "stars": r["s"]}
+            elif t == "x":
+                inv.pop(int(r["u"]), None)
+            elif t == "f":
+                data[r["n"]] = r["v"]
+            applied += 1
+    data["inv"] = list(inv.values())
+    return applied
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import json
+import re
+from typing import IO, Any, Callable, Dict, Iterable, List, Mapping, Optional
+
+# Incremental reader/writer for one top-level JSON object whose large arrays
+# (the save's "inv") are handled one element at a time. Everything else is
+# decoded with the stdlib C scanner, so only the array elements pay a Python
+# per-item cost and memory stays at one read chunk plus one element.
+
+CHUNK = 1 << 16
+_WS = " \t\r\n"
+_FOLLOW = _WS + ",:]}"  # what may follow a complete value
+_SKIP_WS = re.compile(r"[ \t\r\n]*").match
+_decoder = json.JSONDecoder()
+_compact = json.JSONEncoder(separators=(",", ":")).encode
+BATCH = 4096  # streamed elements per write() call
+
+
+class _Reader:
+    def __init__(self, fh: IO[str], chunk: int = CHUNK) -> None:
+        self.fh = fh
+        self.chunk = chunk
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self, want: int = 0) -> bool:
+        more = self.fh.read(max(self.chunk, want))
+        if not more:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + more
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character ('' at end of input), not consumed."""
+        while True:
+            buf, pos = self.buf, self.pos
+            while pos < len(buf) and buf[pos] in _WS:
+                pos += 1
+            self.pos = pos
+            if pos < len(buf):
+                return buf[pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        ch = self.peek()
+        if not ch or ch not in chars:
+            raise ValueError(f"expected one of {chars!r}, got {ch or 'end of input'!r}")
+        self.pos += 1
+        return ch
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                v, end = _decoder.raw_decode(self.buf, self.pos)
+                # a number cut off by the chunk boundary ("1." of "1.5") still decodes
+                if self.eof or (end < len(self.buf) and self.buf[end] in _FOLLOW):
+                    self.pos = end
+                    return v
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            # grow geometrically so one huge value costs O(size), not O(size^2 / chunk)
+            self._fill(len(self.buf) - self.pos)
+
+    def array(self, sink: Callable[[Any], None]) -> None:
+        """Feed the elements of the array starting at the cursor to sink."""
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        decode = _decoder.raw_decode
+        batching = True
+        while True:
+            buf, pos, n = self.buf, self.pos, len(self.buf)
+            if batching:
+                # write_object's layout, one element per line: every complete line
+                # ending in "," decodes as one list. Raw newlines never occur inside
+                # JSON strings, so a failed decode only means another layout.
+                k = buf.rfind("\n", pos)
+                seg = buf[pos:k].rstrip() if k > pos else ""
+                if seg.endswith(","):
+                    try:
+                        items = json.loads("[" + seg[:-1] + "]")
+                    except ValueError:
+                        batching = False
+                    else:
+                        self.pos = k
+                        for v in items:
+                            sink(v)
+                elif seg:
+                    batching = False
+            # per element: those that lie wholly inside the current buffer
+            try:
+                while not batching:
+                    v, end = decode(buf, _SKIP_WS(buf, pos).end())
+                    if end < n and buf[end] not in _FOLLOW:
+                        break  # cut-off number
+                    pos = _SKIP_WS(buf, end).end()
+                    if pos >= n:
+                        break  # separator not read yet
+                    if buf[pos] not in ",]":
+                        raise ValueError(f"expected one of ',]', got {buf[pos]!r}")
+                    self.pos = pos + 1
+                    sink(v)
+                    if buf[pos] == "]":
+                        return
+                    pos += 1
+            except json.JSONDecodeError:
+                pass
+            # slow path: the next element crosses the chunk boundary
+            sink(self.value())
+            if self.expect(",]") == "]":
+                return
+
+
+def read_object(
+    fh: IO[str],
+    streams: Optional[Mapping[str, Callable[[Any], None]]] = None,
+    chunk: int = CHUNK,
+) -> Dict[str, Any]:
+    """Parse one JSON object from fh.
+
+    Arrays under a key in streams are not kept: each element is passed to
+    that key's callback as soon as it is decoded. Returns the other keys.
+    """
+    streams = streams or {}
+    r = _Reader(fh, chunk)
+    out: Dict[str, Any] = {}
+    r.expect("{")
+    if r.peek() == "}":
+        r.pos += 1
+        return out
+    while True:
+        key = r.value()
+        r.expect(":")
+        sink = streams.get(key)
+        if sink is not None and r.peek() == "[":
+            r.array(sink)
+        else:
+            out[key] = r.value()
+        if r.expect(",}") == "}":
+            return out
+
+
+def write_object(
+    fh: IO[str],
+    items: Mapping[str, Any],
+    streams: Optional[Mapping[str, Iterable[Any]]] = None,
+    indent: Optional[int] = 2,
+    head: Optional[str] = None,
+) -> None:
+    """Write items as one JSON object, then each streams array one element per line.
+
+    Streamed arrays come last so readers see every scalar before the bulk.
+    If head names a key of items, it is written first, compact, on the
+    opening line, which ends there even when indent is None.
+    """
+    pad = " " * (indent or 0)
+    nl = "\n" if indent is not None else ""
+    entries = [(k, v, False) for k, v in items.items() if k != head]
+    entries += [(k, v, True) for k, v in (streams or {}).items()]
+    fh.write("{")
+    if head is not None and head in items:
+        fh.write(json.dumps(head) + ": " + json.dumps(items[head], separators=(",", ":")) + ("," if entries else ""))
+        if not nl:
+            fh.write("\n")
+    for i, (key, value, streamed) in enumerate(entries):
+        fh.write(("," if i else "") + nl + pad + json.dumps(key) + ": ")
+        if not streamed:
+            body = json.dumps(value, indent=indent)
+            fh.write(body.replace("\n", "\n" + pad) if indent is not None else body)
+            continue
+        fh.write("[")
+        lead = nl + pad * 2
+        batch: List[str] = []
+        wrote = False
+        for elem in value:
+            batch.append(_compact(elem))
+            if len(batch) == BATCH:
+                fh.write(("," if wrote else "") + lead + ("," + lead).join(batch))
+                wrote, batch = True, []
+        if batch:
+            fh.write(("," if wrote else "") + lead + ("," + lead).join(batch))
+            wrote = True
+        fh.write((nl + pad if wrote else "") + "]")
+    fh.write(nl + "}")
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+# Current save format. Every save written by this build carries it in
+# "version"; older saves are upgraded by the steps below when read.
+SAVE_VERSION = 12
+
+Migration = Callable[[Dict[str, Any]], Dict[str, Any]]
+
+# (target version, step), kept sorted by target version
+MIGRATIONS: List[Tuple[int, Migration]] = []
+
+
+def migration(to_version: int) -> Callable[[Migration], Migration]:
+    """Register a pure dict -> dict step that brings a save up to to_version.
+
+    A step runs for every save whose version is below to_version, in
+    ascending order, so each step may assume all earlier ones have run.
+    """
+    def register(fn: Migration) -> Migration:
+        if any(v == to_version for v, _ in MIGRATIONS):
+            raise ValueError(f"duplicate migration to version {to_version}")
+        MIGRATIONS.append((to_version, fn))
+        MIGRATIONS.sort(key=lambda m: m[0])
+        return fn
+    return register
+
+
+def needs_migration(data: Dict[str, Any]) -> bool:
+    return int(data.get("version", 0) or 0) < SAVE_VERSION
+
+
+def migrate(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Return data upgraded to SAVE_VERSION; current saves are returned as-is.
+
+    Saves from a newer build are left untouched rather than guessed at.
+    """
+    version = int(data.get("version", 0) or 0)
+    if version >= SAVE_VERSION:
+        return data
+    for to_version, step in MIGRATIONS:
+        if version < to_version:
+            data = step(data)
+            data["version"] = version = to_version
+    return data
+
+
+# ---------- steps ----------
+_LEGACY_BOUNTY_FIELDS = (
+    "bounties_daily_claimed", "bounties_weekly_claimed",
+    "bounties_daily_reset_at", "bounties_weekly_reset_at",
+)
+
+
+@migration(12)
+def _legacy_bounties(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Fold the pre-manager bounty fields into "bounties_v2" and drop them.
+
+    Builds up to 11 wrote "version": 0 (the version lookup missed the
+    module constant), so this step also sees current-shape saves; it only
+    fills bounties_v2 when it is missing.
+    """
+    out = {k: v for k, v in data.items() if k not in _LEGACY_BOUNTY_FIELDS}
+    if not isinstance(data.get("bounties_v2"), dict):
+        def claimed(name: str) -> Dict[str, bool]:
+            v = data.get(name, {})
+            return {str(k): bool(b) for k, b in v.items()} if isinstance(v, dict) else {}
+
+        def reset_at(name: str) -> int:
+            try:
+                return int(data.get(name, 0)) or 0
+            except (TypeError, ValueError):
+                return 0
+
+        out["bounties_v2"] = {
+            "daily_reset_at": reset_at("bounties_daily_reset_at"),
+            "weekly_reset_at": reset_at("bounties_weekly_reset_at"),
+            "daily_claimed": claimed("bounties_daily_claimed"),
+            "weekly_claimed": claimed("bounties_weekly_claimed"),
+        }
+    return out
+
+
+# ---------- files ----------
+MIGRATED, CURRENT, NOT_A_SAVE = "migrated", "current", "not a save"
+
+
+def migrate_file(path: Path) -> str:
+    """Upgrade one save file in place, keeping its format.
+
+    Returns MIGRATED if it was rewritten, CURRENT if it was already up to
+    date, or NOT_A_SAVE for files that do not decode to a save
+    (persistence.is_save_data), which are never written. The write is
+    atomic (temp file + os.replace). A sibling journal is left alone: its
+    records are absolute values and replay over the new snapshot.
+    """
+    from ops.persistence import header_from_dict, is_save_data, read_save, write_json_atomic  # local import to avoid cycles
+    from ops.save_codec import MAGIC, is_binary_save, write_binary_atomic
+
+    path = Path(path)
+    with open(path, "rb") as fh:
+        binary = is_binary_save(fh.read(len(MAGIC)))
+    data = read_save(path)
+    if not is_save_data(data):
+        return NOT_A_SAVE
+    if not needs_migration(data):
+        return CURRENT
+    data = migrate(data)
+    data["header"] = header_from_dict(data)
+    (write_binary_atomic if binary else write_json_atomic)(path, data)
+    return MIGRATED
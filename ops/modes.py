@@ -3,6 +3,7 @@ from __future__ import annotations
 import random
 from abc import ABC, abstractmethod
 from game import Game
+from ops.slots_engine import TABLE as SLOTS_TABLE, GOLD as SLOTS_GOLD, DIAMONDS as SLOTS_DIAMONDS
 
 class GameMode(ABC):
     """Base class for a playable game mode."""
@@ -24,6 +25,7 @@ class DiceGame(GameMode):
     def play(self) -> tuple[list[int], int]:
         faces = [random.randint(1, self.game.die_sides) for _ in range(self.game.dice_count)]
         total = sum(faces)
+        self.game.mark_dirty()
         self.game.gold += total
         self.game.lifetime_gold += total
         self.game._check_unlocks()
@@ -35,23 +37,15 @@ class DiceGame(GameMode):
 
 class SlotsGame(GameMode):
     """Slots mode: spin 3 reels; jackpots award diamonds; has passive income."""
-    SYMBOLS = ["🍒", "🍋", "7️⃣", "💎", "⭐"]
+    SYMBOLS = list(SLOTS_TABLE.symbols)
 
     def play(self) -> tuple[list[str], int, int]:
-        reels = [random.choice(self.SYMBOLS) for _ in range(3)]
-        gold_won = 0
-        diamonds_won = 0
-
-        # 3 of a kind
-        if len(set(reels)) == 1:
-            if reels[0] == "💎":
-                diamonds_won = 10
-            else:
-                gold_won = 500
-        # 2 of a kind
-        elif len(set(reels)) == 2:
-            gold_won = 50
+        # 3 of a kind: 500 gold (diamonds: 10 diamonds); 2 of a kind: 50 gold
+        reels, cls = SLOTS_TABLE.spin()
+        gold_won = SLOTS_GOLD[cls]
+        diamonds_won = SLOTS_DIAMONDS[cls]
 
+        self.game.mark_dirty()
         self.game.gold += gold_won
         self.game.lifetime_gold += gold_won
         self.game.diamonds += diamonds_won
@@ -66,5 +60,6 @@ class SlotsGame(GameMode):
 
     def tick_passive(self):
         if self.game.slots_unlocked and self.game.slots_passive_income > 0:
+            self.game.mark_dirty()
             self.game.gold += self.game.slots_passive_income
             self.game.lifetime_gold += self.game.slots_passive_income
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import time
+from typing import Dict, Optional, Tuple
+
+# Defaults for offline catch-up (overridable per Game / via settings)
+OFFLINE_CAP_SECONDS = 24 * 3600
+OFFLINE_EFFICIENCY = 1.0
+
+
+def passive_rates(game) -> Tuple[float, float, float]:
+    """(gold/s before global_income_mult, shards/s, scrap/s) as Game.advance applies them."""
+    gold_ps = 0.0
+    gold_ps += game.slots_passive_income
+    gold_ps += game.roulette_passive_income
+    gold_ps += game.buildings_passive_income
+    gold_ps += game.dice_idle_income
+    shards_ps = game.shards_passive_income * game.shards_rate_mult if game.shards_passive_income > 0 else 0.0
+    scrap_ps = game.scrap_idle if game.scrap_idle > 0 else 0.0
+    return gold_ps, shards_ps, scrap_ps
+
+
+def apply_offline_progress(
+    game,
+    saved_at: float,
+    now: Optional[float] = None,
+    cap_seconds: float = OFFLINE_CAP_SECONDS,
+    efficiency: float = OFFLINE_EFFICIENCY,
+) -> Dict[str, float]:
+    """Credit passive income for the wall-clock time since saved_at in closed form.
+
+    Rates are taken from the current (freshly loaded) stats and held constant,
+    so a week away costs the same as a second: rate * seconds * efficiency,
+    with the elapsed time clamped to [0, cap_seconds].
+    """
+    if now is None:
+        now = time.time()
+    elapsed = (now - saved_at) if saved_at > 0 else 0.0
+    seconds = max(0.0, min(float(elapsed), float(cap_seconds)))
+    report = {"seconds": seconds, "gold": 0.0, "shards": 0.0, "scrap": 0.0}
+    if seconds <= 0.0 or efficiency <= 0.0:
+        return report
+    gold_ps, shards_ps, scrap_ps = passive_rates(game)
+    scale = seconds * efficiency
+    if gold_ps > 0:
+        report["gold"] = float(game._apply_income(int(gold_ps * scale)))
+    if shards_ps > 0:
+        report["shards"] = shards_ps * scale
+        game.shards += report["shards"]
+    if scrap_ps > 0:
+        report["scrap"] = scrap_ps * scale
+        game.scrap += report["scrap"]
+    return report
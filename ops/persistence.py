@@ -1,11 +1,67 @@
 from __future__ import annotations
 
-from typing import Any
+import json
+import operator
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterable, List, Optional
 
+from ops.json_stream import read_object, write_object
+from ops.migrations import SAVE_VERSION, migrate
 
-def game_to_dict(game) -> dict[str, Any]:
-    return {
-        "version": game.SAVE_VERSION if hasattr(game, 'SAVE_VERSION') else 0,
+# Fields of the save header: enough for menus and profile lists, readable
+# without parsing the save body (see probe_save).
+HEADER_FIELDS = ("version", "saved_at", "gold", "lifetime_gold", "diamonds", "inventory_size", "playtime")
+_HEADER_PREFIX = b'{"header": '
+# File suffixes bulk tools consider, and keys at least one of which every save has
+SAVE_SUFFIXES = (".json", ".bin", ".sav")
+SAVE_KEYS = ("header", "upgrades", "inv")
+
+
+# DiceInstance fields in save-record order
+DICE_FIELDS = ("uid", "template_key", "level", "stars")
+_dice_row = operator.attrgetter(*DICE_FIELDS)
+
+
+def dice_record(d) -> dict[str, Any]:
+    return {"uid": d.uid, "template_key": d.template_key, "level": d.level, "stars": getattr(d, 'stars', 0)}
+
+
+def dice_rows(inventory: Iterable[Any]) -> List[tuple]:
+    """Detached (uid, template_key, level, stars) tuples for an inventory.
+
+    The copy runs in C (attrgetter), roughly half the cost of building
+    dice_record dicts, but it is still one tuple per die: O(inventory size).
+    """
+    return list(map(_dice_row, inventory))
+
+
+def dice_records(rows: Iterable[tuple]) -> List[dict[str, Any]]:
+    """Save records (dice_record dicts) from dice_rows() tuples."""
+    return [dict(zip(DICE_FIELDS, row)) for row in rows]
+
+
+def dice_from_record(rec: dict[str, Any]):
+    from core.dice_models import DiceInstance  # local import to avoid cycles
+
+    return DiceInstance(
+        uid=int(rec["uid"]),
+        template_key=rec["template_key"],
+        level=int(rec.get("level", 1)),
+        stars=int(rec.get("stars", 0)),
+    )
+
+
+def game_to_dict(game, include_inventory: bool = True) -> dict[str, Any]:
+    # Containers are copied so the result is a detached snapshot that can be
+    # serialized off the UI thread while the game keeps mutating.
+    # include_inventory=False leaves out "inv" for writers that stream it.
+    data = {
+        "header": {},
+        "version": SAVE_VERSION,
+        "saved_at": time.time(),
+        "playtime": getattr(game, 'playtime', 0.0),
         "gold": game.gold,
         "lifetime_gold": game.lifetime_gold,
         "diamonds": game.diamonds,
@@ -16,41 +72,150 @@ def game_to_dict(game) -> dict[str, Any]:
         "slots_unlocked": game.slots_unlocked,
         "roulette_unlocked": game.roulette_unlocked,
         "upgrades": [{"key": u.key, "level": u.level} for u in game.upgrades],
-        "inv": [
-            {
-                "uid": d.uid,
-                "template_key": d.template_key,
-                "level": d.level,
-                "stars": getattr(d, 'stars', 0),
-            }
-            for d in game.inventory
-        ],
         "next_uid": game._next_uid,
-        "loadout": game.loadout,
+        "loadout": list(game.loadout),
         "crates_basic_no_rare": game.crates_basic_no_rare,
-        "crates_opened": game.crates_opened,
-        "achievements_claimed": game.achievements_claimed,
-        "achievements_seen": game.achievements_seen,
+        "crates_opened": dict(game.crates_opened),
+        "achievements_claimed": dict(game.achievements_claimed),
+        "achievements_seen": dict(game.achievements_seen),
         "counter_dice_plays": game.counter_dice_plays,
         "counter_slots_spins": game.counter_slots_spins,
         "counter_slots_wins": game.counter_slots_wins,
         "counter_roulette_spins": game.counter_roulette_spins,
         "counter_roulette_wins": game.counter_roulette_wins,
-        # legacy bounty fields retained for backward compatibility
-        "bounties_daily_claimed": getattr(game, 'bounties_daily_claimed', {}),
-        "bounties_weekly_claimed": getattr(game, 'bounties_weekly_claimed', {}),
-        "bounties_daily_reset_at": getattr(game, 'bounties_daily_reset_at', 0),
-        "bounties_weekly_reset_at": getattr(game, 'bounties_weekly_reset_at', 0),
-        # new bounty manager state
+        # bounty manager state
         "bounties_v2": game.bounties.to_dict() if hasattr(game, 'bounties') else {},
         # shop purchases
-        "shop_levels": getattr(game, 'shop_levels', {}),
+        "shop_levels": dict(getattr(game, 'shop_levels', {})),
     }
+    if include_inventory:
+        data["inv"] = [dice_record(d) for d in game.inventory]
+    data["header"] = header_from_dict(data)
+    data["header"]["inventory_size"] = len(game.inventory)
+    return data
 
 
-def game_from_dict(game, data: dict[str, Any]) -> None:
-    from core.dice_models import DiceInstance  # local import to avoid cycles
+def header_from_dict(data: dict[str, Any]) -> dict[str, Any]:
+    """Summary header of a save dict (also the fallback for saves written without one)."""
+    return {
+        "version": data.get("version", 0),
+        "saved_at": data.get("saved_at", 0.0),
+        "gold": data.get("gold", 0.0),
+        "lifetime_gold": data.get("lifetime_gold", 0.0),
+        "diamonds": data.get("diamonds", 0),
+        "inventory_size": len(data.get("inv", []) or []),
+        "playtime": data.get("playtime", 0.0),
+    }
+
+
+def write_json_atomic(path: Path, data: dict[str, Any], indent: int | None = 2,
+                      inventory: Optional[Iterable[dict[str, Any]]] = None) -> None:
+    """Write data as JSON via a temp file + os.replace, so a crash never truncates the save.
+
+    A "header" entry is written first, compact, on its own line, so
+    probe_save() can read it without parsing the rest of the file. "inv"
+    (data["inv"], or the inventory records iterable when given) is written
+    last, one record per line, never as a single string in memory.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    if inventory is None and "inv" in data:
+        inventory = data["inv"]
+    items = {k: v for k, v in data.items() if k != "inv"}
+    with open(tmp, "w", encoding="utf-8") as fh:
+        write_object(fh, items, {"inv": inventory} if inventory is not None else None, indent, head="header")
+        fh.flush()
+        os.fsync(fh.fileno())
+    os.replace(tmp, path)
+
+
+def write_bytes_atomic(path: Path, payload: bytes) -> None:
+    """Binary counterpart of write_json_atomic."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as fh:
+        fh.write(payload)
+        fh.flush()
+        os.fsync(fh.fileno())
+    os.replace(tmp, path)
+
 
+def write_game_json(path: Path, game, indent: int | None = 2) -> None:
+    """Stream a Game straight to a JSON save without building the inventory list."""
+    write_json_atomic(path, game_to_dict(game, include_inventory=False), indent,
+                      inventory=(dice_record(d) for d in game.inventory))
+
+
+def read_json_header(path: Path) -> Optional[dict[str, Any]]:
+    """Header line of a JSON save; None for binary or headerless saves."""
+    with open(path, "rb") as fh:
+        head = fh.read(len(_HEADER_PREFIX))
+        if head != _HEADER_PREFIX:
+            return None
+        line = fh.readline()
+    # decode just the header object: what follows it on the line is not parsed
+    header, _ = json.JSONDecoder().raw_decode(line.decode("utf-8"))
+    return header
+
+
+def read_json_streaming(path: Path, on_dice: Callable[[dict[str, Any]], None]) -> dict[str, Any]:
+    """Parse a JSON save, passing each "inv" record to on_dice instead of keeping the list.
+
+    Peak memory is one read chunk plus the non-inventory fields, whatever
+    the inventory size.
+    """
+    with open(path, "r", encoding="utf-8-sig") as fh:
+        return read_object(fh, {"inv": on_dice})
+
+
+def probe_save(path: Path) -> Optional[dict[str, Any]]:
+    """Read only the header of a save file (JSON or binary); None if there is no save.
+
+    Saves written before headers existed fall back to a full parse.
+    """
+    from ops.save_codec import is_binary_save, read_binary_header  # local import to avoid cycles
+
+    path = Path(path)
+    try:
+        with open(path, "rb") as fh:
+            head = fh.read(len(_HEADER_PREFIX))
+            if is_binary_save(head):
+                fh.seek(0)
+                header = read_binary_header(fh)
+                if header is not None:
+                    return header
+            elif head == _HEADER_PREFIX:
+                return read_json_header(path)
+    except FileNotFoundError:
+        return None
+    except ValueError:
+        pass
+    try:
+        return header_from_dict(read_save(path))
+    except Exception:
+        return None
+
+
+def read_save(path: Path) -> dict[str, Any]:
+    """Load a save dict from either format; binary saves are detected by their magic bytes."""
+    from ops.save_codec import decode_save, is_binary_save  # local import to avoid cycles
+
+    raw = Path(path).read_bytes()
+    if is_binary_save(raw):
+        return decode_save(raw)
+    return json.loads(raw.decode("utf-8-sig"))
+
+
+def is_save_data(data: Any) -> bool:
+    """True if a decoded file is a save, so bulk tools leave other JSON (settings.json, ...) alone."""
+    return isinstance(data, dict) and any(k in data for k in SAVE_KEYS)
+
+
+def game_from_dict(game, data: dict[str, Any], inventory: Optional[List[Any]] = None) -> None:
+    """Apply a save dict to game; inventory, when given, replaces data["inv"] (streamed loads)."""
+    data = migrate(data)  # no-op for saves already at SAVE_VERSION
     game.gold = float(data.get("gold", 0.0))
     game.lifetime_gold = float(data.get("lifetime_gold", 0.0))
     game.diamonds = int(data.get("diamonds", 0))
@@ -60,6 +225,14 @@ def game_from_dict(game, data: dict[str, Any]) -> None:
     game.base_dice = int(data.get("base_dice", 1))
     game.slots_unlocked = bool(data.get("slots_unlocked", False))
     game.roulette_unlocked = bool(data.get("roulette_unlocked", False))
+    try:
+        game.saved_at = float(data.get("saved_at", 0.0) or 0.0)
+    except Exception:
+        game.saved_at = 0.0
+    try:
+        game.playtime = float(data.get("playtime", 0.0) or 0.0)
+    except Exception:
+        game.playtime = 0.0
 
     saved_lvls = {rec.get("key"): int(rec.get("level", 0)) for rec in data.get("upgrades", [])}
     for u in game.upgrades:
@@ -67,15 +240,10 @@ def game_from_dict(game, data: dict[str, Any]) -> None:
             u.level = saved_lvls[u.key]
 
     game.inventory.clear()
-    for rec in data.get("inv", []):
-        game.inventory.append(
-            DiceInstance(
-                uid=int(rec["uid"]),
-                template_key=rec["template_key"],
-                level=int(rec.get("level", 1)),
-                stars=int(rec.get("stars", 0)),
-            )
-        )
+    if inventory is not None:
+        game.inventory.extend(inventory)
+    else:
+        game.inventory.extend(dice_from_record(rec) for rec in data.get("inv", []))
     game._next_uid = int(data.get("next_uid", len(game.inventory) + 1))
     ld = data.get("loadout", [0, 0, 0, 0, 0])
     game.loadout = [int(x) for x in (ld + [0, 0, 0, 0, 0])[:5]]
@@ -105,20 +273,9 @@ def game_from_dict(game, data: dict[str, Any]) -> None:
     game.counter_roulette_spins = int(data.get("counter_roulette_spins", 0))
     game.counter_roulette_wins = int(data.get("counter_roulette_wins", 0))
 
-    # bounties: prefer new manager state, fall back to legacy
+    # bounties (legacy fields are folded into bounties_v2 by ops/migrations.py)
     try:
-        b2 = data.get("bounties_v2")
-        if isinstance(b2, dict):
-            game.bounties.from_dict(b2)
-        else:
-            game.bounties_daily_claimed = {str(k): bool(v) for k, v in data.get("bounties_daily_claimed", {}).items()} if isinstance(data.get("bounties_daily_claimed", {}), dict) else {}
-            game.bounties_weekly_claimed = {str(k): bool(v) for k, v in data.get("bounties_weekly_claimed", {}).items()} if isinstance(data.get("bounties_weekly_claimed", {}), dict) else {}
-            game.bounties_daily_reset_at = int(data.get("bounties_daily_reset_at", 0)) or 0
-            game.bounties_weekly_reset_at = int(data.get("bounties_weekly_reset_at", 0)) or 0
-            game.bounties.daily_claimed = dict(game.bounties_daily_claimed)
-            game.bounties.weekly_claimed = dict(game.bounties_weekly_claimed)
-            game.bounties.daily_reset_at = game.bounties_daily_reset_at
-            game.bounties.weekly_reset_at = game.bounties_weekly_reset_at
+        game.bounties.from_dict(data.get("bounties_v2") or {})
     except Exception:
         pass
 
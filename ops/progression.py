@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+from typing import Dict, Iterable, Tuple
+
 from core.dice_models import DiceTemplate
 
 
@@ -84,6 +87,49 @@ def apply_stars_and_level(t: DiceTemplate, stars: int, level: int) -> DiceTempla
     )
 
 
+# ---------- effective template cache ----------
+# Interned results of apply_stars_and_level keyed by (template_key, stars, level).
+# Entries remember the source template so a replaced template under the same key
+# is recomputed instead of served stale.
+EFFECTIVE_CACHE_MAX = 4096
+_effective_lru: "OrderedDict[Tuple[str, int, int], Tuple[DiceTemplate, DiceTemplate]]" = OrderedDict()
+_effective_table: Dict[Tuple[str, int, int], Tuple[DiceTemplate, DiceTemplate]] = {}
+
+
+def effective_template(t: DiceTemplate, stars: int, level: int) -> DiceTemplate:
+    """Cached apply_stars_and_level(); returned templates are shared and immutable."""
+    key = (t.key, stars, level)
+    hit = _effective_table.get(key)
+    if hit is not None and hit[0] is t:
+        return hit[1]
+    hit = _effective_lru.get(key)
+    if hit is not None and hit[0] is t:
+        _effective_lru.move_to_end(key)
+        return hit[1]
+    eff = apply_stars_and_level(t, stars, level)
+    _effective_lru[key] = (t, eff)
+    if len(_effective_lru) > EFFECTIVE_CACHE_MAX:
+        _effective_lru.popitem(last=False)
+    return eff
+
+
+def precompute_effective_templates(templates: Iterable[DiceTemplate], max_stars: int = 10, max_level: int = 100) -> int:
+    """Fill the unbounded lookup table for every template x stars 0..max_stars x levels 1..max_level.
+
+    Optional: ~115k entries for the stock catalog. Returns the table size.
+    """
+    for t in templates:
+        for stars in range(max_stars + 1):
+            for level in range(1, max_level + 1):
+                _effective_table[(t.key, stars, level)] = (t, apply_stars_and_level(t, stars, level))
+    return len(_effective_table)
+
+
+def clear_effective_cache() -> None:
+    _effective_lru.clear()
+    _effective_table.clear()
+
+
 def level_costs(level: int) -> tuple[int, int]:
     """Return (shards_cost, scrap_cost) for next level from given level."""
     next_lvl = int(level) + 1
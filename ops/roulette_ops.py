@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+try:  # optional dependency
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+POCKETS = 37  # single-zero wheel: 0..36
+RED = frozenset({1, 3, 5, 7, 9, 12, 14, 16, 18, 19, 21, 23, 25, 27, 30, 32, 34, 36})
+COLORS: Tuple[str, ...] = tuple(
+    "green" if n == 0 else ("red" if n in RED else "black") for n in range(POCKETS)
+)
+
+# Gross return per unit staked (stake included) for a winning bet
+MULTIPLIERS = {
+    "red": 2.0, "black": 2.0, "odd": 2.0, "even": 2.0, "low": 2.0, "high": 2.0,
+    "dozen": 3.0, "column": 3.0, "street": 12.0, "split": 18.0, "number": 36.0,
+}
+EVEN_MONEY = ("red", "black", "odd", "even", "low", "high")
+
+
+@dataclass(frozen=True)
+class Bet:
+    kind: str        # a MULTIPLIERS key
+    amount: int
+    number: int = 0  # pocket ("number", "split"), 1-3 ("dozen", "column") or 1-12 ("street")
+    other: int = 0   # second pocket of a "split"
+
+    @property
+    def key(self) -> Tuple[str, int, int]:
+        if self.kind in EVEN_MONEY:
+            return (self.kind, 0, 0)
+        if self.kind == "split":
+            return ("split",) + tuple(sorted((self.number, self.other)))
+        return (self.kind, self.number, 0)
+
+
+def _cells(kind: str, number: int, other: int) -> FrozenSet[int]:
+    """Pockets a bet covers on the standard layout (three columns, twelve streets)."""
+    table = range(1, POCKETS)
+    if kind in ("red", "black"):
+        return frozenset(p for p in table if COLORS[p] == kind)
+    if kind in ("odd", "even"):
+        return frozenset(p for p in table if p % 2 == (kind == "odd"))
+    if kind in ("low", "high"):
+        return frozenset(p for p in table if (p <= 18) == (kind == "low"))
+    if kind == "dozen":
+        return frozenset(range(12 * number - 11, 12 * number + 1))
+    if kind == "column":
+        return frozenset(range(number, POCKETS, 3))
+    if kind == "street":
+        return frozenset(range(3 * number - 2, 3 * number + 1))
+    if kind == "split":
+        return frozenset((number, other))
+    return frozenset((number,))
+
+
+def _splits() -> List[Tuple[int, int]]:
+    pairs = [(0, 1), (0, 2), (0, 3)]
+    for p in range(1, POCKETS):
+        if p % 3:
+            pairs.append((p, p + 1))  # side by side in a street
+        if p + 3 < POCKETS:
+            pairs.append((p, p + 3))  # one street apart in a column
+    return sorted(pairs)
+
+
+# Every bet on the board, one matrix column each
+BET_TYPES: Tuple[Tuple[str, int, int], ...] = (
+    tuple((k, 0, 0) for k in EVEN_MONEY)
+    + tuple(("dozen", d, 0) for d in (1, 2, 3))
+    + tuple(("column", c, 0) for c in (1, 2, 3))
+    + tuple(("street", s, 0) for s in range(1, 13))
+    + tuple(("split", a, b) for a, b in _splits())
+    + tuple(("number", n, 0) for n in range(POCKETS))
+)
+COLUMN: Dict[Tuple[str, int, int], int] = {key: i for i, key in enumerate(BET_TYPES)}
+
+# pocket x bet-type gross multiples: row p is what every unit on each bet returns if p comes up
+MATRIX: Tuple[Tuple[float, ...], ...] = tuple(
+    tuple(MULTIPLIERS[k] if p in _cells(k, a, b) else 0.0 for k, a, b in BET_TYPES)
+    for p in range(POCKETS)
+)
+_MATRIX = np.array(MATRIX) if np is not None else None
+
+
+def payout_vector(bet: Bet) -> Tuple[float, ...]:
+    """The bet's column: its gross multiple for each of the 37 pockets."""
+    i = COLUMN.get(bet.key)
+    if i is None:
+        raise ValueError(f"unknown roulette bet {bet.kind!r} {bet.number}")
+    return tuple(row[i] for row in MATRIX)
+
+
+def stake_vector(bets: Sequence[Bet]) -> List[int]:
+    """Total stake per bet type (BET_TYPES order); same-type bets are merged."""
+    stakes = [0] * len(BET_TYPES)
+    for b in bets:
+        i = COLUMN.get(b.key)
+        if i is None:
+            raise ValueError(f"unknown roulette bet {b.kind!r} {b.number}")
+        stakes[i] += b.amount
+    return stakes
+
+
+def _gross(pocket: int, stakes: Sequence[int]) -> float:
+    """One spin: the pocket's matrix row dotted with the stake vector."""
+    if _MATRIX is not None:
+        return float(_MATRIX[pocket] @ np.asarray(stakes, dtype=np.float64))
+    return sum(m * s for m, s in zip(MATRIX[pocket], stakes) if s)
+
+
+def _gross_all(stakes: Sequence[int]) -> List[float]:
+    """Gross return of every pocket at once: MATRIX @ stakes."""
+    if _MATRIX is not None:
+        return (_MATRIX @ np.asarray(stakes, dtype=np.float64)).tolist()
+    return [_gross(p, stakes) for p in range(POCKETS)]
+
+
+def check_bets(game, bets: Sequence[Bet], n: int = 1) -> Optional[str]:
+    """Why the bets cannot be placed n times, or None if they can.
+
+    roulette_max_bet caps the total staked on one spin across the whole
+    board, as it capped the single bet before the board existed. A per-bet
+    cap would let a board cover every pocket at the limit.
+    """
+    if not game.roulette_unlocked:
+        return "Roulette is locked."
+    if not bets:
+        return "No bets placed."
+    if any(b.amount <= 0 for b in bets):
+        return f"Bet must be 1–{game.roulette_max_bet}."
+    try:
+        stakes = stake_vector(bets)
+    except ValueError as e:
+        return str(e)
+    if sum(stakes) > game.roulette_max_bet:
+        return f"{'Bet' if len(bets) == 1 else 'Total bet'} must be 1–{game.roulette_max_bet}."
+    if sum(stakes) * max(1, n) > game.gold:
+        return "Not enough gold."
+    return None
+
+
+def _pay(game, gross: float) -> Tuple[int, float]:
+    """Gold and shards for a spin that returns gross (stake included) before bonuses.
+
+    Gold is int(gross * (1 + roulette_payout_bonus_total)), then
+    global_income_mult with rounding; shards are a trickle of
+    max(0.5, gained / 1000) on any win.
+    """
+    if gross <= 0.0:
+        return 0, 0.0
+    bonus = 1.0 + game.roulette_payout_bonus_total
+    gained = int(round(int(gross * bonus) * game.global_income_mult))
+    return gained, max(0.5, gained / 1000.0)
+
+
+def _settle(game, stake: int, spins: int, outcomes: Iterable[Tuple[float, int]]) -> Dict[str, Any]:
+    """Apply a batch given (gross, how many spins returned it): stakes, winnings, shards, counters."""
+    gained = 0
+    shards = 0.0
+    wins = 0
+    for gross, count in outcomes:
+        if count and gross > 0.0:
+            g, s = _pay(game, gross)
+            gained += g * count
+            shards += s * count
+            wins += count
+    game.mark_dirty()
+    game.gold -= stake
+    game._credit_gold(gained)
+    game.shards += shards
+    game.counter_roulette_spins += spins
+    game.counter_roulette_wins += wins
+    return {"spins": spins, "stake": stake, "gained": gained, "shards": shards, "wins": wins}
+
+
+def spin(game, bet: Bet | Sequence[Bet], rng: Optional[random.Random] = None) -> Dict[str, Any]:
+    """One spin; raises ValueError (with a player-facing message) if the bets cannot be placed."""
+    bets = [bet] if isinstance(bet, Bet) else list(bet)
+    err = check_bets(game, bets)
+    if err:
+        raise ValueError(err)
+    stakes = stake_vector(bets)
+    pocket = (rng or random).randrange(POCKETS)
+    out = _settle(game, sum(stakes), 1, [(_gross(pocket, stakes), 1)])
+    out.update(pocket=pocket, color=COLORS[pocket], win=out["wins"] > 0)
+    return out
+
+
+def spin_many(game, bets: Sequence[Bet], n: int, rng: Optional[Any] = None) -> Dict[str, Any]:
+    """n spins of the same bets, settled once from per-pocket counts.
+
+    n is capped at what the current gold covers, so the batch never
+    stakes gold it does not have; "spins" reports how many ran. With NumPy
+    the pocket counts are one multinomial draw (rng a numpy Generator).
+    """
+    bets = list(bets)
+    stake = sum(b.amount for b in bets)
+    n = min(max(0, int(n)), int(game.gold // stake) if stake > 0 else 0)
+    err = check_bets(game, bets, n)
+    if err:
+        raise ValueError(err)
+    if np is not None:
+        rng = rng if rng is not None else np.random.default_rng()
+        counts = rng.multinomial(n, [1.0 / POCKETS] * POCKETS).tolist()
+    else:
+        counts = [0] * POCKETS
+        for p in (rng or random).choices(range(POCKETS), k=n):
+            counts[p] += 1
+    out = _settle(game, stake * n, n, zip(_gross_all(stake_vector(bets)), counts))
+    out["counts"] = counts
+    return out
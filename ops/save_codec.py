@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import json
+import struct
+import sys
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple
+
+from ops.persistence import write_bytes_atomic
+
+# Binary save layout (all little-endian):
+#   header   MAGIC, codec version, save version (the dict's "version"),
+#            then u32 length + compact JSON of the summary header (v2+)
+#   strings  u32 count, then (u16 length, utf-8 bytes) per entry
+#   scalars  one struct for every Scalar field
+#   tables   per Table: u32 rows, then one packed column per field
+#   extra    u32 length + compact JSON of every key not covered by the schema
+MAGIC = b"IDSB"
+CODEC_VERSION = 2
+_HEADER = struct.Struct("<4sHH")
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+
+STR = "str"  # column kind: index into the string table
+
+
+@dataclass(frozen=True)
+class Scalar:
+    name: str
+    fmt: str               # struct code
+    default: Any = 0
+
+
+@dataclass(frozen=True)
+class Table:
+    name: str
+    columns: Tuple[Tuple[str, str], ...]  # (field, array typecode or STR)
+    defaults: Tuple[Tuple[str, Any], ...] = ()
+
+
+# One declarative description of the save; encoders/decoders are compiled from it.
+SAVE_SCHEMA: Tuple = (
+    Scalar("saved_at", "d", 0.0),
+    Scalar("playtime", "d", 0.0),
+    Scalar("gold", "d", 0.0),
+    Scalar("lifetime_gold", "d", 0.0),
+    Scalar("diamonds", "q"),
+    Scalar("shards", "d", 0.0),
+    Scalar("scrap", "d", 0.0),
+    Scalar("scrap_idle", "d", 0.0),
+    Scalar("base_dice", "q", 1),
+    Scalar("slots_unlocked", "?", False),
+    Scalar("roulette_unlocked", "?", False),
+    Scalar("next_uid", "q", 1),
+    Scalar("crates_basic_no_rare", "q"),
+    Scalar("counter_dice_plays", "q"),
+    Scalar("counter_slots_spins", "q"),
+    Scalar("counter_slots_wins", "q"),
+    Scalar("counter_roulette_spins", "q"),
+    Scalar("counter_roulette_wins", "q"),
+    Table("upgrades", (("key", STR), ("level", "i"))),
+    Table("inv", (("uid", "q"), ("template_key", STR), ("level", "i"), ("stars", "i")),
+          defaults=(("level", 1), ("stars", 0))),
+)
+
+# Scalar layout per codec version: the packed block has no field names, so a
+# file must be decoded with the schema it was written with. v1 predates playtime.
+SCHEMAS: Dict[int, Tuple] = {
+    1: tuple(f for f in SAVE_SCHEMA if f.name != "playtime"),
+    CODEC_VERSION: SAVE_SCHEMA,
+}
+
+
+def _typecode(code: str) -> str:
+    return "I" if code == STR else code
+
+
+class SaveCodec:
+    """Binary encoder/decoder compiled from a declarative schema.
+
+    Operates on the plain dict produced by game_to_dict / consumed by
+    game_from_dict, so it slots in behind the existing to_dict/from_dict API.
+    Scalars are packed with a single precompiled struct, table columns as
+    packed arrays, and string-valued columns as indices into a string table.
+    """
+
+    def __init__(self, schema: Tuple, legacy: Optional[Dict[int, Tuple]] = None) -> None:
+        self.scalars: List[Scalar] = [f for f in schema if isinstance(f, Scalar)]
+        self.tables: List[Table] = [f for f in schema if isinstance(f, Table)]
+        self._scalar_struct = struct.Struct("<" + "".join(s.fmt for s in self.scalars))
+        self._known = {f.name for f in schema} | {"version", "header"}
+        self._swap = sys.byteorder != "little"
+        self._int_scalar = [s.fmt not in ("d", "f", "?") for s in self.scalars]
+        # older codec versions decode with their own compiled layout
+        self._legacy = {v: SaveCodec(s) for v, s in (legacy or {}).items() if s != schema}
+
+    # ---------- encode ----------
+    def encode(self, data: Dict[str, Any]) -> bytes:
+        strings: Dict[str, int] = {}
+        out: List[bytes] = []
+        vals = []
+        for s, is_int in zip(self.scalars, self._int_scalar):
+            v = data.get(s.name, s.default)
+            vals.append(int(v) if is_int else (bool(v) if s.fmt == "?" else float(v)))
+        body = [self._scalar_struct.pack(*vals)]
+        for t in self.tables:
+            rows = data.get(t.name, []) or []
+            body.append(_U32.pack(len(rows)))
+            defaults = dict(t.defaults)
+            for field, code in t.columns:
+                if code == STR:
+                    col = array("I", [strings.setdefault(str(r[field]), len(strings)) for r in rows])
+                else:
+                    d = defaults.get(field, 0)
+                    col = array(code, [int(r.get(field, d)) for r in rows])
+                if self._swap:
+                    col.byteswap()
+                body.append(col.tobytes())
+        extra = {k: v for k, v in data.items() if k not in self._known}
+        blob = json.dumps(extra, separators=(",", ":")).encode("utf-8")
+        body.append(_U32.pack(len(blob)))
+        body.append(blob)
+
+        out.append(_HEADER.pack(MAGIC, CODEC_VERSION, int(data.get("version", 0))))
+        summary = json.dumps(data.get("header", {}), separators=(",", ":")).encode("utf-8")
+        out.append(_U32.pack(len(summary)))
+        out.append(summary)
+        out.append(_U32.pack(len(strings)))
+        for s in strings:  # dicts keep insertion order == index order
+            b = s.encode("utf-8")
+            out.append(_U16.pack(len(b)))
+            out.append(b)
+        out.extend(body)
+        return b"".join(out)
+
+    # ---------- decode ----------
+    def decode(self, buf: bytes) -> Dict[str, Any]:
+        mv = memoryview(buf)
+        magic, codec_ver, save_ver = _HEADER.unpack_from(mv, 0)
+        if magic != MAGIC:
+            raise ValueError("not a binary save")
+        if codec_ver > CODEC_VERSION:
+            raise ValueError(f"binary save codec v{codec_ver} is newer than supported v{CODEC_VERSION}")
+        pos = _HEADER.size
+        header = None
+        if codec_ver >= 2:
+            (ln,) = _U32.unpack_from(mv, pos); pos += 4
+            header = json.loads(bytes(mv[pos:pos + ln]).decode("utf-8")); pos += ln
+        (n,) = _U32.unpack_from(mv, pos); pos += 4
+        strings: List[str] = []
+        for _ in range(n):
+            (ln,) = _U16.unpack_from(mv, pos); pos += 2
+            strings.append(bytes(mv[pos:pos + ln]).decode("utf-8")); pos += ln
+
+        data: Dict[str, Any] = {"version": save_ver}
+        if header is not None:
+            data["header"] = header
+        layout = self._legacy.get(codec_ver, self)
+        data.update(zip((s.name for s in layout.scalars), layout._scalar_struct.unpack_from(mv, pos)))
+        pos += layout._scalar_struct.size
+        for t in layout.tables:
+            (rows,) = _U32.unpack_from(mv, pos); pos += 4
+            cols = []
+            for _field, code in t.columns:
+                col = array(_typecode(code))
+                size = rows * col.itemsize
+                col.frombytes(mv[pos:pos + size]); pos += size
+                if self._swap:
+                    col.byteswap()
+                cols.append([strings[i] for i in col] if code == STR else col.tolist())
+            names = [f for f, _ in t.columns]
+            data[t.name] = [dict(zip(names, row)) for row in zip(*cols)] if rows else []
+        (ln,) = _U32.unpack_from(mv, pos); pos += 4
+        data.update(json.loads(bytes(mv[pos:pos + ln]).decode("utf-8")))
+        return data
+
+
+def compile_codec(schema: Tuple = SAVE_SCHEMA) -> SaveCodec:
+    return SaveCodec(schema, legacy=SCHEMAS if schema is SAVE_SCHEMA else None)
+
+
+_CODEC = compile_codec()
+encode_save: Callable[[Dict[str, Any]], bytes] = _CODEC.encode
+decode_save: Callable[[bytes], Dict[str, Any]] = _CODEC.decode
+
+
+def is_binary_save(head: bytes) -> bool:
+    return head[:len(MAGIC)] == MAGIC
+
+
+def read_binary_header(fh: BinaryIO) -> Optional[Dict[str, Any]]:
+    """Read just the summary header from an open binary save (None for v1 files)."""
+    magic, codec_ver, _save_ver = _HEADER.unpack(fh.read(_HEADER.size))
+    if magic != MAGIC or codec_ver < 2:
+        return None
+    (ln,) = _U32.unpack(fh.read(4))
+    return json.loads(fh.read(ln).decode("utf-8"))
+
+
+def write_binary_atomic(path: Path, data: Dict[str, Any]) -> None:
+    """SaveService-compatible writer for the binary format."""
+    write_bytes_atomic(path, encode_save(data))
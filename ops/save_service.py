@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from ops.persistence import dice_records, dice_rows, game_to_dict, write_json_atomic
+from ops.save_store import currency_values
+from ops.snapshots import SnapshotRing
+
+# Default minimum spacing between background writes (seconds)
+SAVE_INTERVAL = 5.0
+# Default spacing between snapshot-ring entries (seconds)
+SNAPSHOT_INTERVAL = 600.0
+
+
+class SaveService:
+    """Debounced background writer for Game saves.
+
+    request() is cheap and meant to be called every tick: it does nothing
+    unless Game.dirty_gen moved since the last save and the interval has
+    elapsed. The snapshot is taken on the caller's thread: game_to_dict
+    without "inv", plus the inventory as dice_rows() tuples, which the
+    worker expands into records. That copy is still O(inventory size) on
+    the caller's thread; only the record dicts, JSON encoding and the
+    atomic temp-file + os.replace write are off it. Only the newest
+    pending snapshot is kept, so bursts of changes coalesce into one write.
+
+    With a SnapshotRing, at most every snapshot_interval seconds the same
+    detached snapshot is also compressed into the ring and the ring pruned,
+    on the same worker.
+
+    With a currency_writer, a save where only currencies changed since the
+    last full save (Game.state_gen unchanged) skips to_dict: it copies
+    those few fields (currency_values) and hands them to currency_writer,
+    e.g. SqliteSaveStore.update_currencies. If the writer reports that the
+    fast path did not apply, the next request is a full save.
+    """
+
+    def __init__(
+        self,
+        game,
+        path: Path,
+        interval: float = SAVE_INTERVAL,
+        writer: Callable[[Path, dict], None] = write_json_atomic,
+        snapshots: Optional[SnapshotRing] = None,
+        snapshot_interval: float = SNAPSHOT_INTERVAL,
+        currency_writer: Optional[Callable[[dict], bool]] = None,
+    ) -> None:
+        self.game = game
+        self.path = Path(path)
+        self.interval = float(interval)
+        self._writer = writer
+        self.snapshots = snapshots
+        self.snapshot_interval = float(snapshot_interval)
+        self._saved_gen = game.dirty_gen
+        self._currency_writer = currency_writer
+        self._saved_state_gen = -1  # the first save is always full
+        self._pending_currencies: Optional[dict[str, Any]] = None
+        self._last_request = 0.0
+        self._last_snapshot = float("-inf")  # first save also seeds the ring
+        self._pending: Optional[tuple[dict[str, Any], list]] = None
+        self._pending_save = False
+        self._pending_snapshot = False
+        self._cv = threading.Condition()
+        self._busy = False
+        self._stopped = False
+        self.last_error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, name="save-writer", daemon=True)
+        self._thread.start()
+
+    # ---------- UI thread ----------
+    def request(self, force: bool = False) -> bool:
+        """Queue a snapshot if state changed and the debounce interval passed."""
+        gen = self.game.dirty_gen
+        if gen == self._saved_gen:
+            return False
+        now = time.monotonic()
+        if not force and now - self._last_request < self.interval:
+            return False
+        self._last_request = now
+        snapshot = self._snapshot_due(now)
+        state_gen = self.game.state_gen
+        if self._currency_writer is not None and not snapshot and state_gen == self._saved_state_gen:
+            with self._cv:
+                self._pending_currencies = currency_values(self.game)
+                self._cv.notify()
+        else:
+            self._queue(self._take(), save=True, snapshot=snapshot)
+            self._saved_state_gen = state_gen
+        self._saved_gen = gen
+        return True
+
+    def request_snapshot(self, force: bool = False) -> bool:
+        """Queue a ring snapshot only (journal mode, where the journal owns the save file)."""
+        if self.snapshots is None or not (self._snapshot_due(time.monotonic()) or force):
+            return False
+        self._queue(self._take(), save=False, snapshot=True)
+        return True
+
+    def _take(self) -> tuple[dict[str, Any], list]:
+        return game_to_dict(self.game, include_inventory=False), dice_rows(self.game.inventory)
+
+    def _snapshot_due(self, now: float) -> bool:
+        if self.snapshots is None or now - self._last_snapshot < self.snapshot_interval:
+            return False
+        self._last_snapshot = now
+        return True
+
+    def _queue(self, snap: tuple[dict[str, Any], list], save: bool, snapshot: bool) -> None:
+        with self._cv:
+            self._pending = snap
+            if save:
+                self._pending_currencies = None  # the full snapshot is newer
+            self._pending_save |= save
+            self._pending_snapshot |= snapshot
+            self._cv.notify()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Queue any unsaved state and wait until it is on disk (call on exit)."""
+        self.request(force=True)
+        with self._cv:
+            return self._cv.wait_for(
+                lambda: self._pending is None and self._pending_currencies is None and not self._busy, timeout)
+
+    def mark_saved(self) -> None:
+        """Treat the current state as persisted (e.g. after a synchronous Game.save)."""
+        self._saved_gen = self.game.dirty_gen
+        self._saved_state_gen = self.game.state_gen
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        self.flush(timeout)
+        with self._cv:
+            self._stopped = True
+            self._cv.notify()
+        self._thread.join(timeout)
+
+    # ---------- worker ----------
+    def _write(self, snap: dict[str, Any]) -> None:
+        try:
+            self._writer(self.path, snap)
+        except Exception as e:  # keep the worker alive; surfaced via last_error
+            self._saved_state_gen = -1  # later currency-only saves must not skip this state
+            self.last_error = e
+
+    def _write_currencies(self, values: dict[str, Any]) -> None:
+        try:
+            if not self._currency_writer(values):
+                self._saved_state_gen = -1  # no row to update yet: next save is full
+        except Exception as e:
+            self._saved_state_gen = -1
+            self.last_error = e
+
+    def _snapshot(self, snap: dict[str, Any]) -> None:
+        try:
+            self.snapshots.write(snap)
+            self.snapshots.prune()
+        except Exception as e:
+            self.last_error = e
+
+    def _run(self) -> None:
+        while True:
+            with self._cv:
+                self._cv.wait_for(
+                    lambda: self._pending is not None or self._pending_currencies is not None or self._stopped)
+                if self._pending is None and self._pending_currencies is None:
+                    return
+                taken, save, snapshot = self._pending, self._pending_save, self._pending_snapshot
+                currencies = self._pending_currencies
+                self._pending = self._pending_currencies = None
+                self._pending_save = self._pending_snapshot = False
+                self._busy = True
+            self.last_error = None
+            try:
+                snap = None
+                if taken is not None:
+                    snap, rows = taken
+                    snap["inv"] = dice_records(rows)
+                if save:
+                    self._write(snap)
+                # a failed save must not cost the snapshot, which is the fallback for it
+                if snapshot:
+                    self._snapshot(snap)
+                # queued after snap, so newer than it
+                if currencies is not None:
+                    self._write_currencies(currencies)
+            finally:
+                with self._cv:
+                    self._busy = False
+                    self._cv.notify_all()
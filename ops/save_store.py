@@ -0,0 +1,351 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ops.persistence import HEADER_FIELDS, header_from_dict, probe_save, read_save, write_json_atomic
+from ops.save_codec import SAVE_SCHEMA, Scalar
+
+DEFAULT_PROFILE = "default"
+
+SaveDict = Dict[str, Any]
+
+
+class SaveStore(ABC):
+    """Where save dicts (game_to_dict format) live, keyed by profile id."""
+
+    @abstractmethod
+    def exists(self, profile: str = DEFAULT_PROFILE) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def load(self, profile: str = DEFAULT_PROFILE) -> Optional[SaveDict]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def save(self, profile: str, data: SaveDict) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, profile: str = DEFAULT_PROFILE) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def profiles(self) -> List[str]:
+        raise NotImplementedError
+
+    def probe(self, profile: str = DEFAULT_PROFILE) -> Optional[SaveDict]:
+        """Summary header of a profile without a full load; None if it has no save."""
+        data = self.load(profile)
+        return header_from_dict(data) if data is not None else None
+
+    def summaries(self) -> Dict[str, SaveDict]:
+        """Headers of every profile, for profile pickers."""
+        out = {}
+        for p in self.profiles():
+            h = self.probe(p)
+            if h is not None:
+                out[p] = h
+        return out
+
+    def load_many(self, profiles: Iterable[str]) -> Dict[str, SaveDict]:
+        out = {}
+        for p in profiles:
+            data = self.load(p)
+            if data is not None:
+                out[p] = data
+        return out
+
+    def save_many(self, items: Iterable[Tuple[str, SaveDict]]) -> None:
+        for profile, data in items:
+            self.save(profile, data)
+
+    def close(self) -> None:
+        pass
+
+
+# ============================================================
+# JSON files (the original format)
+# ============================================================
+
+class JsonSaveStore(SaveStore):
+    """One JSON file per profile; the default profile is the classic save path."""
+
+    def __init__(self, default_path: Path) -> None:
+        self.default_path = Path(default_path)
+        self.dir = self.default_path.parent
+
+    def path_for(self, profile: str) -> Path:
+        if profile == DEFAULT_PROFILE:
+            return self.default_path
+        return self.dir / f"profile_{profile}.json"
+
+    def exists(self, profile: str = DEFAULT_PROFILE) -> bool:
+        return self.path_for(profile).exists()
+
+    def load(self, profile: str = DEFAULT_PROFILE) -> Optional[SaveDict]:
+        p = self.path_for(profile)
+        return read_save(p) if p.exists() else None
+
+    def probe(self, profile: str = DEFAULT_PROFILE) -> Optional[SaveDict]:
+        return probe_save(self.path_for(profile))
+
+    def save(self, profile: str, data: SaveDict) -> None:
+        write_json_atomic(self.path_for(profile), data)
+
+    def delete(self, profile: str = DEFAULT_PROFILE) -> None:
+        p = self.path_for(profile)
+        if p.exists():
+            p.unlink()
+
+    def profiles(self) -> List[str]:
+        out = [DEFAULT_PROFILE] if self.default_path.exists() else []
+        out.extend(p.stem[len("profile_"):] for p in sorted(self.dir.glob("profile_*.json")))
+        return out
+
+
+# ============================================================
+# SQLite (WAL), normalized per profile
+# ============================================================
+
+_SCALAR_DEFS: Tuple[Scalar, ...] = tuple(f for f in SAVE_SCHEMA if isinstance(f, Scalar))
+SCALARS: Tuple[str, ...] = tuple(f.name for f in _SCALAR_DEFS)
+_CHUNK = 500  # profiles per IN (...) query, well under SQLite's variable limit
+_NORMALIZED = set(SCALARS) | {"version", "header", "upgrades", "inv", "achievements_claimed",
+                               "achievements_seen", "bounties_v2"}
+CURRENCIES: Tuple[str, ...] = ("gold", "lifetime_gold", "diamonds", "shards", "scrap")
+
+_SCHEMA_SQL = f"""
+CREATE TABLE IF NOT EXISTS profiles (
+    id TEXT PRIMARY KEY,
+    version INTEGER NOT NULL DEFAULT 0,
+    inventory_size INTEGER NOT NULL DEFAULT 0,
+    {", ".join(f"{f.name} {'REAL' if f.fmt == 'd' else 'INTEGER'}" for f in _SCALAR_DEFS)},
+    extra TEXT NOT NULL DEFAULT '{{}}'
+);
+CREATE TABLE IF NOT EXISTS upgrades (
+    profile TEXT NOT NULL, key TEXT NOT NULL, level INTEGER NOT NULL,
+    PRIMARY KEY (profile, key)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS inventory (
+    profile TEXT NOT NULL, uid INTEGER NOT NULL, template_key TEXT NOT NULL,
+    level INTEGER NOT NULL, stars INTEGER NOT NULL,
+    PRIMARY KEY (profile, uid)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS achievements (
+    profile TEXT NOT NULL, key TEXT NOT NULL, claimed INTEGER NOT NULL, seen INTEGER NOT NULL,
+    PRIMARY KEY (profile, key)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS bounty_periods (
+    profile TEXT NOT NULL, period TEXT NOT NULL, reset_at INTEGER NOT NULL, keys TEXT NOT NULL,
+    PRIMARY KEY (profile, period)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS bounties (
+    profile TEXT NOT NULL, period TEXT NOT NULL, key TEXT NOT NULL, claimed INTEGER NOT NULL,
+    PRIMARY KEY (profile, period, key)
+) WITHOUT ROWID;
+"""
+_CHILD_TABLES = ("upgrades", "inventory", "achievements", "bounty_periods", "bounties")
+
+_UPSERT_PROFILE = (
+    f"INSERT OR REPLACE INTO profiles (id, version, inventory_size, {', '.join(SCALARS)}, extra) "
+    f"VALUES (?, ?, ?, {', '.join('?' for _ in SCALARS)}, ?)"
+)
+# hot path: constant SQL text, so sqlite3's statement cache keeps it prepared
+_UPDATE_CURRENCIES = (
+    f"UPDATE profiles SET {', '.join(f'{c} = ?' for c in CURRENCIES + ('playtime',))}, saved_at = ? WHERE id = ?"
+)
+
+
+def currency_values(game) -> SaveDict:
+    """The fields update_currencies writes, copied off the game (cheap; no to_dict)."""
+    values = {c: getattr(game, c) for c in CURRENCIES}
+    values["playtime"] = game.playtime
+    values["saved_at"] = time.time()
+    return values
+
+
+class SqliteSaveStore(SaveStore):
+    """Many profiles in one SQLite database (WAL mode).
+
+    Scalars live in `profiles`; upgrades, inventory, achievements and
+    bounties are normalized child tables keyed by profile id. Fields the
+    schema does not normalize (loadout, crates, shop levels, legacy bounty
+    fields) ride along as JSON in profiles.extra. Safe to call from the
+    SaveService worker thread.
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._con = sqlite3.connect(str(self.db_path), check_same_thread=False, cached_statements=256)
+        self._con.execute("PRAGMA journal_mode=WAL")
+        self._con.execute("PRAGMA synchronous=NORMAL")
+        self._con.executescript(_SCHEMA_SQL)
+        # columns added to the schema after the database was created
+        have = {r[1] for r in self._con.execute("PRAGMA table_info(profiles)")}
+        if "inventory_size" not in have:
+            self._con.execute("ALTER TABLE profiles ADD COLUMN inventory_size INTEGER NOT NULL DEFAULT 0")
+            self._con.execute("UPDATE profiles SET inventory_size = "
+                              "(SELECT COUNT(*) FROM inventory WHERE inventory.profile = profiles.id)")
+        for f in _SCALAR_DEFS:
+            if f.name not in have:
+                self._con.execute(
+                    f"ALTER TABLE profiles ADD COLUMN {f.name} {'REAL' if f.fmt == 'd' else 'INTEGER'} DEFAULT {f.default!r}"
+                )
+        self._con.commit()
+
+    # ---------- queries ----------
+    def exists(self, profile: str = DEFAULT_PROFILE) -> bool:
+        with self._lock:
+            return self._con.execute("SELECT 1 FROM profiles WHERE id = ?", (profile,)).fetchone() is not None
+
+    def profiles(self) -> List[str]:
+        with self._lock:
+            return [r[0] for r in self._con.execute("SELECT id FROM profiles ORDER BY id")]
+
+    def load(self, profile: str = DEFAULT_PROFILE) -> Optional[SaveDict]:
+        return self.load_many([profile]).get(profile)
+
+    def probe(self, profile: str = DEFAULT_PROFILE) -> Optional[SaveDict]:
+        return self.summaries([profile]).get(profile)
+
+    def summaries(self, profiles: Optional[Iterable[str]] = None) -> Dict[str, SaveDict]:
+        """Headers straight from the profiles table; no child rows are read."""
+        sql = f"SELECT id, {', '.join(HEADER_FIELDS)} FROM profiles"
+        with self._lock:
+            if profiles is None:
+                rows = self._con.execute(sql).fetchall()
+            else:
+                ids = list(dict.fromkeys(profiles))
+                rows = []
+                for i in range(0, len(ids), _CHUNK):
+                    chunk = ids[i:i + _CHUNK]
+                    rows += self._con.execute(f"{sql} WHERE id IN ({', '.join('?' for _ in chunk)})", chunk).fetchall()
+        return {row[0]: dict(zip(HEADER_FIELDS, row[1:])) for row in rows}
+
+    def load_many(self, profiles: Iterable[str]) -> Dict[str, SaveDict]:
+        ids = list(dict.fromkeys(profiles))
+        out: Dict[str, SaveDict] = {}
+        with self._lock:
+            for i in range(0, len(ids), _CHUNK):
+                self._read_chunk(ids[i:i + _CHUNK], out)
+        return out
+
+    def _read_chunk(self, ids: List[str], out: Dict[str, SaveDict]) -> None:
+        con = self._con
+        where = f"IN ({', '.join('?' for _ in ids)})"
+        cols = ("version",) + SCALARS
+        for row in con.execute(f"SELECT id, {', '.join(cols)}, extra FROM profiles WHERE id {where}", ids):
+            data: SaveDict = json.loads(row[-1])
+            data.update(zip(cols, row[1:-1]))
+            for name in ("slots_unlocked", "roulette_unlocked"):
+                data[name] = bool(data[name])
+            data.update(upgrades=[], inv=[], achievements_claimed={}, achievements_seen={},
+                        bounties_v2={"daily_claimed": {}, "weekly_claimed": {}})
+            out[row[0]] = data
+        for p, key, level in con.execute(f"SELECT profile, key, level FROM upgrades WHERE profile {where}", ids):
+            out[p]["upgrades"].append({"key": key, "level": level})
+        for p, uid, tk, level, stars in con.execute(
+            f"SELECT profile, uid, template_key, level, stars FROM inventory WHERE profile {where}", ids
+        ):
+            out[p]["inv"].append({"uid": uid, "template_key": tk, "level": level, "stars": stars})
+        for p, key, claimed, seen in con.execute(
+            f"SELECT profile, key, claimed, seen FROM achievements WHERE profile {where}", ids
+        ):
+            if claimed:
+                out[p]["achievements_claimed"][key] = True
+            if seen:
+                out[p]["achievements_seen"][key] = True
+        for p, period, reset_at, keys in con.execute(
+            f"SELECT profile, period, reset_at, keys FROM bounty_periods WHERE profile {where}", ids
+        ):
+            b = out[p]["bounties_v2"]
+            b[f"{period}_reset_at"] = reset_at
+            b[f"{period}_keys"] = json.loads(keys)
+        for p, period, key, claimed in con.execute(
+            f"SELECT profile, period, key, claimed FROM bounties WHERE profile {where}", ids
+        ):
+            out[p]["bounties_v2"][f"{period}_claimed"][key] = bool(claimed)
+
+    # ---------- writes ----------
+    def save(self, profile: str, data: SaveDict) -> None:
+        self.save_many([(profile, data)])
+
+    def save_many(self, items: Iterable[Tuple[str, SaveDict]]) -> None:
+        """Write many profiles in a single transaction."""
+        with self._lock, self._con:
+            cur = self._con.cursor()
+            for profile, data in items:
+                self._write(cur, profile, data)
+
+    def _write(self, cur: sqlite3.Cursor, profile: str, data: SaveDict) -> None:
+        extra = {k: v for k, v in data.items() if k not in _NORMALIZED}
+        cur.execute(_UPSERT_PROFILE, (
+            profile, int(data.get("version", 0)), len(data.get("inv", []) or []),
+            *(data.get(f.name, f.default) for f in _SCALAR_DEFS),
+            json.dumps(extra, separators=(",", ":")),
+        ))
+        for table in _CHILD_TABLES:
+            cur.execute(f"DELETE FROM {table} WHERE profile = ?", (profile,))
+        cur.executemany(
+            "INSERT INTO upgrades VALUES (?, ?, ?)",
+            ((profile, r["key"], int(r.get("level", 0))) for r in data.get("upgrades", [])),
+        )
+        cur.executemany(
+            "INSERT INTO inventory VALUES (?, ?, ?, ?, ?)",
+            ((profile, int(r["uid"]), r["template_key"], int(r.get("level", 1)), int(r.get("stars", 0)))
+             for r in data.get("inv", [])),
+        )
+        claimed = data.get("achievements_claimed", {}) or {}
+        seen = data.get("achievements_seen", {}) or {}
+        cur.executemany(
+            "INSERT INTO achievements VALUES (?, ?, ?, ?)",
+            ((profile, k, int(bool(claimed.get(k))), int(bool(seen.get(k)))) for k in set(claimed) | set(seen)),
+        )
+        b = data.get("bounties_v2", {}) or {}
+        for period in ("daily", "weekly"):
+            cur.execute(
+                "INSERT INTO bounty_periods VALUES (?, ?, ?, ?)",
+                (profile, period, int(b.get(f"{period}_reset_at", 0)), json.dumps(list(b.get(f"{period}_keys", [])))),
+            )
+            cur.executemany(
+                "INSERT INTO bounties VALUES (?, ?, ?, ?)",
+                ((profile, period, k, int(bool(v))) for k, v in (b.get(f"{period}_claimed", {}) or {}).items()),
+            )
+
+    def update_currencies(self, profile: str, values: SaveDict) -> bool:
+        """Hot path: rewrite only the currency columns (and playtime) of one profile.
+
+        values holds CURRENCIES plus playtime (currency_values). False if the
+        profile has no row yet, in which case a full save() is needed.
+        """
+        with self._lock, self._con:
+            cur = self._con.execute(_UPDATE_CURRENCIES, (
+                *(values[c] for c in CURRENCIES), values.get("playtime", 0.0),
+                values.get("saved_at", time.time()), profile,
+            ))
+            return cur.rowcount > 0
+
+    def delete(self, profile: str = DEFAULT_PROFILE) -> None:
+        with self._lock, self._con:
+            self._con.execute("DELETE FROM profiles WHERE id = ?", (profile,))
+            for table in _CHILD_TABLES:
+                self._con.execute(f"DELETE FROM {table} WHERE profile = ?", (profile,))
+
+    def close(self) -> None:
+        with self._lock:
+            self._con.close()
+
+
+def open_store(backend: str, default_path: Path) -> SaveStore:
+    """"json" (default) keeps the classic save file; "sqlite" uses saves.db beside it."""
+    if backend == "sqlite":
+        return SqliteSaveStore(Path(default_path).with_name("saves.db"))
+    return JsonSaveStore(default_path)
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import itertools
+import random
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:  # optional dependency
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+SYMBOLS = ("🍒", "🍋", "7️⃣", "💎", "⭐")
+JACKPOT_SYMBOL = "💎"
+REELS = 3
+
+# Outcome classes, in the order counts are reported
+JACKPOT, TRIPLE, PAIR, NOTHING = "jackpot", "triple", "pair", "nothing"
+CLASSES = (JACKPOT, TRIPLE, PAIR, NOTHING)
+WINNING = (JACKPOT, TRIPLE, PAIR)
+
+# Base payouts per spin, before slots_yield_mult / global_income_mult
+GOLD = {JACKPOT: 0, TRIPLE: 500, PAIR: 50, NOTHING: 0}
+DIAMONDS = {JACKPOT: 10, TRIPLE: 0, PAIR: 0, NOTHING: 0}
+SHARDS = {JACKPOT: 5.0, TRIPLE: 0.5, PAIR: 0.5, NOTHING: 0.0}
+
+
+def classify(reels: Sequence[str]) -> str:
+    distinct = len(set(reels))
+    if distinct == 1:
+        return JACKPOT if reels[0] == JACKPOT_SYMBOL else TRIPLE
+    return PAIR if distinct == REELS - 1 else NOTHING
+
+
+class SlotsTable:
+    """Outcome-class probabilities of a reel table, plus faces on demand.
+
+    Only the class decides the payout, so spins are drawn as classes
+    (one multinomial for a batch). Reel faces are generated afterwards,
+    conditioned on the class, for the spins the UI actually shows.
+    """
+
+    def __init__(self, symbols: Sequence[str] = SYMBOLS, weights: Optional[Sequence[float]] = None) -> None:
+        self.symbols = tuple(symbols)
+        w = list(weights) if weights is not None else [1.0] * len(self.symbols)
+        total = float(sum(w))
+        self.weights = tuple(x / total for x in w)
+        p = dict.fromkeys(CLASSES, 0.0)
+        # exact: enumerate every reel combination once (len(symbols) ** REELS)
+        for combo in itertools.product(range(len(self.symbols)), repeat=REELS):
+            pr = 1.0
+            for i in combo:
+                pr *= self.weights[i]
+            p[classify([self.symbols[i] for i in combo])] += pr
+        self.probs = tuple(p[c] for c in CLASSES)
+
+    def class_counts(self, n: int, rng: Optional[Any] = None) -> Dict[str, int]:
+        """Outcome classes of n spins; one multinomial draw with NumPy."""
+        if np is not None:
+            rng = rng if rng is not None else np.random.default_rng()
+            counts = rng.multinomial(int(n), self.probs)
+        else:
+            drawn = (rng or random).choices(range(len(CLASSES)), weights=self.probs, k=int(n))
+            counts = [0] * len(CLASSES)
+            for i in drawn:
+                counts[i] += 1
+        return {c: int(k) for c, k in zip(CLASSES, counts)}
+
+    def spin(self, rng: Optional[random.Random] = None) -> Tuple[List[str], str]:
+        """One spin with its faces, for a single animated spin."""
+        reels = (rng or random).choices(self.symbols, weights=self.weights, k=REELS)
+        return reels, classify(reels)
+
+    def faces(self, cls: str, rng: Optional[random.Random] = None) -> List[str]:
+        """Reels for one spin of the given class, with the table's symbol odds."""
+        r = rng or random
+        if cls == JACKPOT:
+            return [JACKPOT_SYMBOL] * REELS
+        while True:  # rejection on the class; the rarest non-jackpot class is 4/125 for the stock table
+            reels = r.choices(self.symbols, weights=self.weights, k=REELS)
+            if classify(reels) == cls:
+                return reels
+
+    def sample_classes(self, counts: Dict[str, int], k: int, rng: Optional[random.Random] = None) -> List[str]:
+        """k spins picked without replacement from a batch's class counts (for animation)."""
+        k = min(int(k), sum(counts.values()))
+        if k <= 0:
+            return []
+        return (rng or random).sample(list(CLASSES), k, counts=[counts[c] for c in CLASSES])
+
+
+TABLE = SlotsTable()
+
+
+def payout(game, cls: str) -> Tuple[int, int]:
+    """Gold and diamonds of one spin of class cls, rounded as a single spin is."""
+    gold = GOLD[cls]
+    if gold > 0:
+        gold = int(round(gold * game.slots_yield_mult))
+    return int(round(gold * game.global_income_mult)), DIAMONDS[cls]
+
+
+def spin_slots_many(game, n: int, animate: int = 0, rng: Optional[Any] = None,
+                    table: SlotsTable = TABLE) -> Dict[str, Any]:
+    """n slot spins at once, equivalent to n single spins.
+
+    Class counts come from one multinomial draw. Each class pays the same
+    per spin, so gold, diamonds, shards and the win/spin counters are
+    applied once as count x payout. Reel faces are built only for `animate` spins drawn
+    from the batch ("reels": list of (faces, class)).
+    """
+    n = max(0, int(n))
+    counts = table.class_counts(n, rng)
+    gold = diamonds = 0
+    shards = 0.0
+    for cls, k in counts.items():
+        if k:
+            g, d = payout(game, cls)
+            gold += g * k
+            diamonds += d * k
+            shards += SHARDS[cls] * k
+    game._credit_gold(gold)
+    game.diamonds += diamonds
+    game.shards += shards
+    game.counter_slots_spins += n
+    game.counter_slots_wins += sum(counts[c] for c in WINNING)
+    shown = table.sample_classes(counts, animate)
+    return {
+        "spins": n,
+        "counts": counts,
+        "gold": gold,
+        "diamonds": diamonds,
+        "shards": shards,
+        "reels": [(table.faces(c), c) for c in shown],
+    }
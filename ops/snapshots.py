@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import calendar
+import hashlib
+import lzma
+import re
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ops.persistence import write_bytes_atomic
+from ops.save_codec import decode_save, encode_save
+
+# Snapshots are binary-codec saves, compressed, named
+#   <UTC yyyymmdd-HHMMSS>-<content hash>.<zz|xz>
+# The hash covers the save minus fields that change on every write, so an
+# unchanged game does not fill the ring with copies.
+CODECS = {
+    "zlib": ("zz", lambda b: zlib.compress(b, 6), zlib.decompress),
+    "lzma": ("xz", lambda b: lzma.compress(b, preset=6), lzma.decompress),
+}
+_BY_EXT = {ext: dec for ext, _enc, dec in CODECS.values()}
+_VOLATILE = ("header", "saved_at", "playtime")
+_NAME = re.compile(r"^(\d{8}-\d{6})-([0-9a-f]{16})\.(zz|xz)$")
+
+KEEP_RECENT = 3     # newest snapshots, whatever their age
+KEEP_HOURLY = 24    # newest per hour, for this many hours
+KEEP_DAILY = 14     # newest per day, for this many days
+
+
+@dataclass(frozen=True)
+class SnapshotInfo:
+    path: Path
+    created: float   # unix time (second resolution)
+    digest: str
+
+
+def content_digest(data: Dict[str, Any]) -> str:
+    stable = {k: v for k, v in data.items() if k not in _VOLATILE}
+    return hashlib.sha256(encode_save(stable)).hexdigest()[:16]
+
+
+def read_snapshot(path: Path) -> Dict[str, Any]:
+    path = Path(path)
+    decompress = _BY_EXT.get(path.suffix.lstrip("."))
+    if decompress is None:
+        raise ValueError(f"not a snapshot: {path.name}")
+    return decode_save(decompress(path.read_bytes()))
+
+
+class SnapshotRing:
+    """Compressed, deduplicated save snapshots with time-bucketed retention.
+
+    write() and prune() do the compression and file I/O and are meant to run
+    on the save worker (see SaveService); list() and read() are cheap.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        codec: str = "zlib",
+        keep_recent: int = KEEP_RECENT,
+        keep_hourly: int = KEEP_HOURLY,
+        keep_daily: int = KEEP_DAILY,
+    ) -> None:
+        if codec not in CODECS:
+            raise ValueError(f"unknown snapshot codec {codec!r} (expected one of {', '.join(CODECS)})")
+        self.directory = Path(directory)
+        self.codec = codec
+        self.keep_recent = int(keep_recent)
+        self.keep_hourly = int(keep_hourly)
+        self.keep_daily = int(keep_daily)
+        self._newest: Optional[SnapshotInfo] = None  # cached after the first write
+
+    def list(self) -> List[SnapshotInfo]:
+        """Snapshots in the ring, newest first."""
+        out = []
+        if self.directory.is_dir():
+            for p in self.directory.iterdir():
+                m = _NAME.match(p.name)
+                if m:
+                    created = calendar.timegm(time.strptime(m.group(1), "%Y%m%d-%H%M%S"))
+                    out.append(SnapshotInfo(p, float(created), m.group(2)))
+        out.sort(key=lambda s: (s.created, s.path.name), reverse=True)
+        return out
+
+    def latest(self) -> Optional[SnapshotInfo]:
+        snaps = self.list()
+        return snaps[0] if snaps else None
+
+    def write(self, data: Dict[str, Any], now: Optional[float] = None) -> Path:
+        """Store data unless the newest snapshot has the same content; returns its path."""
+        digest = content_digest(data)
+        newest = self._newest or self.latest()
+        if newest is not None and newest.digest == digest and newest.path.exists():
+            return newest.path
+        ext, compress, _ = CODECS[self.codec]
+        now = time.time() if now is None else now
+        path = self.directory / f"{time.strftime('%Y%m%d-%H%M%S', time.gmtime(now))}-{digest}.{ext}"
+        write_bytes_atomic(path, compress(encode_save(data)))
+        self._newest = SnapshotInfo(path, float(int(now)), digest)
+        return path
+
+    def read(self, snap: SnapshotInfo | Path) -> Dict[str, Any]:
+        return read_snapshot(snap.path if isinstance(snap, SnapshotInfo) else snap)
+
+    def prune(self, now: Optional[float] = None) -> int:
+        """Drop snapshots outside the retention buckets; returns how many were removed."""
+        now = time.time() if now is None else now
+        snaps = self.list()
+        keep = {s.path for s in snaps[:self.keep_recent]}
+        for span, count in ((3600, self.keep_hourly), (86400, self.keep_daily)):
+            oldest = int(now // span) - count + 1
+            seen = set()
+            for s in snaps:
+                bucket = int(s.created // span)
+                if bucket >= oldest and bucket not in seen:
+                    seen.add(bucket)
+                    keep.add(s.path)
+        removed = 0
+        for s in snaps:
+            if s.path not in keep:
+                try:
+                    s.path.unlink()
+                    removed += 1
+                except OSError:
+                    pass
+        return removed
@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Set, Tuple
+
+from core.upgrades import UpgradeDef
+from ops.upgrade_columns import HAVE_NUMPY, UpgradeColumns
+
+
+# Derived-stat nodes. Each node owns a slice of Game's derived fields and is
+# only recomputed when one of its inputs has been marked dirty.
+GATING = "gating"        # Upgrade.locked / Upgrade.disabled
+DICE = "dice"            # dice_count, die_sides, animation_speed
+SLOTS = "slots"          # slots_passive_income
+ROULETTE = "roulette"    # roulette_max_bet, roulette payout bonus (upgrades), roulette_passive_income
+BUILDINGS = "buildings"  # buildings_passive_income
+ECON = "econ"            # global mult, shards/scrap passive, salvage totals (upgrades)
+LOADOUT = "loadout"      # economy effects from equipped dice
+SHOP = "shop"            # permanent shop upgrades
+
+NODES: Tuple[str, ...] = (GATING, DICE, SLOTS, ROULETTE, BUILDINGS, ECON, LOADOUT, SHOP)
+# Nodes that only aggregate upgrade effects (served by UpgradeColumns when enabled)
+UPGRADE_NODES = frozenset((DICE, SLOTS, ROULETTE, BUILDINGS, ECON))
+
+
+def upgrade_nodes(d: UpgradeDef) -> Tuple[str, ...]:
+    """Nodes whose value depends on the level of an upgrade with this definition."""
+    nodes = [GATING]
+    if d.dice_gain or d.die_sides_increase or d.animation_speed_mult != 1.0:
+        nodes.append(DICE)
+    if d.slots_passive:
+        nodes.append(SLOTS)
+    if d.roulette_maxbet_increase or d.roulette_payout_bonus or d.roulette_passive:
+        nodes.append(ROULETTE)
+    if d.milestone_key or (d.category == "buildings" and d.building_gold_ps > 0):
+        nodes.append(BUILDINGS)
+    if (d.global_gold_mult != 1.0 or d.shards_passive or d.scrap_passive
+            or d.salvage_yield_mult or d.salvage_cost_discount):
+        nodes.append(ECON)
+    return tuple(nodes)
+
+
+class StatsEngine:
+    """Incremental replacement for a full stats rebuild.
+
+    Callers mark inputs dirty (an upgrade level, the loadout, shop levels) and
+    call refresh(); only the affected nodes are recomputed and the combined
+    fields are then published back onto the Game.
+    """
+
+    def __init__(self, game) -> None:
+        self.game = game
+        self._dirty: Set[str] = set(NODES)
+        # upgrades whose gates need re-evaluation; None means all of them
+        self._gate_keys: Optional[Set[str]] = None
+        self._nodes_by_key: Dict[str, Tuple[str, ...]] = {}
+        self._members: Dict[str, List] = {n: [] for n in NODES}
+        for u in game.registry:
+            nodes = upgrade_nodes(u.definition)
+            self._nodes_by_key[u.key] = nodes
+            for n in nodes:
+                self._members[n].append(u)
+
+        # optional NumPy column store, see use_columns()
+        self.columns: Optional[UpgradeColumns] = None
+
+        # partial results combined in _publish()
+        self._upg_global_mult = 1.0
+        self._upg_roulette_bonus = 0.0
+        self._upg_salvage_yield = 1.0
+        self._shop_gold_mult = 1.0
+        self._shop_shard_mult = 1.0
+        self._shop_salvage_mult = 1.0
+        self._dice_shards_mult = 1.0
+
+    def use_columns(self, enabled: bool = True) -> bool:
+        """Aggregate upgrade effects with the NumPy column store (large catalogs).
+
+        Returns whether the column store is active; stays off without numpy.
+        """
+        self.columns = UpgradeColumns(list(self.game.registry)) if (enabled and HAVE_NUMPY) else None
+        self._dirty.update(UPGRADE_NODES)
+        return self.columns is not None
+
+    # ---------- invalidation ----------
+    def mark_all(self) -> None:
+        self._dirty.update(NODES)
+        self._gate_keys = None
+        if self.columns is not None:
+            self.columns.sync()
+
+    def mark_upgrade(self, u) -> None:
+        self._dirty.update(self._nodes_by_key.get(u.key, NODES))
+        if self._gate_keys is not None:
+            self._gate_keys.add(u.key)
+        if self.columns is not None:
+            self.columns.set_level(u)
+
+    def mark_loadout(self) -> None:
+        self._dirty.add(LOADOUT)
+
+    def mark_shop(self) -> None:
+        self._dirty.add(SHOP)
+
+    @property
+    def dirty(self) -> bool:
+        return bool(self._dirty)
+
+    # ---------- evaluation ----------
+    def refresh_gates(self) -> None:
+        """Bring only locked/disabled flags up to date (cheap; used inside Game.batch())."""
+        if GATING in self._dirty:
+            self._dirty.discard(GATING)
+            self.game.registry.refresh_gates(self._gate_keys)
+            self._gate_keys = set()
+
+    def refresh(self) -> None:
+        if not self._dirty:
+            return
+        dirty, self._dirty = self._dirty, set()
+        if GATING in dirty:
+            self.game.registry.refresh_gates(self._gate_keys)
+            self._gate_keys = set()
+        if self.columns is not None:
+            if not UPGRADE_NODES.isdisjoint(dirty):
+                self._compute_from_columns()
+        else:
+            if DICE in dirty:
+                self._compute_dice()
+            if SLOTS in dirty:
+                self._compute_slots()
+            if ROULETTE in dirty:
+                self._compute_roulette()
+            if BUILDINGS in dirty:
+                self._compute_buildings()
+            if ECON in dirty:
+                self._compute_econ()
+        if LOADOUT in dirty:
+            self._compute_loadout()
+        if SHOP in dirty:
+            self._compute_shop()
+        self._publish()
+
+    def _compute_dice(self) -> None:
+        g = self.game
+        ups = self._members[DICE]
+        g.dice_count = g.base_dice + sum(u.level * u.dice_gain for u in ups)
+        g.die_sides = 6 + sum(u.level * u.die_sides_increase for u in ups)
+        speed = 1.0
+        for u in ups:
+            if u.level > 0 and u.animation_speed_mult != 1.0:
+                speed *= (u.animation_speed_mult ** u.level)
+        g.animation_speed = speed
+
+    def _compute_slots(self) -> None:
+        self.game.slots_passive_income = sum(u.level * u.slots_passive for u in self._members[SLOTS])
+
+    def _compute_roulette(self) -> None:
+        g = self.game
+        ups = self._members[ROULETTE]
+        g.roulette_max_bet = g.roulette_base_max_bet + sum(u.level * u.roulette_maxbet_increase for u in ups)
+        self._upg_roulette_bonus = sum(u.level * u.roulette_payout_bonus for u in ups)
+        g.roulette_passive_income = sum(u.level * u.roulette_passive for u in ups)
+
+    def _compute_buildings(self) -> None:
+        # Milestone upgrades increase per-unit output of their base building
+        ups = self._members[BUILDINGS]
+        per_unit_bonus: Dict[str, float] = {}
+        for u in ups:
+            m_key = u.milestone_key
+            if m_key:
+                per_unit_bonus[m_key] = per_unit_bonus.get(m_key, 0.0) + (u.level * u.building_gold_ps)
+        total = 0.0
+        for u in ups:
+            if u.category != "buildings" or u.milestone_key or u.building_gold_ps <= 0:
+                continue
+            unit = u.building_gold_ps + per_unit_bonus.get(u.key, 0.0)
+            total += u.level * unit
+        self.game.buildings_passive_income = total
+
+    def _compute_econ(self) -> None:
+        g = self.game
+        global_mult = 1.0
+        shards = 0.0
+        scrap = 0.0
+        salvage_yield = 1.0
+        salvage_discount = 0.0
+        for u in self._members[ECON]:
+            if u.level <= 0:
+                continue
+            if u.global_gold_mult != 1.0:
+                global_mult *= (u.global_gold_mult ** u.level)
+            if u.shards_passive > 0.0:
+                shards += u.level * u.shards_passive
+            if u.scrap_passive > 0.0:
+                scrap += u.level * u.scrap_passive
+            if u.salvage_yield_mult > 0.0:
+                salvage_yield *= (1.0 + u.salvage_yield_mult) ** u.level
+            if u.salvage_cost_discount > 0.0:
+                salvage_discount += u.level * u.salvage_cost_discount
+        self._upg_global_mult = global_mult
+        self._upg_salvage_yield = salvage_yield
+        g.shards_passive_income = shards
+        g.scrap_idle = scrap
+        # Cap discount to avoid free salvage
+        g.salvage_cost_discount_total = min(salvage_discount, 0.95)
+
+    def _compute_from_columns(self) -> None:
+        g = self.game
+        agg = self.columns.aggregate()
+        g.dice_count = g.base_dice + agg["dice_gain"]
+        g.die_sides = 6 + agg["die_sides_increase"]
+        g.animation_speed = agg["animation_speed_mult"]
+        g.slots_passive_income = agg["slots_passive"]
+        g.roulette_max_bet = g.roulette_base_max_bet + agg["roulette_maxbet_increase"]
+        self._upg_roulette_bonus = agg["roulette_payout_bonus"]
+        g.roulette_passive_income = agg["roulette_passive"]
+        g.buildings_passive_income = agg["building_gold_ps"]
+        self._upg_global_mult = agg["global_gold_mult"]
+        self._upg_salvage_yield = agg["salvage_yield_mult"]
+        g.shards_passive_income = agg["shards_passive"]
+        g.scrap_idle = agg["scrap_passive"]
+        # Cap discount to avoid free salvage
+        g.salvage_cost_discount_total = min(agg["salvage_cost_discount"], 0.95)
+
+    def _compute_loadout(self) -> None:
+        g = self.game
+        gold_mult = 1.0
+        idle = 0.0
+        slots_mult = 1.0
+        roulette_bonus = 0.0
+        shards_mult = 1.0
+        for t in g.get_loadout_templates():
+            gold_mult *= (1.0 + (t.gold_mult_pct or 0.0) / 100.0)
+            idle += (t.idle_gold_ps or 0.0)
+            slots_mult *= (1.0 + (t.slots_mult_pct or 0.0) / 100.0)
+            roulette_bonus += (t.roulette_mult_pct or 0.0) / 100.0
+            shards_mult *= (1.0 + (t.shard_rate_mult_pct or 0.0) / 100.0)
+        g.team_gold_mult_from_dice = gold_mult
+        g.dice_idle_income = idle
+        g.slots_yield_mult = slots_mult
+        g.team_roulette_bonus_from_dice = roulette_bonus
+        self._dice_shards_mult = shards_mult
+
+    def _compute_shop(self) -> None:
+        self._shop_gold_mult = 1.0
+        self._shop_shard_mult = 1.0
+        self._shop_salvage_mult = 1.0
+        try:
+            levels = self.game.shop_levels
+            lvl_gold = int(levels.get('perm_gold_booster', 0))
+            if lvl_gold > 0:
+                self._shop_gold_mult = 1.0 + 0.05 * lvl_gold
+            lvl_shard = int(levels.get('perm_shard_rate', 0))
+            if lvl_shard > 0:
+                self._shop_shard_mult = 1.0 + 0.10 * lvl_shard
+            lvl_salv = int(levels.get('perm_salvage_yield', 0))
+            if lvl_salv > 0:
+                self._shop_salvage_mult = 1.0 + 0.10 * lvl_salv
+        except Exception:
+            pass
+
+    def _publish(self) -> None:
+        g = self.game
+        g.global_income_mult = self._upg_global_mult * g.team_gold_mult_from_dice * self._shop_gold_mult
+        g.roulette_payout_bonus_total = self._upg_roulette_bonus + g.team_roulette_bonus_from_dice
+        g.shards_rate_mult = self._dice_shards_mult * self._shop_shard_mult
+        g.salvage_yield_mult_total = self._upg_salvage_yield * self._shop_salvage_mult
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import heapq
+from typing import Callable, Dict, Hashable, List, Tuple
+
+# (reached, event): reached is False when a metric drops back below a threshold
+Crossing = Tuple[bool, Hashable]
+
+
+class ThresholdWatcher:
+    """Per-metric crossing detector for unlocks, achievements and bounties.
+
+    Each metric keeps a min-heap of pending thresholds above its last value and
+    a max-heap of thresholds already reached. update() only compares the new
+    value against the two heap heads, so it is O(1) unless something is
+    crossed, however many thresholds are registered.
+    """
+
+    def __init__(self) -> None:
+        self._pending: Dict[str, List[Tuple[float, int, Hashable]]] = {}
+        self._reached: Dict[str, List[Tuple[float, int, Hashable]]] = {}
+        self._seq = 0
+
+    def add(self, metric: str, threshold: float, event: Hashable) -> None:
+        """Register a threshold; it fires on the next update() that reaches it."""
+        self._seq += 1
+        heapq.heappush(self._pending.setdefault(metric, []), (float(threshold), self._seq, event))
+        self._reached.setdefault(metric, [])
+
+    def remove(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Drop every threshold whose event matches predicate (rebuilds the heaps)."""
+        for heaps in (self._pending, self._reached):
+            for metric, heap in heaps.items():
+                kept = [item for item in heap if not predicate(item[2])]
+                if len(kept) != len(heap):
+                    heapq.heapify(kept)
+                    heaps[metric] = kept
+
+    def metrics(self) -> List[str]:
+        return list(self._pending.keys())
+
+    def __contains__(self, metric: str) -> bool:
+        return metric in self._pending
+
+    def update(self, metric: str, value: float) -> List[Crossing]:
+        pending = self._pending.get(metric)
+        if pending is None:
+            return []
+        reached = self._reached[metric]
+        out: List[Crossing] = []
+        while pending and pending[0][0] <= value:
+            t, seq, event = heapq.heappop(pending)
+            heapq.heappush(reached, (-t, seq, event))
+            out.append((True, event))
+        # metrics such as scrap or gold can fall again; re-arm what was lost
+        while reached and -reached[0][0] > value:
+            neg_t, seq, event = heapq.heappop(reached)
+            heapq.heappush(pending, (-neg_t, seq, event))
+            out.append((False, event))
+        return out
+
+
+class Watched:
+    """Instance attribute that reports each assignment to owner._feed(name, value).
+
+    The value lives in the instance __dict__ under the attribute's own name.
+    Nothing is reported until the owner sets `_watching`, so plain assignments
+    during __init__ and loading stay silent until the watcher is armed.
+    """
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.name = name
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        try:
+            return obj.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
+
+    def __set__(self, obj, value) -> None:
+        d = obj.__dict__
+        d[self.name] = value
+        if d.get("_watching"):
+            obj._feed(self.name, value)
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import math
+from typing import Dict, List
+
+try:  # optional dependency
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+HAVE_NUMPY = np is not None
+
+# Additive effects: total = levels . column
+INT_EFFECTS = ("dice_gain", "die_sides_increase", "roulette_maxbet_increase")
+FLOAT_EFFECTS = (
+    "slots_passive", "roulette_payout_bonus", "roulette_passive",
+    "shards_passive", "scrap_passive", "salvage_cost_discount",
+)
+# Multiplicative effects: product = exp(levels . log(factor))
+LOG_EFFECTS = ("animation_speed_mult", "global_gold_mult", "salvage_yield_mult")
+
+
+def _log_factor(d, name: str) -> float:
+    v = getattr(d, name)
+    if name == "salvage_yield_mult":
+        # stored as +% per level; only positive yields count
+        return math.log1p(v) if v > 0.0 else 0.0
+    return math.log(v) if v > 0.0 and v != 1.0 else 0.0
+
+
+class UpgradeColumns:
+    """NumPy column store of upgrade effects (upgrades x effects) plus a levels vector.
+
+    aggregate() returns the same upgrade-derived totals as the StatsEngine
+    loops, computed as dot products (additive) and a log-sum (multiplicative).
+    """
+
+    def __init__(self, upgrades: List) -> None:
+        if np is None:
+            raise RuntimeError("UpgradeColumns requires numpy")
+        self._upgrades = list(upgrades)
+        self._index: Dict[str, int] = {u.key: i for i, u in enumerate(self._upgrades)}
+        defs = [u.definition for u in self._upgrades]
+        self.levels = np.zeros(len(defs), dtype=np.int64)
+
+        self.int_effects = np.array([[getattr(d, f) for f in INT_EFFECTS] for d in defs], dtype=np.int64).reshape(len(defs), len(INT_EFFECTS))
+        # Passive/discount totals only count positive per-level values (matches the loops)
+        floats = np.array([[getattr(d, f) for f in FLOAT_EFFECTS] for d in defs], dtype=np.float64).reshape(len(defs), len(FLOAT_EFFECTS))
+        for j, f in enumerate(FLOAT_EFFECTS):
+            if f in ("shards_passive", "scrap_passive", "salvage_cost_discount"):
+                floats[:, j] = np.where(floats[:, j] > 0.0, floats[:, j], 0.0)
+        self.float_effects = floats
+        self.log_effects = np.array([[_log_factor(d, f) for f in LOG_EFFECTS] for d in defs], dtype=np.float64).reshape(len(defs), len(LOG_EFFECTS))
+
+        # Buildings: base buildings earn level * (gold_ps + sum of their milestone bonuses)
+        base_gps = np.zeros(len(defs), dtype=np.float64)
+        for i, d in enumerate(defs):
+            if d.category == "buildings" and not d.milestone_key and d.building_gold_ps > 0:
+                base_gps[i] = d.building_gold_ps
+        self.base_gps = base_gps
+        ms_idx, ms_base, ms_gps = [], [], []
+        for i, d in enumerate(defs):
+            b = self._index.get(d.milestone_key) if d.milestone_key else None
+            if b is not None and base_gps[b] > 0:
+                ms_idx.append(i); ms_base.append(b); ms_gps.append(d.building_gold_ps)
+        self.ms_idx = np.array(ms_idx, dtype=np.int64)
+        self.ms_base = np.array(ms_base, dtype=np.int64)
+        self.ms_gps = np.array(ms_gps, dtype=np.float64)
+        self.sync()
+
+    # ---------- levels ----------
+    def sync(self) -> None:
+        """Reload the whole levels vector (after load/reset or direct edits)."""
+        self.levels[:] = [u.level for u in self._upgrades]
+
+    def set_level(self, u) -> None:
+        i = self._index.get(u.key)
+        if i is not None:
+            self.levels[i] = u.level
+
+    # ---------- aggregation ----------
+    def aggregate(self) -> Dict[str, float]:
+        lv = self.levels
+        ints = lv @ self.int_effects
+        floats = lv.astype(np.float64) @ self.float_effects
+        logs = lv.astype(np.float64) @ self.log_effects
+        buildings = float(lv @ self.base_gps)
+        if len(self.ms_idx):
+            buildings += float(np.sum(lv[self.ms_base] * lv[self.ms_idx] * self.ms_gps))
+        out: Dict[str, float] = {f: int(v) for f, v in zip(INT_EFFECTS, ints)}
+        out.update({f: float(v) for f, v in zip(FLOAT_EFFECTS, floats)})
+        out.update({f: math.exp(float(v)) for f, v in zip(LOG_EFFECTS, logs)})
+        out["building_gold_ps"] = buildings
+        return out
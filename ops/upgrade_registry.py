@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, Iterator, List, Optional
+
+
+class UpgradeRegistry:
+    """Key-indexed view over Game.upgrades.
+
+    Holds O(1) key lookup, per-category lists (catalog order) and the reverse
+    reveal/milestone graph, so a level change only re-evaluates the locks of
+    the upgrades that depend on it.
+    """
+
+    def __init__(self, upgrades: List) -> None:
+        self._upgrades = upgrades
+        self._by_key: Dict[str, object] = {}
+        self._by_category: Dict[str, List] = {}
+        self._dependents: Dict[str, List] = {}
+        for u in upgrades:
+            self._by_key[u.key] = u
+            self._by_category.setdefault(u.category, []).append(u)
+            for req_key in {u.reveal_after_key, u.milestone_key if u.milestone_level else None}:
+                if req_key:
+                    self._dependents.setdefault(req_key, []).append(u)
+
+    # ---------- lookup ----------
+    def get(self, key: str):
+        return self._by_key.get(key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._by_key
+
+    def __iter__(self) -> Iterator:
+        return iter(self._upgrades)
+
+    def __len__(self) -> int:
+        return len(self._upgrades)
+
+    def in_category(self, category: str) -> List:
+        return self._by_category.get(category, [])
+
+    def dependents(self, key: str) -> List:
+        """Upgrades whose reveal or milestone gate reads the level of `key`."""
+        return self._dependents.get(key, [])
+
+    # ---------- gating ----------
+    def is_locked(self, u) -> bool:
+        # Reveal chain
+        if u.reveal_after_key is not None:
+            req = self._by_key.get(u.reveal_after_key)
+            if not (req and req.level >= u.reveal_after_level):
+                return True
+        # Milestone gating (e.g., appears after owning N of a building)
+        if u.milestone_key and u.milestone_level:
+            base = self._by_key.get(u.milestone_key)
+            if not (base and base.level >= u.milestone_level):
+                return True
+        return False
+
+    def apply_gate(self, u) -> None:
+        u.locked = self.is_locked(u)
+        u.disabled = (u.disabled_when_reached_level is not None and u.level >= u.disabled_when_reached_level)
+
+    def refresh_gates(self, changed_keys: Optional[Iterable[str]] = None) -> None:
+        """Re-evaluate locked/disabled flags.
+
+        With no keys every upgrade is evaluated; otherwise only the changed
+        upgrades and their direct dependents.
+        """
+        if changed_keys is None:
+            for u in self._upgrades:
+                self.apply_gate(u)
+            return
+        for key in changed_keys:
+            u = self._by_key.get(key)
+            if u is not None:
+                self.apply_gate(u)
+            for dep in self._dependents.get(key, ()):
+                self.apply_gate(dep)
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Ensure project root on sys.path when running as a script from scripts/
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is required by this script only
+    sys.exit("analyze_saves.py needs numpy (pip install numpy)")
+
+# Only the static catalogs are imported: workers never build a Game.
+from core.dice_models import get_templates
+from core.upgrades import UPGRADES
+from ops.journal import journal_path_for, replay as journal_replay
+from ops.persistence import SAVE_SUFFIXES, is_save_data, read_save
+
+RARITIES = ("Common", "Uncommon", "Rare", "Legendary")
+SCALARS = ("version", "saved_at", "gold", "lifetime_gold", "diamonds", "shards", "playtime")
+UPGRADE_KEYS = tuple(u.key for u in UPGRADES)
+
+_RARITY_COL = {r: i for i, r in enumerate(RARITIES)}
+_TEMPLATE_RARITY = {k: _RARITY_COL.get(t.rarity) for k, t in get_templates().items()}
+_UPGRADE_COL = {k: i for i, k in enumerate(UPGRADE_KEYS)}
+
+
+def find_saves(root: Path) -> List[Path]:
+    return sorted(p for p in root.rglob("*") if p.suffix in SAVE_SUFFIXES and p.is_file())
+
+
+def _keyed(rows: List[Dict[str, Any]], dtype) -> tuple[List[str], "np.ndarray"]:
+    """Per-row dicts -> (sorted key vocabulary, dense rows x keys matrix)."""
+    keys = sorted({k for r in rows for k in r})
+    col = {k: i for i, k in enumerate(keys)}
+    out = np.zeros((len(rows), len(keys)), dtype=dtype)
+    for i, r in enumerate(rows):
+        for k, v in r.items():
+            out[i, col[k]] = v
+    return keys, out
+
+
+def decode_chunk(paths: List[str]) -> Dict[str, Any]:
+    """Worker: decode a chunk of saves straight from their dicts into columns.
+
+    Sibling journals are replayed like Game.load does. Unreadable files are
+    returned in "failed" instead of aborting the chunk, and files that are
+    not saves (persistence.is_save_data) in "skipped"; neither is counted.
+    """
+    n = len(paths)
+    scalars = np.zeros((n, len(SCALARS)), dtype=np.float64)
+    levels = np.zeros((n, len(UPGRADE_KEYS)), dtype=np.int32)
+    rarity = np.zeros((n, len(RARITIES)), dtype=np.int32)
+    inv_size = np.zeros(n, dtype=np.int32)
+    crates: List[Dict[str, int]] = []
+    claims: List[Dict[str, bool]] = []
+    ok = np.ones(n, dtype=bool)
+    failed: List[str] = []
+    skipped: List[str] = []
+    nbytes = 0
+    for i, p in enumerate(paths):
+        try:
+            nbytes += os.path.getsize(p)
+            data = read_save(p)
+            if not is_save_data(data):
+                ok[i] = False
+                skipped.append(p)
+                crates.append({})
+                claims.append({})
+                continue
+            jpath = journal_path_for(Path(p))
+            if jpath.exists():
+                journal_replay(data, jpath)
+            for j, f in enumerate(SCALARS):
+                scalars[i, j] = float(data.get(f, 0) or 0)
+            for rec in data.get("upgrades", []):
+                c = _UPGRADE_COL.get(rec.get("key"))
+                if c is not None:
+                    levels[i, c] = int(rec.get("level", 0))
+            inv = data.get("inv", [])
+            inv_size[i] = len(inv)
+            for rec in inv:
+                c = _TEMPLATE_RARITY.get(rec.get("template_key"))
+                if c is not None:
+                    rarity[i, c] += 1
+            crates.append({str(k): int(v) for k, v in (data.get("crates_opened") or {}).items()})
+            claims.append({str(k): True for k, v in (data.get("achievements_claimed") or {}).items() if v})
+        except Exception as e:
+            ok[i] = False
+            failed.append(f"{p}: {e}")
+            crates.append({})
+            claims.append({})
+    crate_tiers, crate_counts = _keyed(crates, np.int32)
+    ach_keys, ach_claimed = _keyed(claims, bool)
+    return {
+        "paths": paths, "ok": ok, "failed": failed, "skipped": skipped, "bytes": nbytes,
+        "scalars": scalars, "upgrade_levels": levels, "rarity_counts": rarity,
+        "inventory_size": inv_size,
+        "crate_tiers": crate_tiers, "crates_opened": crate_counts,
+        "achievement_keys": ach_keys, "achievements_claimed": ach_claimed,
+    }
+
+
+def _merge_keyed(parts: List[Dict[str, Any]], keys_name: str, mat_name: str, dtype):
+    keys = sorted({k for p in parts for k in p[keys_name]})
+    col = {k: i for i, k in enumerate(keys)}
+    blocks = []
+    for p in parts:
+        block = np.zeros((len(p["paths"]), len(keys)), dtype=dtype)
+        if p[keys_name]:
+            block[:, [col[k] for k in p[keys_name]]] = p[mat_name]
+        blocks.append(block)
+    return np.array(keys), np.concatenate(blocks) if blocks else np.zeros((0, 0), dtype=dtype)
+
+
+def merge(parts: List[Dict[str, Any]]) -> Dict[str, "np.ndarray"]:
+    """Concatenate worker chunks into one column set, keeping only readable saves."""
+    parts = sorted(parts, key=lambda p: p["paths"][0] if p["paths"] else "")
+    ok = np.concatenate([p["ok"] for p in parts]) if parts else np.zeros(0, dtype=bool)
+    scalars = np.concatenate([p["scalars"] for p in parts]) if parts else np.zeros((0, len(SCALARS)))
+    out: Dict[str, np.ndarray] = {
+        "path": np.array([q for p in parts for q in p["paths"]]),
+        "upgrade_keys": np.array(UPGRADE_KEYS),
+        "rarity_names": np.array(RARITIES),
+    }
+    for j, f in enumerate(SCALARS):
+        out[f] = scalars[:, j]
+    for name in ("upgrade_levels", "rarity_counts", "inventory_size"):
+        out[name] = np.concatenate([p[name] for p in parts]) if parts else np.zeros(0, dtype=np.int32)
+    out["crate_tiers"], out["crates_opened"] = _merge_keyed(parts, "crate_tiers", "crates_opened", np.int32)
+    out["achievement_keys"], out["achievements_claimed"] = _merge_keyed(
+        parts, "achievement_keys", "achievements_claimed", bool)
+    for name in ("path", "upgrade_levels", "rarity_counts", "inventory_size", "crates_opened",
+                 "achievements_claimed") + SCALARS:
+        out[name] = out[name][ok]
+    return out
+
+
+def _report(cols: Dict[str, "np.ndarray"]) -> None:
+    n = len(cols["path"])
+    if not n:
+        return
+    q = (0.1, 0.5, 0.9, 0.99)
+    for f in ("gold", "lifetime_gold", "diamonds", "playtime"):
+        print(f"  {f:14s} " + "  ".join(f"p{int(x * 100)}={v:.4g}" for x, v in zip(q, np.quantile(cols[f], q))))
+    mix = cols["rarity_counts"].sum(axis=0)
+    total = max(1, int(mix.sum()))
+    print("  rarity mix     " + "  ".join(f"{r}={c / total:.1%}" for r, c in zip(RARITIES, mix)))
+    mean_lv = cols["upgrade_levels"].mean(axis=0)
+    top = np.argsort(mean_lv)[::-1][:5]
+    print("  top upgrades   " + "  ".join(f"{UPGRADE_KEYS[i]}={mean_lv[i]:.1f}" for i in top))
+    if len(cols["achievement_keys"]):
+        rate = cols["achievements_claimed"].mean(axis=0)
+        print(f"  achievements   {len(cols['achievement_keys'])} seen, median claim rate {np.median(rate):.1%}")
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Reduce a directory of saves into columnar .npz distributions")
+    ap.add_argument("root", help="directory searched recursively for .json/.bin/.sav saves")
+    ap.add_argument("--out", default="save_corpus.npz")
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("--chunk", type=int, default=64, help="saves per worker task")
+    args = ap.parse_args()
+
+    paths = [str(p) for p in find_saves(Path(args.root))]
+    if not paths:
+        sys.exit(f"no saves under {args.root}")
+    chunks = [paths[i:i + args.chunk] for i in range(0, len(paths), args.chunk)]
+    print(f"{len(paths)} files in {len(chunks)} chunks, {args.workers} workers")
+
+    parts: List[Dict[str, Any]] = []
+    done = nbytes = 0
+    t0 = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        for fut in as_completed(pool.submit(decode_chunk, c) for c in chunks):
+            part = fut.result()
+            parts.append(part)
+            done += len(part["paths"])
+            nbytes += part["bytes"]
+            dt = max(time.perf_counter() - t0, 1e-9)
+            print(f"\r  {done}/{len(paths)} files  {done / dt:8.1f} files/s  {nbytes / dt / 1e6:7.2f} MB/s",
+                  end="", file=sys.stderr, flush=True)
+    print(file=sys.stderr)
+
+    failed = [f for p in parts for f in p["failed"]]
+    skipped = [f for p in parts for f in p["skipped"]]
+    cols = merge(parts)
+    np.savez_compressed(args.out, **cols)
+    dt = time.perf_counter() - t0
+    print(f"wrote {args.out}: {len(cols['path'])} saves ({len(failed)} unreadable, "
+          f"{len(skipped)} not saves) in {dt:.2f}s")
+    for p in skipped[:10]:
+        print(f"  skipped {p} (not a save)")
+    for f in failed[:10]:
+        print(f"  unreadable {f}")
+    _report(cols)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Ensure project root on sys.path when running as a script from scripts/
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import game
+from core.dice_models import DiceInstance
+from ops.save_codec import decode_save, encode_save
+
+N_DICE = 100_000
+
+
+def make_game(n: int, seed: int = 3) -> game.Game:
+    g = game.Game()
+    rnd = random.Random(seed)
+    keys = list(g._templates.keys())
+    g.inventory = [
+        DiceInstance(uid=i + 1, template_key=rnd.choice(keys), level=rnd.randint(1, 100), stars=rnd.randint(0, 10))
+        for i in range(n)
+    ]
+    g._next_uid = n + 1
+    for u in g.upgrades:
+        u.level = rnd.randrange(0, 20)
+    g.gold = 1.5e12
+    return g
+
+
+def timed(fn, reps: int = 3):
+    best, out = float("inf"), None
+    for _ in range(reps):
+        t0 = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, out
+
+
+def main() -> None:
+    g = make_game(N_DICE)
+    data = g.to_dict()
+    print(f"synthetic save: {N_DICE} dice, {len(data['upgrades'])} upgrades")
+
+    t_enc_j, js = timed(lambda: json.dumps(data, indent=2).encode("utf-8"))
+    t_dec_j, _ = timed(lambda: json.loads(js))
+    t_enc_b, bs = timed(lambda: encode_save(data))
+    t_dec_b, back = timed(lambda: decode_save(bs))
+    assert back["inv"] == data["inv"] and back["upgrades"] == data["upgrades"]
+    print(f"json    size={len(js) / 1e6:7.2f} MB  encode={t_enc_j * 1e3:7.1f} ms  decode={t_dec_j * 1e3:7.1f} ms")
+    print(f"binary  size={len(bs) / 1e6:7.2f} MB  encode={t_enc_b * 1e3:7.1f} ms  decode={t_dec_b * 1e3:7.1f} ms")
+
+    # End to end through Game.save / Game.load (includes to_dict/from_dict)
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in ("save.json", "save.bin"):
+            path = Path(tmp) / name
+            t_save, _ = timed(lambda: g.save(path))
+            g2 = game.Game()
+            t_load, _ = timed(lambda: g2.load(path), reps=1)
+            assert len(g2.inventory) == N_DICE
+            print(f"Game    {name:9s} save={t_save * 1e3:7.1f} ms  load={t_load * 1e3:7.1f} ms  "
+                  f"file={path.stat().st_size / 1e6:7.2f} MB")
+
+
+if __name__ == "__main__":
+    main()
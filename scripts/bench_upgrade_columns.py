@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import random
+import sys
+import time
+from dataclasses import replace
+from pathlib import Path
+
+# Ensure project root on sys.path when running as a script from scripts/
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import game
+from core.upgrades import UPGRADES
+from ops.stats_engine import StatsEngine
+from ops.upgrade_columns import HAVE_NUMPY
+from ops.upgrade_registry import UpgradeRegistry
+
+FIELDS = (
+    "dice_count", "die_sides", "animation_speed", "slots_passive_income",
+    "roulette_max_bet", "roulette_payout_bonus_total", "roulette_passive_income",
+    "buildings_passive_income", "global_income_mult", "shards_passive_income",
+    "scrap_idle", "salvage_yield_mult_total", "salvage_cost_discount_total",
+)
+
+
+def synthetic_catalog(size: int):
+    """Stock catalog repeated with suffixed keys (gates rewired per copy)."""
+    out = []
+    copy = 0
+    while len(out) < size:
+        sfx = "" if copy == 0 else f"_{copy}"
+        for d in UPGRADES:
+            out.append(replace(
+                d,
+                key=d.key + sfx,
+                reveal_after_key=(d.reveal_after_key + sfx) if d.reveal_after_key else None,
+                milestone_key=(d.milestone_key + sfx) if d.milestone_key else None,
+            ))
+        copy += 1
+    return out[:size]
+
+
+def make_game(size: int, seed: int = 7) -> game.Game:
+    g = game.Game()
+    g.upgrades = [game.Upgrade(d) for d in synthetic_catalog(size)]
+    rnd = random.Random(seed)
+    for u in g.upgrades:
+        u.level = rnd.randrange(0, min(u.max_level, 40) + 1)
+    g.registry = UpgradeRegistry(g.upgrades)
+    g._stats = StatsEngine(g)
+    return g
+
+
+def time_aggregate(g: game.Game, reps: int) -> float:
+    """Upgrade-effect aggregation only (no gating, loadout or level sync)."""
+    eng = g._stats
+    t0 = time.perf_counter()
+    for _ in range(reps):
+        if eng.columns is not None:
+            eng._compute_from_columns()
+        else:
+            eng._compute_dice(); eng._compute_slots(); eng._compute_roulette()
+            eng._compute_buildings(); eng._compute_econ()
+    return (time.perf_counter() - t0) / reps
+
+
+def main() -> None:
+    if not HAVE_NUMPY:
+        print("numpy not installed; column store unavailable")
+        return
+    for size, reps in ((30, 2000), (3000, 50)):
+        g = make_game(size)
+        g._stats.use_columns(False)
+        g._recompute_stats()
+        loops = time_aggregate(g, reps)
+        ref = {f: getattr(g, f) for f in FIELDS}
+        g._stats.use_columns(True)
+        g._recompute_stats()
+        cols = time_aggregate(g, reps)
+        got = {f: getattr(g, f) for f in FIELDS}
+        ok = all(abs(ref[f] - got[f]) <= 1e-9 * max(1.0, abs(ref[f])) for f in FIELDS)
+        print(f"upgrades={size:5d}  loops={loops * 1e6:9.1f} us  columns={cols * 1e6:9.1f} us  "
+              f"speedup={loops / cols:5.2f}x  match={ok}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import List, Tuple
+
+# Ensure project root on sys.path when running as a script from scripts/
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from ops.migrations import CURRENT, MIGRATED, SAVE_VERSION, migrate_file
+from ops.persistence import SAVE_SUFFIXES
+
+
+def migrate_chunk(paths: List[str]) -> Tuple[int, int, List[str], List[str]]:
+    """Worker: (rewritten, already current, skipped non-saves, failures) for a chunk of files."""
+    rewritten = current = 0
+    skipped: List[str] = []
+    failed: List[str] = []
+    for p in paths:
+        try:
+            status = migrate_file(Path(p))
+        except Exception as e:
+            failed.append(f"{p}: {e}")
+            continue
+        if status == MIGRATED:
+            rewritten += 1
+        elif status == CURRENT:
+            current += 1
+        else:
+            skipped.append(p)
+    return rewritten, current, skipped, failed
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=f"Upgrade every save under a directory to version {SAVE_VERSION}")
+    ap.add_argument("root", help="directory searched recursively for .json/.bin/.sav saves")
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("--chunk", type=int, default=64, help="saves per worker task")
+    args = ap.parse_args()
+
+    paths = sorted(str(p) for p in Path(args.root).rglob("*") if p.suffix in SAVE_SUFFIXES and p.is_file())
+    if not paths:
+        sys.exit(f"no saves under {args.root}")
+    chunks = [paths[i:i + args.chunk] for i in range(0, len(paths), args.chunk)]
+
+    rewritten = current = done = 0
+    skipped: List[str] = []
+    failed: List[str] = []
+    t0 = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = {pool.submit(migrate_chunk, c): len(c) for c in chunks}
+        for fut in as_completed(futures):
+            r, c, s, f = fut.result()
+            rewritten += r; current += c; skipped += s; failed += f
+            done += futures[fut]
+            dt = max(time.perf_counter() - t0, 1e-9)
+            print(f"\r  {done}/{len(paths)} files  {done / dt:8.1f} files/s", end="", file=sys.stderr, flush=True)
+    print(file=sys.stderr)
+
+    print(f"{rewritten} migrated to v{SAVE_VERSION}, {current} already current, {len(skipped)} not saves, "
+          f"{len(failed)} failed in {time.perf_counter() - t0:.2f}s")
+    for p in skipped[:10]:
+        print(f"  skipped {p} (not a save, left untouched)")
+    for f in failed[:10]:
+        print(f"  failed {f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -32,6 +32,31 @@ def main() -> None:
     assert "requires" not in (k.lower() for k in bar_card.keys()), "No requires field expected"
     print("unlock_check_ok", True)
 
+    # Bulk purchase: buy_max stops at the level cap / gold limit in one step
+    qty = next(u for u in g.upgrades if u.key == "dice_qty_1")
+    g.gold = 10**12
+    bought = g.buy_max(qty)
+    print("buy_max_ok", bought == 50 and qty.disabled and g.dice_count == 51)
+
+    # buy_n charges exactly what the same levels cost bought one at a time
+    bulk, single = game.Game(), game.Game()
+    k_bulk = next(u for u in bulk.upgrades if u.key == "b_kiosk")
+    k_single = next(u for u in single.upgrades if u.key == "b_kiosk")
+    bulk.gold = single.gold = 10**9
+    bulk.buy_n(k_bulk, 50)
+    for _ in range(50):
+        single.buy(k_single)
+    # the gold 10 single purchases spend affords exactly 10 levels in bulk
+    ten = game.Game()
+    k_ten = next(u for u in ten.upgrades if u.key == "b_kiosk")
+    ten.gold = 10**9
+    for _ in range(10):
+        ten.buy(k_ten)
+    k_ten.level = 0
+    spent = 10**9 - ten.gold
+    print("buy_n_ok", bulk.gold == single.gold and k_bulk.level == k_single.level == 50
+          and k_ten.max_affordable(spent, 10) == 10 and k_ten.max_affordable(spent - 1, 10) == 9)
+
     # Bounties & Achievements counts
     print("bounties", len(g.list_bounties()))
     print("achievements", len(g.list_achievements()))
@@ -41,6 +66,11 @@ def main() -> None:
     _, slot_gold, slot_diam = g.spin_slots()
     print("casino_ok", gained >= 0 and slot_gold >= 0)
 
+    # Binary codec v1 file (written before the summary header and playtime) still loads
+    g3 = game.Game()
+    ok = g3.load(ROOT / "scripts" / "fixtures" / "save_v1.idsb")
+    print("codec_v1_ok", ok and g3.diamonds == 42 and g3.counter_dice_plays == 99 and len(g3.inventory) == 3)
+
     # Persistence round-trip (in-memory)
     d = g.to_dict()
     g2 = game.Game()
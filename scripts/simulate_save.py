@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Ensure project root on sys.path when running as a script from scripts/
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import game
+from ops.persistence import read_save
+from ops.save_store import DEFAULT_PROFILE, SqliteSaveStore
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Project a save forward with Game.simulate()")
+    ap.add_argument("save", nargs="?", default=str(game.SAVE_PATH),
+                    help="JSON or binary save, or a SQLite saves.db (see --profile)")
+    ap.add_argument("--profile", default=DEFAULT_PROFILE, help="profile to read from a .db store")
+    ap.add_argument("--hours", type=float, nargs="+", default=[1, 10, 100])
+    ap.add_argument("--policy", choices=("greedy", "cheapest"), default="greedy")
+    args = ap.parse_args()
+
+    path = Path(args.save)
+    if not path.exists():
+        data = None
+    elif path.suffix == ".db":
+        data = SqliteSaveStore(path).load(args.profile)
+        if data is None:
+            sys.exit(f"no profile {args.profile!r} in {path}")
+    else:
+        data = read_save(path)
+    for hours in args.hours:
+        g = game.Game()
+        if data is not None:
+            g.from_dict(data)
+        g._grant_starter_if_empty()
+        t0 = time.perf_counter()
+        res = g.simulate(hours * 3600.0, args.policy)
+        dt = time.perf_counter() - t0
+        print(f"{hours:7.1f}h  purchases={len(res['purchases']):5d}  gold={res['gold']:.4g}  "
+              f"gold/s={res['gold_ps']:.4g}  lifetime={g.lifetime_gold:.4g}  ({dt * 1000:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,15 @@ SETTINGS_PATH = DATA_DIR / "settings.json"
 
 DEFAULTS = {
     "use_dice_icons": True,   # controls dice roll animation visuals
+    "offline_cap_hours": 24,  # max idle time credited on load
+    "offline_efficiency": 1.0,  # fraction of passive income earned while closed
+    "save_journal": False,    # append-only journal + periodic snapshot instead of full rewrites
+    "save_backend": "json",   # "json" (data/savedata.json) or "sqlite" (data/saves.db, multi-profile)
+    "profile": "default",     # save profile id
+    "snapshot_minutes": 10,   # spacing of compressed snapshots in data/snapshots (0 = off)
+    "snapshot_codec": "zlib", # "zlib" (fast) or "lzma" (smaller)
+    "autoplay_per_tick": 100, # casino turbo: rounds played per auto-play tick
+    "autoplay_interval_ms": 250,  # casino turbo: time between auto-play ticks
 }
 
 def load_settings() -> dict:
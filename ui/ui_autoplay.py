@@ -0,0 +1,86 @@
+# ui_autoplay.py
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QWidget, QHBoxLayout, QLabel, QPushButton, QSpinBox
+
+class AutoPlayBar(QWidget):
+    """Turbo toggle for one casino game.
+
+    Every tick it runs `step(n)` once, which plays n rounds through the
+    game engine in one batch and returns (rounds played, text of one
+    representative round). The bar keeps running totals of gold, diamonds
+    and shards from the game's balances before and after each step. Its
+    timer belongs to the bar, not the visible tab, so auto-play carries on
+    while the tab or the whole play screen is hidden. A step that plays 0
+    rounds (out of gold, bet refused) stops auto-play.
+    """
+
+    def __init__(self, game, step, on_toggle=None, on_tick=None, parent=None,
+                 per_tick: int = 100, interval_ms: int = 250):
+        super().__init__(parent)
+        self.game = game
+        self.step = step
+        self.on_toggle = on_toggle
+        self.on_tick = on_tick
+
+        self.toggle_btn = QPushButton("Turbo ▶")
+        self.toggle_btn.setCheckable(True)
+        self.toggle_btn.toggled.connect(self._toggled)
+        self.per_tick = QSpinBox(); self.per_tick.setRange(1, 1_000_000)
+        self.per_tick.setValue(per_tick)
+        self.per_tick.setSingleStep(100)
+        self.totals_lbl = QLabel("")
+        self.totals_lbl.setStyleSheet("font-size:13px; color:#a8a8d8;")
+
+        row = QHBoxLayout(self)
+        row.setContentsMargins(0, 0, 0, 0)
+        row.addWidget(self.toggle_btn); row.addWidget(QLabel("per tick:")); row.addWidget(self.per_tick)
+        row.addWidget(self.totals_lbl, 1)
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(max(30, int(interval_ms)))
+        self.timer.timeout.connect(self._tick)
+        self._reset()
+
+    def _reset(self):
+        self.plays = 0
+        self.gold = 0.0
+        self.diamonds = 0
+        self.shards = 0.0
+
+    def configure(self, per_tick: int, interval_ms: int):
+        self.per_tick.setValue(max(1, int(per_tick)))
+        self.timer.setInterval(max(30, int(interval_ms)))
+
+    def running(self) -> bool:
+        return self.timer.isActive()
+
+    def stop(self):
+        self.toggle_btn.setChecked(False)
+
+    def _toggled(self, on: bool):
+        if on:
+            self._reset()
+            self.timer.start()
+            self.toggle_btn.setText("Turbo ■")
+        else:
+            self.timer.stop()
+            self.toggle_btn.setText("Turbo ▶")
+        if self.on_toggle:
+            self.on_toggle(on)
+
+    def _tick(self):
+        g = self.game
+        gold, diamonds, shards = g.gold, g.diamonds, g.shards
+        with g.batch():
+            played, shown = self.step(self.per_tick.value())
+        self.plays += played
+        self.gold += g.gold - gold
+        self.diamonds += g.diamonds - diamonds
+        self.shards += g.shards - shards
+        self.totals_lbl.setText(
+            f"{self.plays:,} plays  •  {self.gold:+,.0f} gold  •  {self.diamonds:+,} 💎  •  {self.shards:+,.1f} shards"
+        )
+        if self.on_tick:
+            self.on_tick(shown)
+        if played <= 0:
+            self.stop()
@@ -145,16 +145,12 @@ class BuildingsHub(QWidget):
         dlg.exec()
 
     def _buy_building(self, key: str, mode: str):
-        up = next((u for u in self.game.upgrades if u.key == key), None)
+        up = self.game.get_upgrade(key)
         if not up:
             return
-        times = 1 if mode == "1x" else (10 if mode == "10x" else 10**9)
-        bought = 0
-        for _ in range(times):
-            if not self.game.can_buy(up):
-                break
-            if not self.game.buy(up):
-                break
-            bought += 1
+        if mode == "MAX":
+            self.game.buy_max(up)
+        else:
+            self.game.buy_n(up, 10 if mode == "10x" else 1)
         # Refresh the panel after purchase
         self.refresh()
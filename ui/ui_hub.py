@@ -79,14 +79,14 @@ class HubMenu(QWidget):
     def refresh(self):
         # Show NEW indicator if there are unclaimed achievements
         try:
-            achs = self.mw.game.list_achievements()
-            new_count = sum(1 for a in achs if a['done'] and not a['claimed'] and not a.get('seen', False))
-            claimable_count = sum(1 for a in achs if a['done'] and not a['claimed'])
+            new_count, claimable_count = self.mw.game.achievement_badge_counts()
             label = "Achievements"
             if new_count > 0:
                 label += f" ({new_count} NEW)"
             elif claimable_count > 0:
                 label += f" ({claimable_count})"
             self.btn_achievements.setText(label)
+            ready = self.mw.game.bounties_claimable()
+            self.btn_bounties.setText(f"Bounties ({ready})" if ready else "Bounties")
         except Exception:
             pass
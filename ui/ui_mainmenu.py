@@ -6,7 +6,7 @@ from PySide6.QtWidgets import (
 )
 
 class MainMenu(QWidget):
-    def __init__(self, *, has_save: bool, on_continue, on_new_game, on_settings, on_quit, parent=None):
+    def __init__(self, *, has_save: bool, on_continue, on_new_game, on_settings, on_quit, summary: dict | None = None, parent=None):
         super().__init__(parent)
 
         self.on_continue = on_continue
@@ -25,6 +25,11 @@ class MainMenu(QWidget):
         subtitle.setAlignment(Qt.AlignCenter)
         subtitle.setStyleSheet("font-size: 16px; opacity: 0.85;")
 
+        # save header summary (read without loading the save)
+        summary_lbl = QLabel(self._summary_text(summary) if summary else "")
+        summary_lbl.setAlignment(Qt.AlignCenter)
+        summary_lbl.setStyleSheet("font-size: 13px; color: #a8a8d8;")
+
         btn_continue = QPushButton("Continue")
         btn_continue.setEnabled(has_save)
         btn_continue.clicked.connect(lambda: self.on_continue())
@@ -43,6 +48,8 @@ class MainMenu(QWidget):
         root.addWidget(title)
         root.addWidget(subtitle)
         root.addSpacing(20)
+        if summary:
+            root.addWidget(summary_lbl)
         root.addWidget(btn_continue)
         root.addWidget(btn_new)
         root.addWidget(btn_settings)
@@ -56,3 +63,10 @@ class MainMenu(QWidget):
             QPushButton:hover { background: #343879; }
             QPushButton:pressed { background: #222555; }
         """)
+
+    @staticmethod
+    def _summary_text(h: dict) -> str:
+        mins = int(h.get("playtime", 0) or 0) // 60
+        played = f"{mins // 60}h {mins % 60}m" if mins >= 60 else f"{mins}m"
+        return (f"Gold {int(h.get('gold', 0)):,}  •  Diamonds {int(h.get('diamonds', 0)):,}  •  "
+                f"{int(h.get('inventory_size', 0))} dice  •  {played} played")
@@ -1,18 +1,25 @@
 # ui_roulette.py
 import random
 from PySide6.QtCore import Qt, QTimer
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton, QHBoxLayout, QSpinBox, QRadioButton, QButtonGroup
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton, QHBoxLayout, QSpinBox, QComboBox
+from ops.roulette_ops import Bet, COLORS, POCKETS, MULTIPLIERS, stake_vector
+from ui.ui_autoplay import AutoPlayBar
 
 class RouletteTab(QWidget):
-    COLORS = {0: "green",
-              **{n: ("red" if n in {1,3,5,7,9,12,14,16,18,19,21,23,25,27,30,32,34,36} else "black")
-                 for n in range(1,37)}}
+    COLORS = dict(enumerate(COLORS))
+    # board kinds: (kind, label, range of the first number spin or None)
+    KINDS = [("red", "Red", None), ("black", "Black", None),
+             ("odd", "Odd", None), ("even", "Even", None),
+             ("low", "1-18", None), ("high", "19-36", None),
+             ("dozen", "Dozen", (1, 3)), ("column", "Column", (1, 3)),
+             ("street", "Street", (1, 12)), ("split", "Split", (0, 36)),
+             ("number", "Number", (0, 36))]
 
     def __init__(self, game, parent=None):
         super().__init__(parent)
         self.game = game
 
-        self.info = QLabel("Roulette — bet on Red/Black or a single number (0-36).")
+        self.info = QLabel("Roulette — place any mix of bets on the board, then spin.")
         self.info.setAlignment(Qt.AlignCenter)
 
         # Bet controls
@@ -23,18 +30,23 @@ class RouletteTab(QWidget):
         ctl.addWidget(QLabel("Bet:")); ctl.addWidget(self.bet_amount)
 
         # Choice controls
-        self.rb_red = QRadioButton("Red")
-        self.rb_black = QRadioButton("Black")
-        self.rb_number = QRadioButton("Number:")
+        self.kind_box = QComboBox()
+        for kind, label, _ in self.KINDS:
+            self.kind_box.addItem(f"{label} ({MULTIPLIERS[kind] - 1:g}:1)", kind)
+        self.kind_box.currentIndexChanged.connect(self._kind_changed)
         self.number_spin = QSpinBox(); self.number_spin.setRange(0,36)
-        self.rb_red.setChecked(True)
-
-        self.choice_group = QButtonGroup(self)
-        for rb in (self.rb_red, self.rb_black, self.rb_number):
-            self.choice_group.addButton(rb)
+        self.other_spin = QSpinBox(); self.other_spin.setRange(0,36)
+        self.add_btn = QPushButton("Place")
+        self.add_btn.clicked.connect(self.place_bet)
+        self.clear_btn = QPushButton("Clear")
+        self.clear_btn.clicked.connect(self.clear_bets)
 
         row2 = QHBoxLayout()
-        row2.addWidget(self.rb_red); row2.addWidget(self.rb_black); row2.addWidget(self.rb_number); row2.addWidget(self.number_spin)
+        row2.addWidget(self.kind_box); row2.addWidget(self.number_spin); row2.addWidget(self.other_spin)
+        row2.addWidget(self.add_btn); row2.addWidget(self.clear_btn)
+
+        self.board_lbl = QLabel("Board: empty — Spin bets the current selection.")
+        self.board_lbl.setWordWrap(True)
 
         self.spin_btn = QPushButton("Spin 🧭")
         self.spin_btn.clicked.connect(self.start_spin)
@@ -47,33 +59,88 @@ class RouletteTab(QWidget):
         layout.addWidget(self.info)
         layout.addLayout(ctl)
         layout.addLayout(row2)
+        layout.addWidget(self.board_lbl)
         layout.addWidget(self.spin_btn)
         layout.addWidget(self.result_lbl)
+        self.autoplay = AutoPlayBar(self.game, self._turbo_step, on_toggle=self._turbo_toggled,
+                                    on_tick=self._turbo_shown, parent=self)
+        layout.addWidget(self.autoplay)
         self.setStyleSheet("""
             QWidget { background:#0f1020; color:#e8e8ff; }
             QLabel { font-size:16px; }
-            QSpinBox, QRadioButton { font-size:16px; }
+            QSpinBox, QComboBox { font-size:16px; }
             QPushButton { background:#2a2d5c; border-radius:10px; padding:10px 16px; font-size:18px; }
             QPushButton:hover { background:#343879; }
         """)
 
         self.timer = None; self.frames = 0
+        self._result = None
+        self.bets = []
+        self._kind_changed()
 
     def refresh(self):
         # enforce max bet
         self.bet_amount.setMaximum(max(1, self.game.roulette_max_bet))
 
-    def start_spin(self):
-        bet = self.bet_amount.value()
-        if bet <= 0 or bet > self.game.roulette_max_bet:
-            self.result_lbl.setText(f"Bet must be 1–{self.game.roulette_max_bet}.")
+    def _kind_changed(self, *_):
+        kind, _, rng = self.KINDS[self.kind_box.currentIndex()]
+        self.number_spin.setVisible(rng is not None)
+        if rng is not None:
+            self.number_spin.setRange(*rng)
+        self.other_spin.setVisible(kind == "split")
+
+    def _current_bet(self) -> Bet:
+        kind = self.kind_box.currentData()
+        return Bet(kind, self.bet_amount.value(), self.number_spin.value(),
+                   self.other_spin.value() if kind == "split" else 0)
+
+    def _describe(self, bet: Bet) -> str:
+        kind, label, rng = next(k for k in self.KINDS if k[0] == bet.kind)
+        if kind == "split":
+            label += f" {bet.number}/{bet.other}"
+        elif rng is not None:
+            label += f" {bet.number}"
+        return f"{label}: {bet.amount}"
+
+    def _show_board(self):
+        if not self.bets:
+            self.board_lbl.setText("Board: empty — Spin bets the current selection.")
             return
-        if bet > self.game.gold:
-            self.result_lbl.setText("Not enough gold.")
+        total = sum(b.amount for b in self.bets)
+        self.board_lbl.setText("Board: " + " • ".join(self._describe(b) for b in self.bets) + f"  (total {total})")
+
+    def place_bet(self):
+        bet = self._current_bet()
+        try:
+            stake_vector([bet])  # only spots that exist on the board (e.g. no 5/30 split)
+        except ValueError:
+            self.result_lbl.setText("No such bet on the board.")
             return
+        total = sum(b.amount for b in self.bets) + bet.amount
+        if total > self.game.roulette_max_bet:
+            self.result_lbl.setText(f"Total bet must be 1–{self.game.roulette_max_bet}.")
+            return
+        # same spot again adds to the stake already there
+        for i, b in enumerate(self.bets):
+            if b.key == bet.key:
+                bet = Bet(b.kind, b.amount + bet.amount, b.number, b.other)
+                self.bets[i] = bet
+                break
+        else:
+            self.bets.append(bet)
+        self._show_board()
+
+    def clear_bets(self):
+        self.bets = []
+        self._show_board()
 
-        # take bet upfront
-        self.game.gold -= bet
+    def start_spin(self):
+        # the spin is settled by ops/roulette_ops up front; the animation only reveals it
+        try:
+            self._result = self.game.spin_roulette(self.bets or self._current_bet())
+        except ValueError as e:
+            self.result_lbl.setText(str(e))
+            return
         self.result_lbl.setText("Spinning...")
         self.spin_btn.setEnabled(False)
         self.frames = 0
@@ -84,42 +151,36 @@ class RouletteTab(QWidget):
 
     def _step(self):
         self.frames += 1
-        n = random.randint(0,36)
+        n = random.randrange(POCKETS)
         col = self.COLORS[n]
         self.result_lbl.setText(f"{n} ({col})")
         if self.frames >= 14:
             self.timer.stop()
-            self._resolve(n)
-
-    def _resolve(self, number: int):
-        color = self.COLORS[number]
-        bet = self.bet_amount.value()
-        payout_mult = 0.0
-
-        if self.rb_red.isChecked() and color == "red":
-            payout_mult = 2.0
-        elif self.rb_black.isChecked() and color == "black":
-            payout_mult = 2.0
-        elif self.rb_number.isChecked() and number == self.number_spin.value():
-            payout_mult = 36.0  # 35:1 plus stake
-
-        if payout_mult > 0.0:
-            # roulette payout bonus, then global income multiplier applies inside _apply_income
-            bonus = 1.0 + self.game.roulette_payout_bonus_total
-            winnings_raw = int(bet * payout_mult * bonus)
-            gained = int(round(winnings_raw * self.game.global_income_mult))
-            self.game.gold += gained
-            self.game.lifetime_gold += gained
-            # Shards proportional to winnings (with a minimum trickle)
-            shards_bonus = max(0.5, gained / 1000.0)
-            self.game.shards += shards_bonus
-            self.result_lbl.setText(f"Win! {number} ({color})  +{gained} gold  +{shards_bonus:.1f} shards")
-            try: self.game.counter_roulette_wins += 1
-            except Exception: pass
+            self._show_result()
+
+    def _show_result(self):
+        r = self._result
+        if r["win"]:
+            self.result_lbl.setText(f"Win! {r['pocket']} ({r['color']})  +{r['gained']} gold  +{r['shards']:.1f} shards")
         else:
-            self.result_lbl.setText(f"Lose. {number} ({color})")
+            self.result_lbl.setText(f"Lose. {r['pocket']} ({r['color']})")
+        self.spin_btn.setEnabled(not self.autoplay.running())
+        self.refresh()
 
-        self.spin_btn.setEnabled(True)
+    # Turbo: the board is spun n times per tick from one multinomial draw of pockets
+    def _turbo_step(self, n):
+        try:
+            res = self.game.spin_roulette_many(self.bets or [self._current_bet()], n)
+        except ValueError as e:
+            return 0, str(e)
+        counts = res["counts"]
+        # show one of this tick's pockets, picked in proportion to how often it came up
+        pocket = random.choices(range(POCKETS), weights=counts)[0]
+        return res["spins"], f"{pocket} ({self.COLORS[pocket]})"
+
+    def _turbo_shown(self, text):
+        self.result_lbl.setText(text)
         self.refresh()
-        try: self.game.counter_roulette_spins += 1
-        except Exception: pass
+
+    def _turbo_toggled(self, on):
+        self.spin_btn.setEnabled(not on and not (self.timer and self.timer.isActive()))
@@ -3,7 +3,9 @@ import random
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton
 from PySide6.QtCore import Qt, QTimer
 from ops.modes import SlotsGame
+from ops.slots_engine import JACKPOT
 from game import Game
+from ui.ui_autoplay import AutoPlayBar
 
 class SlotsTab(QWidget):
     SYMBOLS = ["🍒", "🔔", "7️⃣", "💎", "⭐"]
@@ -32,6 +34,10 @@ class SlotsTab(QWidget):
         self.spin_btn.clicked.connect(self.start_spin)
         layout.addWidget(self.spin_btn)
 
+        self.autoplay = AutoPlayBar(self.game, self._turbo_step, on_toggle=self._turbo_toggled,
+                                    on_tick=self._turbo_shown, parent=self)
+        layout.addWidget(self.autoplay)
+
         self.setStyleSheet("""
             QWidget { background: #0f1020; color: #e8e8ff; font-family: Segoe UI, Arial; }
             QLabel { font-size: 16px; }
@@ -65,18 +71,33 @@ class SlotsTab(QWidget):
 
         if self.frame_count > 10:
             self.timer.stop()
-            final_reels, gold_won, diamonds_won = self.slots_mode.play()
+            # same engine and payout rule as turbo, one spin
+            res = self.game.spin_slots_many(1, animate=1)
+            final_reels, cls = res["reels"][0]
             self.reels_lbl.setText(" ".join(final_reels))
 
-            if diamonds_won > 0:
-                shards_bonus = 5.0
-                self.game.shards += shards_bonus
-                self.result_lbl.setText(f"JACKPOT! +{diamonds_won} Diamonds and +{shards_bonus:.1f} shards")
-            elif gold_won > 0:
-                self.game.shards += 0.5
-                self.result_lbl.setText(f"Win! +{gold_won} gold and +0.5 shards")
+            if cls == JACKPOT:
+                self.result_lbl.setText(f"JACKPOT! +{res['diamonds']} Diamonds and +{res['shards']:.1f} shards")
+            elif res["gold"] > 0 or res["shards"] > 0:
+                self.result_lbl.setText(f"Win! +{res['gold']} gold and +{res['shards']:.1f} shards")
             else:
                 self.result_lbl.setText("No win, try again!")
 
             self.refresh()
-            self.spin_btn.setEnabled(True)
+            self.spin_btn.setEnabled(not self.autoplay.running())
+
+    # Turbo: n spins per tick from one class-count draw, one of them shown
+    def _turbo_step(self, n):
+        res = self.game.spin_slots_many(n, animate=1)
+        if not res["reels"]:
+            return 0, ""
+        return res["spins"], " ".join(res["reels"][0][0])
+
+    def _turbo_shown(self, reels):
+        if reels:
+            self.reels_lbl.setText(reels)
+        self.refresh()
+
+    def _turbo_toggled(self, on):
+        self.result_lbl.setText("Turbo..." if on else "")
+        self.spin_btn.setEnabled(not on and not (self.timer and self.timer.isActive()))
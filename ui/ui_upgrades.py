@@ -305,7 +305,7 @@ class UpgradesDialog(QtWidgets.QDialog):
 
     # ---------- Helpers ----------
     def _get_upgrade_by_key(self, key: str):
-        return next((u for u in self.game.upgrades if u.key == key), None)
+        return self.game.get_upgrade(key)
 
     # ---------- Buying ----------
     def _buy_item(self, cat: str, item: QtWidgets.QListWidgetItem, mode: str = "1x"):
@@ -313,7 +313,7 @@ class UpgradesDialog(QtWidgets.QDialog):
         key = item.data(QtCore.Qt.UserRole)
         up = self._get_upgrade_by_key(key)
         if not up: return
-        self._buy_loop(up, mode)
+        self._buy_qty(up, mode)
         self._sel_key_by_cat[cat] = key
         self.refresh_all()
 
@@ -338,13 +338,11 @@ class UpgradesDialog(QtWidgets.QDialog):
         mode = qty.currentText() if qty else "1x"
         self._buy_item(cat, it, mode)
 
-    def _buy_loop(self, up, mode: str):
-        times = 1 if mode == "1x" else (10 if mode == "10x" else 10**9)
-        bought = 0
-        for _ in range(times):
-            if not self.game.can_buy(up): break
-            if not self.game.buy(up): break
-            bought += 1
+    def _buy_qty(self, up, mode: str):
+        if mode == "MAX":
+            bought = self.game.buy_max(up)
+        else:
+            bought = self.game.buy_n(up, 10 if mode == "10x" else 1)
         if bought == 0:
             QtWidgets.QToolTip.showText(self.mapToGlobal(self.rect().center()),
                 "Can't buy yet (insufficient gold, disabled, or at max level).")